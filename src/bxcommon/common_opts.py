@@ -20,6 +20,7 @@ from bxcommon.models.blockchain_network_model import BlockchainNetworkModel
 from bxcommon.models.outbound_peer_model import OutboundPeerModel
 from bxcommon.models.bdn_account_model_base import BdnAccountModelBase
 from bxcommon.models.node_type import NodeType
+from bxcommon.models.transaction_eviction_policy_type import TransactionEvictionPolicyType
 
 from bxcommon import constants
 
@@ -64,11 +65,23 @@ class CommonOpts:
     dump_detailed_report_at_memory_usage: int
     dump_removed_short_ids: bool
     dump_removed_short_ids_path: str
+    transaction_service_snapshot_dir: str
     enable_buffered_send: bool
     use_extensions: bool
     import_extensions: bool
     thread_pool_parallelism_degree: int
     tx_mem_pool_bucket_size: int
+    compact_short_id_index: bool
+    binary_tx_cache_keys: bool
+    transaction_contents_slab_size: int
+    transaction_eviction_policy: TransactionEvictionPolicyType
+    removed_transactions_history_filter: bool
+    incremental_memory_stats: bool
+    block_cleanup_time_budget_ms: float
+    message_buffer_pool: bool
+    message_compression: bool
+    message_compression_min_size: int
+    tx_batch_max_delay_ms: float
     source_version: str
     ca_cert_url: str
     private_ssl_base_url: str
@@ -3,7 +3,7 @@ import time
 from abc import ABCMeta, abstractmethod
 from asyncio import Future
 from collections import defaultdict
-from typing import ClassVar, Generic, TypeVar, TYPE_CHECKING, Optional, Union, NamedTuple
+from typing import ClassVar, Generic, TypeVar, TYPE_CHECKING, List, Optional, Union, NamedTuple
 
 from bxcommon import constants
 from bxcommon.connections.connection_state import ConnectionState
@@ -25,6 +25,7 @@ from bxcommon.utils import memory_utils
 from bxcommon.utils.alarm_queue import AlarmId
 from bxcommon.utils.buffers.input_buffer import InputBuffer
 from bxcommon.utils.buffers.output_buffer import OutputBuffer
+from bxcommon.utils.buffers.output_priority import OutputPriority
 from bxcommon.utils.stats import hooks, stats_format
 from bxutils import log_messages
 from bxutils import logging
@@ -56,6 +57,9 @@ class AbstractConnection(Generic[Node]):
     __metaclass__ = ABCMeta
 
     CONNECTION_TYPE: ClassVar[ConnectionType] = ConnectionType.NONE
+    # output messages are sent in batches by `get_buffers_to_send`, connections that provide
+    # their own output through `get_bytes_to_send` disable it to send only the buffer it returns
+    SEND_OUTPUT_BUFFER_BATCHES: ClassVar[bool] = True
     node: Node
     message_factory: AbstractMessageFactory
     format_connection_desc: str
@@ -104,6 +108,8 @@ class AbstractConnection(Generic[Node]):
         self.ack_message = None
 
         self.ping_alarm_id: Optional[AlarmId] = None
+        # flushes messages held in output buffer for batching, once batch hold time is over
+        self.output_flush_alarm_id: Optional[AlarmId] = None
         self.ping_interval_s = constants.PING_INTERVAL_S
         self.pong_timeout_alarm_id: Optional[AlarmId] = None
 
@@ -222,6 +228,26 @@ class AbstractConnection(Generic[Node]):
 
         self.inputbuf.add_bytes(bytes_received)
 
+    def get_receive_buffer(self, min_size: int) -> memoryview:
+        """
+        Returns free space at the end of input buffer, for bytes to be read into directly from socket connection
+
+        :param min_size: minimum number of bytes to be able to read
+        """
+        assert self.is_alive()
+
+        return self.inputbuf.get_receive_buffer(min_size)
+
+    def advance_received_bytes(self, num_bytes: int) -> None:
+        """
+        Adds bytes read into buffer returned by `get_receive_buffer` to input buffer
+
+        :param num_bytes: number of bytes read from socket connection
+        """
+        assert self.is_alive()
+
+        self.inputbuf.advance_received_bytes(num_bytes)
+
     def get_bytes_to_send(self):
         assert self.is_alive()
 
@@ -230,6 +256,26 @@ class AbstractConnection(Generic[Node]):
     def advance_sent_bytes(self, bytes_sent):
         self.advance_bytes_on_buffer(self.outputbuf, bytes_sent)
 
+    def get_buffers_to_send(self, max_bytes: int) -> List[memoryview]:
+        """
+        Returns pending output messages, up to at least `max_bytes`, to be sent at once.
+        Connections with `SEND_OUTPUT_BUFFER_BATCHES` disabled send only the buffer returned by `get_bytes_to_send`.
+        """
+        assert self.is_alive()
+
+        if not self.SEND_OUTPUT_BUFFER_BATCHES:
+            bytes_to_send = self.get_bytes_to_send()
+            return [bytes_to_send] if bytes_to_send else []
+
+        return self.outputbuf.get_buffers(max_bytes)
+
+    def advance_sent_buffers(self, bytes_sent: int) -> None:
+        """
+        Advances output buffer after writing buffers returned by `get_buffers_to_send`.
+        Goes through `advance_sent_bytes`, so buffer accounting of subclasses is kept.
+        """
+        self.advance_sent_bytes(bytes_sent)
+
     def enqueue_msg(self, msg: AbstractMessage, prepend: bool = False):
         """
         Enqueues the contents of a Message instance, msg, to our outputbuf and attempts to send it if the underlying
@@ -239,12 +285,13 @@ class AbstractConnection(Generic[Node]):
         :param prepend: if the message should be bumped to the front of the outputbuf
         """
         self._log_message(msg.log_level(), "Enqueued message: {}", msg)
-        self.enqueue_msg_bytes(msg.rawbytes(), prepend)
+        self.enqueue_msg_bytes(msg.rawbytes(), prepend, msg.output_priority())
 
     def enqueue_msg_bytes(
         self,
         msg_bytes: Union[bytearray, memoryview],
         prepend: bool = False,
+        priority: OutputPriority = OutputPriority.NORMAL,
     ):
         """
         Enqueues the raw bytes of a message, msg_bytes, to our outputbuf and attempts to send it if the
@@ -255,6 +302,7 @@ class AbstractConnection(Generic[Node]):
 
         :param msg_bytes: message bytes
         :param prepend: if the message should be bumped to the front of the outputbuf
+        :param priority: priority lane of the outputbuf to enqueue message bytes to
         """
 
         if not self.socket_connection.alive:
@@ -262,10 +310,15 @@ class AbstractConnection(Generic[Node]):
 
         self.log_trace("Enqueued {} bytes.", len(msg_bytes))
 
+        outputbuf = self.outputbuf
         if prepend:
-            self.outputbuf.prepend_msgbytes(msg_bytes)
+            outputbuf.prepend_msgbytes(msg_bytes)
         else:
-            self.outputbuf.enqueue_msgbytes(msg_bytes)
+            outputbuf.enqueue_msgbytes(msg_bytes, priority)
+            if outputbuf.last_bytearray is not None and self.output_flush_alarm_id is None:
+                self.output_flush_alarm_id = self.node.alarm_queue.register_alarm(
+                    outputbuf.max_hold_time, self._flush_output_buffer
+                )
 
         self.socket_connection.send()
 
@@ -512,7 +565,8 @@ class AbstractConnection(Generic[Node]):
     def advance_bytes_on_buffer(self, buf, bytes_written):
         hooks.add_throughput_event(NetworkDirection.OUTBOUND, None, bytes_written, self.peer_desc, self.peer_id)
         try:
-            buf.advance_buffer(bytes_written)
+            # bytes written may span multiple messages of the buffer
+            buf.advance_buffers(bytes_written)
         except ValueError as e:
             raise RuntimeError("Connection: {}, Failed to advance buffer".format(self)) from e
 
@@ -602,6 +656,7 @@ class AbstractConnection(Generic[Node]):
         if self._close_waiter is not None:
             self._close_waiter.set_result(True)
         self._unschedule_pings()
+        self._unschedule_output_flush()
         self.node = None
         self.socket_connection = None
 
@@ -637,7 +692,7 @@ class AbstractConnection(Generic[Node]):
             "input_buffer",
             memory_utils.ObjectSize("input_buffer", 0,
                                     is_actual_size=False),
-            object_item_count=len(self.inputbuf.input_list),
+            object_item_count=1,
             object_type=memory_utils.ObjectType.BASE,
             size_type=memory_utils.SizeType.TRUE
         )
@@ -716,6 +771,23 @@ class AbstractConnection(Generic[Node]):
             self.node.alarm_queue.unregister_alarm(existing_alarm)
             self.ping_alarm_id = None
 
+    def _flush_output_buffer(self) -> float:
+        """
+        Sends messages held in output buffer for batching.
+        Called from alarm queue once hold time of the batch is over.
+        """
+        self.output_flush_alarm_id = None
+        if self.is_alive():
+            self.outputbuf.flush()
+            self.socket_connection.send()
+        return constants.CANCEL_ALARMS
+
+    def _unschedule_output_flush(self) -> None:
+        existing_alarm = self.output_flush_alarm_id
+        if existing_alarm:
+            self.node.alarm_queue.unregister_alarm(existing_alarm)
+            self.output_flush_alarm_id = None
+
     def _pong_msg_timeout(self) -> None:
         if self.is_alive():
             self.log_info(
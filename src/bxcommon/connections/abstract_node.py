@@ -5,7 +5,7 @@ from abc import ABCMeta, abstractmethod
 from asyncio import Future
 from collections import defaultdict, Counter
 from ssl import SSLContext
-from typing import List, Optional, Tuple, Dict, NamedTuple, Union, Set
+from typing import Callable, List, Optional, Tuple, Dict, NamedTuple, Union, Set
 
 import gc
 
@@ -34,6 +34,7 @@ from bxcommon.storage.serialized_message_cache import SerializedMessageCache
 from bxcommon.utils import memory_utils, convert, performance_utils
 from bxcommon.utils.alarm_queue import AlarmQueue, AlarmId
 from bxcommon.utils.blockchain_utils import bdn_tx_to_bx_tx
+from bxcommon.utils.buffers.buffer_pool import message_buffer_pool
 from bxcommon.common_opts import CommonOpts
 from bxcommon.utils.expiring_dict import ExpiringDict
 from bxcommon.utils.stats.block_statistics_service import block_stats
@@ -87,8 +88,11 @@ class AbstractNode:
 
         self.set_node_config_opts_from_sdn(opts)
         self.opts: CommonOpts = opts
+        message_buffer_pool.enabled = opts.message_buffer_pool
         self.pending_connection_requests: Set[ConnectionPeerInfo] = set()
         self.pending_connection_attempts: Set[ConnectionPeerInfo] = set()
+        # called when a connection request is queued, so the event loop can wake up to open it
+        self.connection_requests_listener: Optional[Callable[[], None]] = None
         self.recent_connections: ExpiringDict[str, int] = ExpiringDict(
             self.alarm_queue,
             constants.THROTTLE_RECONNECT_TIME_S,
@@ -113,13 +117,6 @@ class AbstractNode:
         self.init_block_stats_logging()
         self.init_tx_stats_logging()
 
-        # TODO: clean this up alongside outputbuffer holding time
-        # this is Nagle's algorithm and we need to implement it properly
-        # flush buffers regularly because of output buffer holding time
-        self.alarm_queue.register_approx_alarm(self.FLUSH_SEND_BUFFERS_INTERVAL,
-                                               constants.OUTPUT_BUFFER_BATCH_MAX_HOLD_TIME,
-                                               self.flush_all_send_buffers)
-
         self.network_num = opts.blockchain_network_num
         self.broadcast_service = self.get_broadcast_service()
 
@@ -128,6 +125,10 @@ class AbstractNode:
 
         if opts.dump_removed_short_ids:
             os.makedirs(opts.dump_removed_short_ids_path, exist_ok=True)
+        if opts.transaction_service_snapshot_dir:
+            os.makedirs(opts.transaction_service_snapshot_dir, exist_ok=True)
+        # transaction services of all networks that save snapshots, registered by the services
+        self.snapshot_tx_services: List[TransactionService] = []
 
         # each time a network has an update regarding txs, blocks, etc. register in a dict,
         # this way can verify if node lost connection to requested relay.
@@ -385,6 +386,39 @@ class AbstractNode:
         conn.add_received_bytes(bytes_received)
         conn.process_message()
 
+    def get_receive_buffer(self, file_no: int, min_size: int) -> Optional[memoryview]:
+        """
+        :param file_no:
+        :param min_size: minimum number of bytes to be able to read
+        :return: free space on input buffer of the connection to read bytes into, None if connection is closed
+        """
+        conn = self.connection_pool.get_by_fileno(file_no)
+
+        if conn is None or not conn.is_alive():
+            return None
+
+        return conn.get_receive_buffer(min_size)
+
+    def on_bytes_received_into_buffer(self, file_no: int, num_bytes: int) -> None:
+        """
+        Processes bytes read into buffer returned by `get_receive_buffer`.
+
+        :param file_no:
+        :param num_bytes: number of bytes read from the remote peer
+        """
+        conn = self.connection_pool.get_by_fileno(file_no)
+
+        if conn is None:
+            logger.debug("Received bytes for connection not in pool. file_no: {0}", file_no)
+            return
+
+        if not conn.is_alive():
+            conn.log_trace("Skipping receiving bytes for closed connection.")
+            return
+
+        conn.advance_received_bytes(num_bytes)
+        conn.process_message()
+
     def get_bytes_to_send(self, file_no: int) -> Optional[memoryview]:
         conn = self.connection_pool.get_by_fileno(file_no)
 
@@ -436,6 +470,8 @@ class AbstractNode:
             logger.exception("Node shutdown failed due to an error: {}, force closing!", e)
         self.requester.close()
         self.cleanup_memory_stats_logging()
+        for tx_service in self.snapshot_tx_services:
+            tx_service.save_snapshot()
 
     async def close_all_connections(self):
         """
@@ -470,6 +506,9 @@ class AbstractNode:
         else:
             logger.trace("Enqueuing connection: {}.", peer_info)
             self.pending_connection_requests.add(peer_info)
+            connection_requests_listener = self.connection_requests_listener
+            if connection_requests_listener is not None:
+                connection_requests_listener()
 
     def dequeue_connection_requests(self) -> Optional[Set[ConnectionPeerInfo]]:
         """
@@ -514,8 +553,13 @@ class AbstractNode:
         tx_stats.set_node(self)
 
     def flush_all_send_buffers(self):
+        """
+        Sends messages held for batching on all connections. Connections flush their batches themselves once
+        batch hold time is over, this is not scheduled by default.
+        """
         for conn in self.connection_pool:
             if conn.socket_connection.can_send:
+                conn.outputbuf.flush()
                 conn.socket_connection.send()
         return self.FLUSH_SEND_BUFFERS_INTERVAL
 
@@ -1,6 +1,6 @@
 import time
 from abc import ABCMeta
-from typing import Optional, Dict, cast
+from typing import ClassVar, Optional, Dict, List, Union, cast
 
 from bxcommon import constants
 from bxcommon.connections.abstract_connection import AbstractConnection, Node, \
@@ -9,15 +9,22 @@ from bxcommon.connections.connection_state import ConnectionState
 from bxcommon.connections.connection_type import ConnectionType
 from bxcommon.messages.abstract_message import AbstractMessage
 from bxcommon.messages.abstract_message_factory import AbstractMessageFactory
+from bxcommon.messages.bloxroute import message_compression, protocol_version
+from bxcommon.messages.bloxroute.abstract_bloxroute_message import AbstractBloxrouteMessage
 from bxcommon.messages.bloxroute.ack_message import AckMessage
 from bxcommon.messages.bloxroute.bloxroute_message_factory import bloxroute_message_factory
+from bxcommon.messages.bloxroute.bloxroute_message_type import BloxrouteMessageType
 from bxcommon.messages.bloxroute.bloxroute_message_validator import BloxrouteMessageValidator
 from bxcommon.messages.bloxroute.bloxroute_version_manager import bloxroute_version_manager
 from bxcommon.messages.bloxroute.broadcast_message import BroadcastMessage
+from bxcommon.messages.bloxroute.hello_message import HelloMessage
 from bxcommon.messages.bloxroute.ping_message import PingMessage
 from bxcommon.messages.bloxroute.pong_message import PongMessage
+from bxcommon.messages.bloxroute.tx_batch_message import TxBatchMessage
+from bxcommon.messages.bloxroute.tx_message import TxMessage
 from bxcommon.network.abstract_socket_connection_protocol import AbstractSocketConnectionProtocol
 from bxcommon.utils import nonce_generator
+from bxcommon.utils.alarm_queue import AlarmId
 from bxcommon.utils.buffers.output_buffer import OutputBuffer
 from bxcommon.utils.expiring_dict import ExpiringDict
 from bxcommon.utils.stats import hooks
@@ -34,12 +41,20 @@ logger = logging.get_logger(__name__)
 class InternalNodeConnection(AbstractConnection[Node]):
     __metaclass__ = ABCMeta
 
+    # size and maximum hold time of output buffer batches, if buffered send is enabled
+    OUTPUT_BUFFER_MIN_SIZE: ClassVar[int] = constants.OUTPUT_BUFFER_MIN_SIZE
+    OUTPUT_BUFFER_MAX_HOLD_TIME: ClassVar[float] = constants.OUTPUT_BUFFER_BATCH_MAX_HOLD_TIME
+
     def __init__(self, sock: AbstractSocketConnectionProtocol, node: Node) -> None:
         super(InternalNodeConnection, self).__init__(sock, node)
 
         # Enable buffering only on internal connections
         self.enable_buffered_send = node.opts.enable_buffered_send
-        self.outputbuf = OutputBuffer(enable_buffering=self.enable_buffered_send)
+        self.outputbuf = OutputBuffer(
+            min_size=self.OUTPUT_BUFFER_MIN_SIZE,
+            max_hold_time=self.OUTPUT_BUFFER_MAX_HOLD_TIME,
+            enable_buffering=self.enable_buffered_send
+        )
 
         self.network_num = node.network_num
         self.version_manager = bloxroute_version_manager
@@ -65,6 +80,20 @@ class InternalNodeConnection(AbstractConnection[Node]):
         self.tx_sync_service = TxSyncService(self)
         self.inbound_peer_latency: float = time.time()
 
+        # compression is used only if enabled on both sides, peer announces it in its hello message
+        self.message_compression_enabled = node.opts.message_compression
+        self.message_compression_min_size = node.opts.message_compression_min_size
+        self.peer_accepts_compression = False
+
+        # transactions held to be sent in a single batch message, if peer announces it handles them in its hello
+        # message
+        self.tx_batch_max_delay_s = node.opts.tx_batch_max_delay_ms / 1000
+        self.peer_accepts_tx_batch = False
+        self.pending_tx_batch: List[TxMessage] = []
+        self.pending_tx_batch_size = 0
+        self.tx_batch_alarm_id: Optional[AlarmId] = None
+        self.message_handlers[BloxrouteMessageType.TX_BATCH] = self.msg_tx_batch
+
     def connection_message_factory(self) -> AbstractMessageFactory:
         return bloxroute_message_factory
 
@@ -79,6 +108,7 @@ class InternalNodeConnection(AbstractConnection[Node]):
         :return:
         """
         self.enable_buffered_send = False
+        self._unschedule_output_flush()
         self.outputbuf.flush()
         self.outputbuf.enable_buffering = False
         self.socket_connection.send()
@@ -93,30 +123,30 @@ class InternalNodeConnection(AbstractConnection[Node]):
         if ConnectionState.HELLO_RECVD in self.state:
             return True
 
-        protocol_version = self.version_manager.get_connection_protocol_version(self.inputbuf)
+        connection_protocol_version = self.version_manager.get_connection_protocol_version(self.inputbuf)
 
-        if protocol_version is None:
+        if connection_protocol_version is None:
             return False
 
-        if not self.version_manager.is_protocol_supported(protocol_version):
+        if not self.version_manager.is_protocol_supported(connection_protocol_version):
             self.log_debug(
                 "Protocol version {} of remote node '{}' is not supported. Closing connection.",
-                protocol_version,
+                connection_protocol_version,
                 self.peer_desc
             )
             self.mark_for_close()
             return False
 
-        if protocol_version > self.version_manager.CURRENT_PROTOCOL_VERSION:
+        if connection_protocol_version > self.version_manager.CURRENT_PROTOCOL_VERSION:
             self.log_debug(
                 "Got message protocol {} that is higher the current version {}. Using current protocol version",
-                protocol_version, self.version_manager.CURRENT_PROTOCOL_VERSION)
-            protocol_version = self.version_manager.CURRENT_PROTOCOL_VERSION
+                connection_protocol_version, self.version_manager.CURRENT_PROTOCOL_VERSION)
+            connection_protocol_version = self.version_manager.CURRENT_PROTOCOL_VERSION
 
-        self.protocol_version = protocol_version
-        self.message_factory = self.version_manager.get_message_factory_for_version(protocol_version)
+        self.protocol_version = connection_protocol_version
+        self.message_factory = self.version_manager.get_message_factory_for_version(connection_protocol_version)
 
-        self.log_trace("Setting connection protocol version to {}".format(protocol_version))
+        self.log_trace("Setting connection protocol version to {}".format(connection_protocol_version))
 
         return True
 
@@ -132,15 +162,97 @@ class InternalNodeConnection(AbstractConnection[Node]):
         if not self.is_alive():
             return
 
+        if self.tx_batch_max_delay_s > 0 and not prepend and self.established and self.peer_accepts_tx_batch:
+            if isinstance(msg, TxMessage):
+                self._add_to_tx_batch(msg)
+                return
+            if self.pending_tx_batch:
+                # preserve order of transactions and messages enqueued after them
+                self._flush_tx_batch()
+
+        self._enqueue_versioned_msg(msg, prepend)
+
+    def _flush_tx_batch(self) -> float:
+        """
+        Sends pending transactions, in a batch message if there are more than one.
+        Called from alarm queue once batching delay is over, or when batch limits are reached.
+        """
+        self._unschedule_tx_batch()
+
+        pending_tx_batch = self.pending_tx_batch
+        if not pending_tx_batch or not self.is_alive():
+            return constants.CANCEL_ALARMS
+
+        self.pending_tx_batch = []
+        self.pending_tx_batch_size = 0
+
+        if len(pending_tx_batch) == 1:
+            self._enqueue_versioned_msg(pending_tx_batch[0], False)
+        else:
+            self._enqueue_versioned_msg(TxBatchMessage(pending_tx_batch[0].network_num(), pending_tx_batch), False)
+        return constants.CANCEL_ALARMS
+
+    def _add_to_tx_batch(self, msg: TxMessage) -> None:
+        # batches are built per connection, since their contents and flush times differ between peers.
+        # a transaction broadcast to several peers is copied into each batch instead of sharing one buffer.
+        pending_tx_batch = self.pending_tx_batch
+        if pending_tx_batch and pending_tx_batch[0].network_num() != msg.network_num():
+            self._flush_tx_batch()
+            pending_tx_batch = self.pending_tx_batch
+
+        pending_tx_batch.append(msg)
+        self.pending_tx_batch_size += len(msg.rawbytes())
+
+        if (
+            len(pending_tx_batch) >= constants.TX_BATCH_MAX_COUNT
+            or self.pending_tx_batch_size >= constants.TX_BATCH_MAX_SIZE_BYTES
+        ):
+            self._flush_tx_batch()
+        elif self.tx_batch_alarm_id is None:
+            self.tx_batch_alarm_id = self.node.alarm_queue.register_alarm(
+                self.tx_batch_max_delay_s, self._flush_tx_batch
+            )
+
+    def _unschedule_tx_batch(self) -> None:
+        existing_alarm = self.tx_batch_alarm_id
+        if existing_alarm:
+            self.node.alarm_queue.unregister_alarm(existing_alarm)
+            self.tx_batch_alarm_id = None
+
+    def _enqueue_versioned_msg(self, msg, prepend: bool) -> None:
+        if isinstance(msg, HelloMessage):
+            if self.message_compression_enabled:
+                msg.set_supports_compression()
+            # batches are unpacked into transaction messages, so both handlers are needed to accept them
+            if (
+                BloxrouteMessageType.TX_BATCH in self.message_handlers
+                and BloxrouteMessageType.TRANSACTION in self.message_handlers
+            ):
+                msg.set_supports_tx_batch()
+
         if self.protocol_version < self.version_manager.CURRENT_PROTOCOL_VERSION:
             versioned_message = self.version_manager.convert_message_to_older_version(self.protocol_version, msg)
         else:
             versioned_message = msg
 
-        super(InternalNodeConnection, self).enqueue_msg(versioned_message, prepend)
+        # older versions of messages don't define their priority
+        priority = msg.output_priority()
+        if (
+            self.peer_accepts_compression
+            and versioned_message.MESSAGE_TYPE in message_compression.COMPRESSIBLE_MESSAGE_TYPES
+            and len(versioned_message.rawbytes()) >= self.message_compression_min_size
+        ):
+            self._log_message(versioned_message.log_level(), "Enqueued compressed message: {}", versioned_message)
+            self.enqueue_msg_bytes(message_compression.get_message_bytes_to_send(versioned_message), prepend, priority)
+        else:
+            self._log_message(versioned_message.log_level(), "Enqueued message: {}", versioned_message)
+            self.enqueue_msg_bytes(versioned_message.rawbytes(), prepend, priority)
 
     def pop_next_message(self, payload_len: int) -> AbstractMessage:
-        msg = super(InternalNodeConnection, self).pop_next_message(payload_len)
+        msg_bytes = self.pop_next_bytes(payload_len)
+        if self.message_compression_enabled and message_compression.is_compressed(msg_bytes):
+            msg_bytes = self._decompress_message_bytes(msg_bytes)
+        msg = self.message_factory.create_message_from_buffer(msg_bytes)
 
         if msg is None or self.protocol_version >= self.version_manager.CURRENT_PROTOCOL_VERSION:
             return msg
@@ -149,6 +261,23 @@ class InternalNodeConnection(AbstractConnection[Node]):
 
         return versioned_msg
 
+    def _decompress_message_bytes(self, msg_bytes: Union[memoryview, bytearray, bytes]) -> bytearray:
+        """
+        Decompresses message bytes, limiting decompressed payload to the max payload length of the message type
+        """
+        message_validator = self.message_validator
+        if not isinstance(message_validator, BloxrouteMessageValidator):
+            return message_compression.decompress_message_bytes(msg_bytes)
+
+        msg_type, _ = AbstractBloxrouteMessage.unpack(msg_bytes)
+        decompressed_msg_bytes = message_compression.decompress_message_bytes(
+            msg_bytes, message_validator.get_max_payload_len(msg_type)
+        )
+        message_validator.validate_payload_length(
+            msg_type, len(decompressed_msg_bytes) - AbstractBloxrouteMessage.HEADER_LENGTH
+        )
+        return decompressed_msg_bytes
+
     def check_ping_latency_for_network(self, network_num: int) -> None:
         ping_message = cast(PingMessage, self.ping_message())
         self.enqueue_msg(ping_message)
@@ -170,6 +299,10 @@ class InternalNodeConnection(AbstractConnection[Node]):
             return
 
         self.network_num = network_num
+        self.peer_accepts_compression = self.message_compression_enabled and msg.supports_compression()
+        self.peer_accepts_tx_batch = (
+            self.protocol_version >= protocol_version.TX_BATCH_MESSAGE and msg.supports_tx_batch()
+        )
 
         self.schedule_pings()
 
@@ -227,9 +360,26 @@ class InternalNodeConnection(AbstractConnection[Node]):
         elif nonce is not None:
             self.log_debug("Pong message had no matching ping request. Nonce: {}", nonce)
 
+    def msg_tx_batch(self, msg: TxBatchMessage) -> None:
+        """
+        Handles each transaction of the batch as a separate transaction message.
+        Peers send batches only if this handler is registered when the hello message is sent.
+        """
+        tx_handler = self.message_handlers.get(BloxrouteMessageType.TRANSACTION)
+        if tx_handler is None:
+            self.log_debug("Dropping {}, transaction messages are not handled.", msg)
+            return
+
+        for tx_msg in msg.tx_messages():
+            tx_handler(tx_msg)
+
     def mark_for_close(self, should_retry: Optional[bool] = None):
         super(InternalNodeConnection, self).mark_for_close(should_retry)
         self.cancel_pong_timeout()
+        self._unschedule_tx_batch()
+        self._unschedule_output_flush()
+        self.pending_tx_batch = []
+        self.pending_tx_batch_size = 0
 
     def is_gateway_connection(self):
         return self.CONNECTION_TYPE in ConnectionType.GATEWAY
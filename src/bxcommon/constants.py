@@ -35,6 +35,23 @@ DEFAULT_NETWORK_NUM = 1
 OUTPUT_BUFFER_MIN_SIZE = 65535
 OUTPUT_BUFFER_BATCH_MAX_HOLD_TIME = 0.05
 
+# outgoing message buffers are pooled in power of two size classes between these sizes
+MESSAGE_BUFFER_POOL_MIN_SIZE = 256
+MESSAGE_BUFFER_POOL_MAX_SIZE = 1024 * 1024
+# max bytes of free buffers kept per size class
+MESSAGE_BUFFER_POOL_SIZE_CLASS_MAX_BYTES = 4 * 1024 * 1024
+
+# zlib compression level of messages sent to peers accepting compressed messages
+MESSAGE_COMPRESSION_LEVEL = 1
+# smaller messages are sent uncompressed
+MESSAGE_COMPRESSION_MIN_SIZE_BYTES = 1024
+# max size of decompressed message payload
+MESSAGE_COMPRESSION_MAX_PAYLOAD_LEN_BYTES = 64 * 1024 * 1024
+
+# pending transactions are sent in a single batch message once either limit is reached
+TX_BATCH_MAX_COUNT = 500
+TX_BATCH_MAX_SIZE_BYTES = 256 * 1024
+
 FULL_QUOTA_PERCENTAGE = 100
 
 WS_PROVIDER_MAX_QUEUE_SIZE = 5000
@@ -65,6 +82,8 @@ MAX_CONNECT_RETRIES = 3
 MAX_CONNECT_TIMEOUT_INCREASE = 7
 
 RECV_BUFSIZE = 1024 * 1024
+# free space requested for each socket read, input buffers larger than this are released once drained
+INPUT_BUFFER_BASELINE_SIZE = 64 * 1024
 MAX_BAD_MESSAGES = 3
 PING_INTERVAL_S = 60
 PING_PONG_TRESHOLD = 0.5
@@ -179,6 +198,8 @@ TRANSACTIONS_BY_HASH_PERCENTAGE_TO_LOG_STATS_FOR = 0.1
 TRANSACTIONS_BY_SID_PERCENTAGE_TO_LOG_STATS_FOR = 0.01
 ENABLE_TRANSACTIONS_STATS_BY_SHORT_IDS = False
 DEFAULT_THREAD_POOL_PARALLELISM_DEGREE = 1
+# interval between completion checks of task pool tasks awaited on the event loop
+TASK_POOL_POLL_INTERVAL_S = 0.001
 DEFAULT_TX_MEM_POOL_BUCKET_SIZE = 10000
 
 # </editor-fold>
@@ -214,11 +235,20 @@ RELAYED_BLOCKS_EXPIRE_TIME_S = 6 * 60 * 60
 DUMP_REMOVED_SHORT_IDS_INTERVAL_S = 5 * 60
 DUMP_REMOVED_SHORT_IDS_PATH = "/app/bxcommon/debug/removed-short-ids"
 
+TRANSACTION_SERVICE_SNAPSHOT_INTERVAL_S = 5 * 60
+# time budget of a slice of snapshot capture and delay between the slices, lets the event loop process network events
+TRANSACTION_SERVICE_SNAPSHOT_SLICE_TIME_BUDGET_S = 0.005
+TRANSACTION_SERVICE_SNAPSHOT_SLICE_INTERVAL_S = 0.001
+
 CLEAN_UP_SEEN_SHORT_IDS_DELAY_S = 10
+# delay between slices of finalized blocks clean up, lets the event loop process network events in between
+BLOCK_CLEANUP_SLICE_INTERVAL_S = 0.001
 
 REMOVED_TRANSACTIONS_HISTORY_EXPIRATION_S = 6 * 60 * 60
 REMOVED_TRANSACTIONS_HISTORY_CLEANUP_INTERVAL_S = 10
 REMOVED_TRANSACTIONS_HISTORY_LENGTH_LIMIT = 500000
+REMOVED_TRANSACTIONS_HISTORY_FILTER_GENERATIONS = 8
+REMOVED_TRANSACTIONS_HISTORY_FILTER_FALSE_POSITIVE_RATE = 0.001
 
 RESPONSIVENESS_CHECK_INTERVAL_S = 1
 RESPONSIVENESS_CHECK_DELAY_WARN_THRESHOLD_S = 0.2
@@ -250,6 +280,8 @@ DEFAULT_BLOCK_HOLD_TIMEOUT = 0.3
 
 TXS_MSG_SIZE = 64000
 TXS_SYNC_TASK_DURATION = 0.15
+# number of transactions of a received sync message added to transaction service at once
+TX_SYNC_PROCESSING_BATCH_SIZE = 1000
 TX_SERVICE_SYNC_TXS_S = 0.01
 SENDING_TX_MSGS_TIMEOUT_S = 15 * 60
 TX_SERVICE_CHECK_NETWORKS_SYNCED_S = 10 * 60
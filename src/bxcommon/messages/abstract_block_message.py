@@ -1,6 +1,7 @@
 from abc import abstractmethod
 
 from bxcommon.messages.abstract_message import AbstractMessage
+from bxcommon.utils.buffers.output_priority import OutputPriority
 from bxcommon.utils.object_hash import Sha256Hash
 
 
@@ -21,6 +22,9 @@ class AbstractBlockMessage(AbstractMessage):
     def extra_stats_data(self) -> str:
         return ""
 
+    def output_priority(self) -> OutputPriority:
+        return OutputPriority.BLOCK
+
     @abstractmethod
     def txns(self):
         # each blockchain network returns its own list format
@@ -1,5 +1,6 @@
 from abc import abstractmethod, ABC
 
+from bxcommon.utils.buffers.output_priority import OutputPriority
 from bxutils.logging.log_level import LogLevel
 
 
@@ -30,6 +31,12 @@ class AbstractMessage(ABC):
     def log_level(self) -> LogLevel:
         return LogLevel.TRACE
 
+    def output_priority(self) -> OutputPriority:
+        """
+        Priority lane of output buffer the message is sent through.
+        """
+        return OutputPriority.NORMAL
+
     @abstractmethod
     def rawbytes(self) -> memoryview:
         """
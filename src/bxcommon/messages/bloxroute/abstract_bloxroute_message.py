@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Union
 from bxcommon import constants
 from bxcommon.messages.abstract_internal_message import AbstractInternalMessage
 from bxcommon.messages.bloxroute.bloxroute_message_control_flags import BloxrouteMessageControlFlags
@@ -15,8 +15,11 @@ class AbstractBloxrouteMessage(AbstractInternalMessage):
     STARTING_BYTES_LEN = constants.STARTING_SEQUENCE_BYTES_LEN
 
     converted_message: Dict[int, Any]
+    compressed_rawbytes: Optional[Union[bytearray, memoryview]]
 
     def __init__(self, msg_type: bytes, payload_len: int, buf: bytearray) -> None:
+        self.converted_message = {}
+        self.compressed_rawbytes = None
 
         super().__init__(msg_type=msg_type, payload_len=payload_len, buf=buf)
 
@@ -24,7 +27,6 @@ class AbstractBloxrouteMessage(AbstractInternalMessage):
 
         # Control flag is set to TRUE by default
         self.set_control_flag(BloxrouteMessageControlFlags.VALID)
-        self.converted_message = {}
 
     def get_control_flags(self) -> int:
         """
@@ -39,6 +41,7 @@ class AbstractBloxrouteMessage(AbstractInternalMessage):
         :param flag: control flag to set
         """
         self.buf[-1] |= flag
+        self.clear_converted_messages()
 
     def remove_control_flag(self, flag: int) -> None:
         """
@@ -47,3 +50,13 @@ class AbstractBloxrouteMessage(AbstractInternalMessage):
         """
         if self.buf[-1] & flag:
             self.buf[-1] ^= flag
+            self.clear_converted_messages()
+
+    def clear_converted_messages(self) -> None:
+        """
+        Drops cached conversions to older protocol versions and compressed message bytes.
+        Must be called whenever message contents change.
+        """
+        if self.converted_message:
+            self.converted_message.clear()
+        self.compressed_rawbytes = None
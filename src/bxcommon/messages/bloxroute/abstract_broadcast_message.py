@@ -1,10 +1,11 @@
-import struct
 from abc import ABC
 from typing import Optional, Union
 
 from bxcommon import constants
 from bxcommon.messages.bloxroute.abstract_bloxroute_message import AbstractBloxrouteMessage
 from bxcommon.utils import crypto, uuid_pack
+from bxcommon.utils.buffers.buffer_pool import message_buffer_pool
+from bxcommon.utils.message_buffer_builder import PayloadBlock, PayloadElement
 from bxcommon.utils.object_hash import Sha256Hash, ConcatHash
 
 
@@ -12,6 +13,21 @@ class AbstractBroadcastMessage(AbstractBloxrouteMessage, ABC):
     PAYLOAD_LENGTH = crypto.SHA256_HASH_LEN + constants.NETWORK_NUM_LEN + constants.NODE_ID_SIZE_IN_BYTES + \
                      constants.CONTROL_FLAGS_LEN
     SOURCE_ID_OFFSET = AbstractBloxrouteMessage.HEADER_LENGTH + crypto.SHA256_HASH_LEN + constants.NETWORK_NUM_LEN
+    BROADCAST_MESSAGE_LAYOUT = PayloadBlock(
+        AbstractBloxrouteMessage.HEADER_LENGTH,
+        "AbstractBroadcastMessage",
+        0,
+        PayloadElement(name="message_hash", structure=f"<{crypto.SHA256_HASH_LEN}s"),
+        PayloadElement(name="network_num", structure="<L"),
+        PayloadElement(
+            name="source_id",
+            structure=f"<{constants.NODE_ID_SIZE_IN_BYTES}s",
+            encode=uuid_pack.to_bytes,
+            decode=uuid_pack.from_bytes
+        ),
+    ).layout
+    _NETWORK_NUM_FIELD = BROADCAST_MESSAGE_LAYOUT["network_num"]
+    _SOURCE_ID_FIELD = BROADCAST_MESSAGE_LAYOUT["source_id"]
 
     _message_hash: Optional[Sha256Hash] = None
     _network_num: Optional[int] = None
@@ -26,7 +42,7 @@ class AbstractBroadcastMessage(AbstractBloxrouteMessage, ABC):
         buf: Optional[Union[bytearray, memoryview]] = None
     ):
         if buf is None:
-            self.buf = bytearray(self.HEADER_LENGTH + self.PAYLOAD_LENGTH)
+            self.buf = message_buffer_pool.allocate(self.HEADER_LENGTH + self.PAYLOAD_LENGTH)
         else:
             self.buf = buf
 
@@ -38,18 +54,14 @@ class AbstractBroadcastMessage(AbstractBloxrouteMessage, ABC):
             off = AbstractBloxrouteMessage.HEADER_LENGTH
 
             self.buf[off:off + crypto.SHA256_HASH_LEN] = message_hash.binary
-            off += crypto.SHA256_HASH_LEN
-
-            struct.pack_into("<L", self.buf, off, network_num)
-            off += constants.NETWORK_NUM_LEN
-
-            struct.pack_into("<16s", self.buf, off, uuid_pack.to_bytes(source_id))
-            off += constants.NODE_ID_SIZE_IN_BYTES
+            self._NETWORK_NUM_FIELD.set(self.buf, network_num)
+            self._SOURCE_ID_FIELD.set(self.buf, source_id)
 
     def set_message_hash(self, message_hash: Sha256Hash) -> None:
         assert self.buf is not None
         off = AbstractBloxrouteMessage.HEADER_LENGTH
         self.buf[off:off + crypto.SHA256_HASH_LEN] = message_hash.binary
+        self.clear_converted_messages()
 
     def message_hash(self) -> Sha256Hash:
         if self._message_hash is None:
@@ -76,8 +88,7 @@ class AbstractBroadcastMessage(AbstractBloxrouteMessage, ABC):
 
     def network_num(self) -> int:
         if self._network_num is None:
-            off = self.HEADER_LENGTH + crypto.SHA256_HASH_LEN
-            self._network_num, = struct.unpack_from("<L", self.buf, off)
+            self._network_num = self._NETWORK_NUM_FIELD.get(self.buf)
 
         network_num = self._network_num
         assert network_num is not None
@@ -85,8 +96,7 @@ class AbstractBroadcastMessage(AbstractBloxrouteMessage, ABC):
 
     def source_id(self) -> str:
         if self._source_id is None:
-            off = self.SOURCE_ID_OFFSET
-            self._source_id = uuid_pack.from_bytes(struct.unpack_from("<16s", self.buf, off)[0])
+            self._source_id = self._SOURCE_ID_FIELD.get(self.buf)
             if self._source_id is None:
                 self._source_id = constants.DECODED_EMPTY_SOURCE_ID
 
@@ -102,8 +112,8 @@ class AbstractBroadcastMessage(AbstractBloxrouteMessage, ABC):
 
     def set_source_id(self, source_id: str) -> None:
         self._source_id = source_id
-        off = self.HEADER_LENGTH + crypto.SHA256_HASH_LEN + constants.NETWORK_NUM_LEN
-        struct.pack_into("<16s", self.buf, off, uuid_pack.to_bytes(source_id))
+        self._SOURCE_ID_FIELD.set(self.buf, source_id)
+        self.clear_converted_messages()
 
     def has_source_id(self) -> bool:
         return self.source_id() != constants.DECODED_EMPTY_SOURCE_ID
@@ -1,6 +1,7 @@
 from bxcommon import constants
 from bxcommon.messages.bloxroute.abstract_bloxroute_message import AbstractBloxrouteMessage
 from bxcommon.messages.bloxroute.bloxroute_message_type import BloxrouteMessageType
+from bxcommon.utils.buffers.output_priority import OutputPriority
 
 
 class AckMessage(AbstractBloxrouteMessage):
@@ -17,3 +18,6 @@ class AckMessage(AbstractBloxrouteMessage):
             self._memoryview = memoryview(self.buf)
             self._command = self._payload_len = None
             self._payload = None
+
+    def output_priority(self) -> OutputPriority:
+        return OutputPriority.CONTROL
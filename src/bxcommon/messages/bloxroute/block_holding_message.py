@@ -2,6 +2,7 @@ from typing import Optional
 
 from bxcommon.messages.bloxroute.abstract_broadcast_message import AbstractBroadcastMessage
 from bxcommon.messages.bloxroute.bloxroute_message_type import BloxrouteMessageType
+from bxcommon.utils.buffers.output_priority import OutputPriority
 from bxcommon.utils.object_hash import Sha256Hash
 
 
@@ -19,5 +20,8 @@ class BlockHoldingMessage(AbstractBroadcastMessage):
     def __repr__(self) -> str:
         return f"BlockHoldingMessage<block_hash: {self.block_hash()}>"
 
+    def output_priority(self) -> OutputPriority:
+        return OutputPriority.BLOCK
+
     def block_hash(self) -> Sha256Hash:
         return self.message_hash()
@@ -1,7 +1,8 @@
 import struct
-from typing import List, Union, NamedTuple
+from typing import List, Union, NamedTuple, cast
 
 from bxcommon.constants import UL_INT_SIZE_IN_BYTES
+from bxcommon.messages.bloxroute import short_ids_serializer
 from bxcommon.utils.crypto import SHA256_HASH_LEN
 from bxcommon.utils.object_hash import Sha256Hash
 
@@ -39,9 +40,7 @@ def serialize_blocks_short_ids_into_bytes(block_short_ids: List[BlockShortIds])
         off += SHA256_HASH_LEN
         struct.pack_into("<L", buffer, off, len(block_short_id.short_ids))
         off += UL_INT_SIZE_IN_BYTES
-        for short_id in block_short_id.short_ids:
-            struct.pack_into("<L", buffer, off, short_id)
-            off += UL_INT_SIZE_IN_BYTES
+        off = short_ids_serializer.pack_short_ids_into(block_short_id.short_ids, buffer, off)
 
     return buffer
 
@@ -64,11 +63,9 @@ def deserialize_blocks_short_ids_from_buffer(
         offset += SHA256_HASH_LEN
         short_ids_count, = struct.unpack_from("<L", buffer, offset)
         offset += UL_INT_SIZE_IN_BYTES
-        short_ids = []
-        for _ in range(short_ids_count):
-            short_id, = struct.unpack_from("<L", buffer, offset)
-            short_ids.append(short_id)
-            offset += UL_INT_SIZE_IN_BYTES
+        # short ids are unpacked into a list unless a view is requested
+        short_ids = cast(List[int], short_ids_serializer.unpack_short_ids_from(buffer, offset, short_ids_count))
+        offset += short_ids_count * UL_INT_SIZE_IN_BYTES
 
         block_short_ids.append(BlockShortIds(block_hash, short_ids))
 
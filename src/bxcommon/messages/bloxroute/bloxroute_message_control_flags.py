@@ -4,3 +4,9 @@ from enum import IntFlag
 class BloxrouteMessageControlFlags(IntFlag):
     NONE = 0
     VALID = 1
+    # payload is compressed, see message_compression
+    COMPRESSED = 2
+    # set on hello messages by nodes that accept compressed messages
+    COMPRESSION_SUPPORTED = 4
+    # set on hello messages by nodes that handle transaction batch messages
+    TX_BATCH_SUPPORTED = 8
@@ -25,6 +25,7 @@ from bxcommon.messages.bloxroute.ping_message import PingMessage
 from bxcommon.messages.bloxroute.pong_message import PongMessage
 from bxcommon.messages.bloxroute.routing_update_message import RoutingUpdateMessage
 from bxcommon.messages.bloxroute.transaction_cleanup_message import TransactionCleanupMessage
+from bxcommon.messages.bloxroute.tx_batch_message import TxBatchMessage
 from bxcommon.messages.bloxroute.tx_contents_message import TxContentsMessage
 from bxcommon.messages.bloxroute.tx_message import TxMessage
 from bxcommon.messages.bloxroute.tx_service_sync_blocks_short_ids_message import \
@@ -77,6 +78,7 @@ class _BloxrouteMessageFactory(AbstractMessageFactory):
         BloxrouteMessageType.GET_COMPRESSED_BLOCK_TXS: GetCompressedBlockTxsMessage,
         BloxrouteMessageType.COMPRESSED_BLOCK_TXS: CompressedBlockTxsMessage,
         BloxrouteMessageType.ROUTING_UPDATE: RoutingUpdateMessage,
+        BloxrouteMessageType.TX_BATCH: TxBatchMessage,
     }
 
     def __init__(self) -> None:
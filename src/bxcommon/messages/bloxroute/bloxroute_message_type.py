@@ -26,3 +26,4 @@ class BloxrouteMessageType:
     GET_COMPRESSED_BLOCK_TXS = b"getblocktxs"
     COMPRESSED_BLOCK_TXS = b"blocktxs"
     ROUTING_UPDATE = b"routing"
+    TX_BATCH = b"txbatch"
@@ -14,6 +14,16 @@ from bxcommon.utils.buffers.input_buffer import InputBuffer
 
 class BloxrouteMessageValidator(AbstractMessageValidator):
     FIRST_VALIDATING_VERSION = 4
+    # messages limited by max block size instead of default max payload length
+    BLOCK_SIZE_MESSAGE_TYPES = {
+        BloxrouteMessageType.BROADCAST,
+        BloxrouteMessageType.TRANSACTIONS,
+        BloxrouteMessageType.TX_BATCH,
+        BloxrouteMessageType.TX_SERVICE_SYNC_BLOCKS_SHORT_IDS,
+        BloxrouteMessageType.TX_SERVICE_SYNC_TXS,
+        BloxrouteMessageType.TRANSACTION_CLEANUP,
+        BloxrouteMessageType.BLOCK_CONFIRMATION,
+    }
 
     def __init__(
         self,
@@ -51,6 +61,38 @@ class BloxrouteMessageValidator(AbstractMessageValidator):
         if self._connection_protocol_version >= self.FIRST_VALIDATING_VERSION:
             self._validate_control_flags(is_full_msg, header_len, payload_len, input_buffer)
 
+    def validate_payload_length(self, msg_type: Optional[bytes], payload_len: Optional[int]) -> None:
+        """
+        Validates payload length of a message restored after it was received, e.g. decompressed message.
+        Throws MessageValidationError is message is not valid
+
+        :param msg_type: message type
+        :param payload_len: message payload length
+        """
+        if self._size_validation_settings is not None:
+            self._validate_payload_length(msg_type, payload_len)
+
+    def get_max_payload_len(self, msg_type: bytes) -> int:
+        """
+        Returns max payload length accepted for message type.
+        Messages limited by blockchain network settings fall back to
+        MESSAGE_COMPRESSION_MAX_PAYLOAD_LEN_BYTES if the settings are not available yet.
+
+        :param msg_type: message type
+        :return: max payload length in bytes
+        """
+        size_validation_settings = self._size_validation_settings
+        if msg_type == BloxrouteMessageType.TRANSACTION:
+            if size_validation_settings is None:
+                return constants.MESSAGE_COMPRESSION_MAX_PAYLOAD_LEN_BYTES
+            return size_validation_settings.max_tx_size_bytes
+        elif msg_type in self.BLOCK_SIZE_MESSAGE_TYPES:
+            if size_validation_settings is None:
+                return constants.MESSAGE_COMPRESSION_MAX_PAYLOAD_LEN_BYTES
+            return size_validation_settings.max_block_size_bytes
+        else:
+            return constants.DEFAULT_MAX_PAYLOAD_LEN_BYTES
+
     def _validate_starting_sequence(self, input_buffer: InputBuffer) -> None:
 
         if input_buffer.length < constants.STARTING_SEQUENCE_BYTES_LEN:
@@ -78,14 +120,7 @@ class BloxrouteMessageValidator(AbstractMessageValidator):
                     f"Actual: {payload_len}."
                 )
 
-        elif msg_type in {
-            BloxrouteMessageType.BROADCAST,
-            BloxrouteMessageType.TRANSACTIONS,
-            BloxrouteMessageType.TX_SERVICE_SYNC_BLOCKS_SHORT_IDS,
-            BloxrouteMessageType.TX_SERVICE_SYNC_TXS,
-            BloxrouteMessageType.TRANSACTION_CLEANUP,
-            BloxrouteMessageType.BLOCK_CONFIRMATION,
-        }:
+        elif msg_type in self.BLOCK_SIZE_MESSAGE_TYPES:
             size_validation_settings = self._size_validation_settings
             assert size_validation_settings is not None
             if payload_len > size_validation_settings.max_block_size_bytes:
@@ -2,7 +2,6 @@ from bxcommon import constants
 from bxcommon.messages.bloxroute.bloxroute_message_factory import bloxroute_message_factory
 from bxcommon.messages.bloxroute.bloxroute_message_type import BloxrouteMessageType
 from bxcommon.messages.bloxroute.protocol_version import PROTOCOL_VERSION
-from bxcommon.messages.bloxroute.v22 import message_converter_factory_v22, bloxroute_message_factory_v22
 from bxcommon.messages.bloxroute.v6.bloxroute_message_factory_v6 import bloxroute_message_factory_v6
 from bxcommon.messages.bloxroute.v6.message_converter_factory_v6 import message_converter_factory_v6
 from bxcommon.messages.bloxroute.v7.bloxroute_message_factory_v7 import bloxroute_message_factory_v7
@@ -35,6 +34,10 @@ from bxcommon.messages.bloxroute.v20.message_converter_factory_v20 import messag
 from bxcommon.messages.bloxroute.v20.bloxroute_message_factory_v20 import bloxroute_message_factory_v20
 from bxcommon.messages.bloxroute.v21.message_converter_factory_v21 import message_converter_factory_v21
 from bxcommon.messages.bloxroute.v21.bloxroute_message_factory_v21 import bloxroute_message_factory_v21
+from bxcommon.messages.bloxroute.v22.message_converter_factory_v22 import message_converter_factory_v22
+from bxcommon.messages.bloxroute.v22.bloxroute_message_factory_v22 import bloxroute_message_factory_v22
+from bxcommon.messages.bloxroute.v23.message_converter_factory_v23 import message_converter_factory_v23
+from bxcommon.messages.bloxroute.v23.bloxroute_message_factory_v23 import bloxroute_message_factory_v23
 from bxcommon.messages.versioning.abstract_version_manager import AbstractVersionManager
 
 
@@ -59,7 +62,8 @@ class _BloxrouteVersionManager(AbstractVersionManager):
         19: message_converter_factory_v19,
         20: message_converter_factory_v20,
         21: message_converter_factory_v21,
-        22: message_converter_factory_v22
+        22: message_converter_factory_v22,
+        23: message_converter_factory_v23
     }
     _PROTOCOL_TO_FACTORY_MAPPING = {
         6: bloxroute_message_factory_v6,
@@ -79,7 +83,8 @@ class _BloxrouteVersionManager(AbstractVersionManager):
         20: bloxroute_message_factory_v20,
         21: bloxroute_message_factory_v21,
         22: bloxroute_message_factory_v22,
-        23: bloxroute_message_factory
+        23: bloxroute_message_factory_v23,
+        24: bloxroute_message_factory
     }
 
     def __init__(self) -> None:
@@ -2,6 +2,7 @@ import struct
 from collections import namedtuple
 
 from bxcommon import constants
+from bxcommon.messages.bloxroute import short_ids_serializer
 
 BlockOffsets = namedtuple("BlockOffsets", ["short_id_offset", "block_begin_offset"])
 
@@ -28,35 +29,23 @@ def serialize_short_ids_into_bytes(short_ids) -> bytearray:
     buffer = bytearray(get_serialized_short_ids_bytes_len(short_ids))
 
     struct.pack_into("<L", buffer, 0, len(short_ids))
-    offset = constants.UL_INT_SIZE_IN_BYTES
-
-    for short_id in short_ids:
-        struct.pack_into("<L", buffer, offset, short_id)
-        offset += constants.UL_INT_SIZE_IN_BYTES
+    short_ids_serializer.pack_short_ids_into(short_ids, buffer, constants.UL_INT_SIZE_IN_BYTES)
 
     return buffer
 
 
-def deserialize_short_ids_from_buffer(buffer, offset):
+def deserialize_short_ids_from_buffer(buffer, offset, as_view: bool = False):
     """
     Deserializes list of short ids from buffer
 
     :param buffer: buffer containing serialized short ids bytes
     :param offset: offset in a buffer where serialized short ids begin
+    :param as_view: return a zero copy view of the buffer instead of a list
     :return: list of short ids
     """
 
-    short_ids_len, = struct.unpack_from("<L", buffer, offset)
-    length = constants.UL_INT_SIZE_IN_BYTES
-
-    short_ids = []
-
-    for _ in range(short_ids_len):
-        short_id, = struct.unpack_from("<L", buffer, offset + length)
-        length += constants.UL_INT_SIZE_IN_BYTES
-        short_ids.append(short_id)
-
-    return short_ids, length
+    short_ids, end_offset = short_ids_serializer.deserialize_short_ids_from_buffer(buffer, offset, as_view)
+    return short_ids, end_offset - offset
 
 
 def get_bx_block_offsets(bx_block):
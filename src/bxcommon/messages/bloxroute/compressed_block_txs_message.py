@@ -1,5 +1,5 @@
 import struct
-from typing import List, Optional
+from typing import List, Optional, Union, Iterator
 
 from bxcommon import constants
 from bxcommon.messages.bloxroute import transactions_info_serializer
@@ -8,6 +8,8 @@ from bxcommon.messages.bloxroute.bloxroute_message_type import BloxrouteMessageT
 from bxcommon.messages.bloxroute.txs_message import TxsMessage
 from bxcommon.models.transaction_info import TransactionInfo
 from bxcommon.utils import crypto
+from bxcommon.utils.buffers.buffer_pool import message_buffer_pool
+from bxcommon.utils.buffers.output_priority import OutputPriority
 from bxcommon.utils.object_hash import Sha256Hash
 from bxutils import logging
 
@@ -29,23 +31,28 @@ class CompressedBlockTxsMessage(AbstractBloxrouteMessage):
         network_num: Optional[int] = None,
         block_hash: Optional[Sha256Hash] = None,
         txs: Optional[List[TransactionInfo]] = None,
-        buf: Optional[bytearray] = None
+        buf: Optional[bytearray] = None,
+        txs_bytes: Optional[Union[bytearray, memoryview]] = None
     ) -> None:
 
         """
-        Constructor. Expects list of transaction details or message bytes.
+        Constructor. Expects list of transaction details, serialized transaction details or message bytes.
         :param network_num: Network number
         :param block_hash: Block hash
         :param txs: tuple with 3 values (tx short id, tx hash, tx contents)
         :param buf: message bytes
+        :param txs_bytes: transaction details already serialized in transactions info format
         """
         self.txs_info_offset = self.HEADER_LENGTH + constants.UL_INT_SIZE_IN_BYTES + crypto.SHA256_HASH_LEN
 
         if buf is None:
             assert network_num is not None
             assert block_hash is not None
-            assert txs is not None
-            buf = self._serialize(network_num, block_hash, txs)
+            if txs_bytes is None:
+                assert txs is not None
+                buf = self._serialize(network_num, block_hash, txs)
+            else:
+                buf = self._serialize_txs_bytes(network_num, block_hash, txs_bytes)
         super().__init__(self.MESSAGE_TYPE, len(buf) - self.HEADER_LENGTH, buf)
 
         self._txs = None
@@ -53,14 +60,30 @@ class CompressedBlockTxsMessage(AbstractBloxrouteMessage):
         self._network_num = None
         self._block_hash = None
 
+    def output_priority(self) -> OutputPriority:
+        return OutputPriority.BLOCK
+
     def get_txs(self) -> List[TransactionInfo]:
         if self._txs is None:
-            self._parse()
+            self._txs, _ = transactions_info_serializer.deserialize_transactions_info_from_buffer(
+                self.buf, self.txs_info_offset
+            )
 
         txs = self._txs
         assert txs is not None
         return txs
 
+    def iter_txs(self) -> Iterator[TransactionInfo]:
+        """
+        Iterates over transactions as they are parsed, without building the list of all transactions.
+        Transaction contents are views of the message buffer.
+        """
+        if self._txs is not None:
+            return iter(self._txs)
+        return transactions_info_serializer.iter_transactions_info_from_buffer(
+            self._memoryview, self.txs_info_offset
+        )
+
     def get_txs_count(self) -> Optional[int]:
         if self._txs_count is None:
             off = self.HEADER_LENGTH + constants.UL_INT_SIZE_IN_BYTES + crypto.SHA256_HASH_LEN
@@ -86,7 +109,7 @@ class CompressedBlockTxsMessage(AbstractBloxrouteMessage):
 
     def to_txs_message(self) -> TxsMessage:
         txs_info_bytes = self.rawbytes()[self.txs_info_offset:]
-        result_message_bytes = bytearray(TxsMessage.HEADER_LENGTH + len(txs_info_bytes))
+        result_message_bytes = message_buffer_pool.allocate(TxsMessage.HEADER_LENGTH + len(txs_info_bytes))
         result_message_bytes[TxsMessage.HEADER_LENGTH:] = txs_info_bytes
         return TxsMessage(buf=result_message_bytes)
 
@@ -98,7 +121,7 @@ class CompressedBlockTxsMessage(AbstractBloxrouteMessage):
             + constants.CONTROL_FLAGS_LEN
         )
 
-        buf = bytearray(msg_size)
+        buf = message_buffer_pool.allocate(msg_size)
         off = self.HEADER_LENGTH
 
         struct.pack_into("<L", buf, off, network_num)
@@ -111,25 +134,37 @@ class CompressedBlockTxsMessage(AbstractBloxrouteMessage):
 
         return buf
 
-    def _parse(self):
+    def _serialize_txs_bytes(
+        self, network_num: int, block_hash: Sha256Hash, txs_bytes: Union[bytearray, memoryview]
+    ) -> bytearray:
+        buf = message_buffer_pool.allocate(self.txs_info_offset + len(txs_bytes) + constants.CONTROL_FLAGS_LEN)
         off = self.HEADER_LENGTH
 
-        self._network_num, = struct.unpack_from("<L", self.buf, off)
+        struct.pack_into("<L", buf, off, network_num)
         off += constants.UL_INT_SIZE_IN_BYTES
 
-        self._block_hash = Sha256Hash(self.buf[off: off + crypto.SHA256_HASH_LEN])
+        buf[off:off + crypto.SHA256_HASH_LEN] = block_hash.binary
         off += crypto.SHA256_HASH_LEN
 
-        txs, _ = transactions_info_serializer.deserialize_transactions_info_from_buffer(self.buf, off)
+        buf[off:off + len(txs_bytes)] = txs_bytes
+
+        return buf
+
+    def _parse(self):
+        off = self.HEADER_LENGTH
+
+        self._network_num, = struct.unpack_from("<L", self.buf, off)
+        off += constants.UL_INT_SIZE_IN_BYTES
 
-        self._txs = txs
+        self._block_hash = Sha256Hash(self.buf[off: off + crypto.SHA256_HASH_LEN])
 
     def __repr__(self):
-        return "CompressedBlockTxsMessage<num_txs: {}>".format(len(self.get_txs()))
+        return "CompressedBlockTxsMessage<num_txs: {}>".format(len(self))
 
     def __iter__(self):
-        for short_id in self.get_txs():
-            yield short_id
+        return iter(self.get_txs())
 
     def __len__(self):
-        return len(self.get_txs())
+        txs_count = self.get_txs_count()
+        assert txs_count is not None
+        return txs_count
@@ -2,6 +2,7 @@ from bxcommon import constants
 from bxcommon.messages.bloxroute import short_ids_serializer
 from bxcommon.messages.bloxroute.abstract_bloxroute_message import AbstractBloxrouteMessage
 from bxcommon.messages.bloxroute.bloxroute_message_type import BloxrouteMessageType
+from bxcommon.utils.buffers.output_priority import OutputPriority
 from bxutils.logging.log_level import LogLevel
 
 
@@ -38,6 +39,9 @@ class GetTxsMessage(AbstractBloxrouteMessage):
     def log_level(self):
         return LogLevel.DEBUG
 
+    def output_priority(self) -> OutputPriority:
+        return OutputPriority.BLOCK
+
     def get_short_ids(self):
         if self._short_ids is None:
             self._parse()
@@ -1,6 +1,7 @@
 from typing import Optional
 
 from bxcommon import constants
+from bxcommon.messages.bloxroute.bloxroute_message_control_flags import BloxrouteMessageControlFlags
 from bxcommon.messages.bloxroute.bloxroute_message_type import BloxrouteMessageType
 from bxcommon.messages.bloxroute.protocol_version import PROTOCOL_VERSION
 from bxcommon.messages.bloxroute.version_message import VersionMessage
@@ -56,3 +57,19 @@ class HelloMessage(VersionMessage):
         if self._node_id is None:
             self.__unpack()
         return self._node_id
+
+    def supports_compression(self) -> bool:
+        return BloxrouteMessageControlFlags.COMPRESSION_SUPPORTED in BloxrouteMessageControlFlags(
+            self.get_control_flags()
+        )
+
+    def set_supports_compression(self) -> None:
+        self.set_control_flag(BloxrouteMessageControlFlags.COMPRESSION_SUPPORTED)
+
+    def supports_tx_batch(self) -> bool:
+        return BloxrouteMessageControlFlags.TX_BATCH_SUPPORTED in BloxrouteMessageControlFlags(
+            self.get_control_flags()
+        )
+
+    def set_supports_tx_batch(self) -> None:
+        self.set_control_flag(BloxrouteMessageControlFlags.TX_BATCH_SUPPORTED)
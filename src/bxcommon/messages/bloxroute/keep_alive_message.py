@@ -3,6 +3,7 @@ from typing import Optional
 from bxcommon import constants
 from bxcommon.messages.bloxroute.abstract_bloxroute_message import AbstractBloxrouteMessage
 from bxcommon.messages.bloxroute.protocol_version import PROTOCOL_VERSION
+from bxcommon.utils.buffers.output_priority import OutputPriority
 from bxcommon.utils.message_buffer_builder import PayloadElement, PayloadBlock
 
 
@@ -42,6 +43,9 @@ class KeepAliveMessage(AbstractBloxrouteMessage):
         contents = self.KEEP_ALIVE_MESSAGE_BLOCK.read(self._memoryview)
         self._nonce = contents.get("nonce")
 
+    def output_priority(self) -> OutputPriority:
+        return OutputPriority.CONTROL
+
     def nonce(self) -> int:
         if self._nonce is None:
             self.__unpack()
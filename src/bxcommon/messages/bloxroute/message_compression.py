@@ -0,0 +1,103 @@
+import struct
+import zlib
+from typing import Union
+
+from bxcommon import constants
+from bxcommon.messages.bloxroute.abstract_bloxroute_message import AbstractBloxrouteMessage
+from bxcommon.messages.bloxroute.bloxroute_message_control_flags import BloxrouteMessageControlFlags
+from bxcommon.messages.bloxroute.bloxroute_message_type import BloxrouteMessageType
+from bxcommon.messages.validation.message_validation_error import MessageValidationError
+
+_HEADER_LENGTH = AbstractBloxrouteMessage.HEADER_LENGTH
+_PAYLOAD_LENGTH_OFFSET = AbstractBloxrouteMessage.STARTING_BYTES_LEN + constants.MSG_TYPE_LEN
+
+# bulk messages compressed for peers accepting compressed messages. Messages with fields peeked
+# from the input buffer before the whole message is received (e.g. broadcast messages) are never compressed.
+COMPRESSIBLE_MESSAGE_TYPES = {
+    BloxrouteMessageType.TRANSACTIONS,
+    BloxrouteMessageType.TX_BATCH,
+    BloxrouteMessageType.TX_SERVICE_SYNC_BLOCKS_SHORT_IDS,
+    BloxrouteMessageType.TX_SERVICE_SYNC_TXS,
+    BloxrouteMessageType.COMPRESSED_BLOCK_TXS,
+}
+
+
+def get_message_bytes_to_send(
+    msg: AbstractBloxrouteMessage, level: int = constants.MESSAGE_COMPRESSION_LEVEL
+) -> Union[bytearray, memoryview]:
+    """
+    Returns compressed message bytes, or raw message bytes if compression does not reduce message size.
+    Result is cached on the message, so a message broadcast to many connections is compressed once.
+
+    :param msg: message to send
+    :param level: zlib compression level
+    :return: message bytes
+    """
+    compressed_rawbytes = msg.compressed_rawbytes
+    if compressed_rawbytes is None:
+        compressed_rawbytes = compress_message_bytes(msg.rawbytes(), level)
+        msg.compressed_rawbytes = compressed_rawbytes
+    return compressed_rawbytes
+
+
+def compress_message_bytes(
+    msg_bytes: memoryview, level: int = constants.MESSAGE_COMPRESSION_LEVEL
+) -> Union[bytearray, memoryview]:
+    """
+    Compresses message payload, except control flags, and marks the message with COMPRESSED control flag.
+    Message header keeps message type, payload length is replaced with compressed payload length.
+
+    :param msg_bytes: message bytes
+    :param level: zlib compression level
+    :return: compressed message bytes, or original bytes if compression does not reduce message size
+    """
+    compressed_payload = zlib.compress(msg_bytes[_HEADER_LENGTH:-constants.CONTROL_FLAGS_LEN], level)
+    compressed_payload_len = len(compressed_payload) + constants.CONTROL_FLAGS_LEN
+    if _HEADER_LENGTH + compressed_payload_len >= len(msg_bytes):
+        return msg_bytes
+
+    compressed_msg_bytes = bytearray(_HEADER_LENGTH + compressed_payload_len)
+    compressed_msg_bytes[:_HEADER_LENGTH] = msg_bytes[:_HEADER_LENGTH]
+    struct.pack_into("<L", compressed_msg_bytes, _PAYLOAD_LENGTH_OFFSET, compressed_payload_len)
+    compressed_msg_bytes[_HEADER_LENGTH:-constants.CONTROL_FLAGS_LEN] = compressed_payload
+    compressed_msg_bytes[-1] = msg_bytes[-1] | BloxrouteMessageControlFlags.COMPRESSED
+    return compressed_msg_bytes
+
+
+def is_compressed(msg_bytes: Union[bytearray, bytes, memoryview]) -> bool:
+    return bool(msg_bytes[-1] & BloxrouteMessageControlFlags.COMPRESSED)
+
+
+def decompress_message_bytes(
+    msg_bytes: Union[bytearray, bytes, memoryview],
+    max_payload_len: int = constants.MESSAGE_COMPRESSION_MAX_PAYLOAD_LEN_BYTES
+) -> bytearray:
+    """
+    Restores message compressed by `compress_message_bytes`
+
+    :param msg_bytes: compressed message bytes
+    :param max_payload_len: max payload length of decompressed message, including control flags.
+    Protects against decompression bombs, should be the max payload length accepted for the message type.
+    :return: original message bytes
+    """
+    max_decompressed_len = max_payload_len - constants.CONTROL_FLAGS_LEN
+    decompressor = zlib.decompressobj()
+    try:
+        # one extra byte of output detects payloads over the limit
+        payload = decompressor.decompress(
+            msg_bytes[_HEADER_LENGTH:-constants.CONTROL_FLAGS_LEN], max_decompressed_len + 1
+        )
+    except zlib.error as e:
+        raise MessageValidationError(f"Could not decompress message payload: {e}.")
+    if not decompressor.eof or len(payload) > max_decompressed_len:
+        raise MessageValidationError(
+            f"Compressed message payload is truncated or exceeds max payload length of {max_payload_len} bytes."
+        )
+
+    payload_len = len(payload) + constants.CONTROL_FLAGS_LEN
+    decompressed_msg_bytes = bytearray(_HEADER_LENGTH + payload_len)
+    decompressed_msg_bytes[:_HEADER_LENGTH] = msg_bytes[:_HEADER_LENGTH]
+    struct.pack_into("<L", decompressed_msg_bytes, _PAYLOAD_LENGTH_OFFSET, payload_len)
+    decompressed_msg_bytes[_HEADER_LENGTH:-constants.CONTROL_FLAGS_LEN] = payload
+    decompressed_msg_bytes[-1] = msg_bytes[-1] & ~BloxrouteMessageControlFlags.COMPRESSED
+    return decompressed_msg_bytes
@@ -1,5 +1,6 @@
-PROTOCOL_VERSION = 23
+PROTOCOL_VERSION = 24
 
+TX_BATCH_MESSAGE = 24
 SPLIT_RELAYS = 22
 TX_MSG_WITH_ACCOUNT_ID = 21
 EXPOSE_BDN_LOCAL_REGION = 19
@@ -10,6 +11,9 @@ BDN_PERFORMANCE_NEW_BLOCK = 15
 RELAY_BLOCK_CAN_SEND_COMPRESSED_BLOCK_TXS_MESSAGE = 13
 RELAY_BLOCK_CAN_SEND_TXS_MESSAGE = 12
 
+# PROTOCOL_VERSION 24 (10/18/2026)
+# add TxBatchMessage carrying many transactions
+
 # PROTOCOL_VERSION 22 (01/26/2021)
 # add to TxMessage account id
 
@@ -1,44 +1,101 @@
 import struct
-from typing import List, Tuple, Union
+import sys
+from array import array
+from typing import Tuple, Union, Sequence
 
 from bxcommon import constants
+from bxcommon.utils.array_utils import UINT32_TYPE_CODE
+
+_IS_BIG_ENDIAN = sys.byteorder == "big"
 
 
 def get_serialized_length(count: int) -> int:
     return constants.UL_INT_SIZE_IN_BYTES + (count * constants.UL_INT_SIZE_IN_BYTES)
 
 
-def serialize_short_ids_to_buffer(short_ids: List[int], buffer: bytearray, offset: int = 0) -> int:
+def pack_short_ids_into(short_ids: Sequence[int], buffer: Union[bytearray, memoryview], offset: int) -> int:
+    """
+    Writes short ids as little endian unsigned ints, without count prefix
+    :param short_ids: short ids
+    :param buffer: buffer to write to
+    :param offset: offset in the buffer
+    :return: offset after the last written short id
+    """
+    end_offset = offset + len(short_ids) * constants.UL_INT_SIZE_IN_BYTES
+    if UINT32_TYPE_CODE is None:
+        struct.pack_into(f"<{len(short_ids)}L", buffer, offset, *short_ids)
+        return end_offset
+
+    try:
+        short_ids_array = array(UINT32_TYPE_CODE, short_ids)
+    except (OverflowError, TypeError) as e:
+        raise struct.error(f"short ids must be unsigned 32 bit integers: {e}") from e
+    if end_offset > len(buffer):
+        raise struct.error(f"pack_into requires a buffer of at least {end_offset} bytes")
+    if _IS_BIG_ENDIAN:
+        short_ids_array.byteswap()
+    memoryview(buffer)[offset:end_offset] = memoryview(short_ids_array).cast("B")
+    return end_offset
+
+
+def unpack_short_ids_from(
+    buffer: Union[bytearray, bytes, memoryview], offset: int, count: int, as_view: bool = False
+) -> Sequence[int]:
+    """
+    Reads little endian unsigned int short ids, without count prefix
+
+    :param buffer: buffer to read from
+    :param offset: offset in the buffer
+    :param count: number of short ids
+    :param as_view: return a zero copy view of the buffer instead of a list. Buffer cannot be resized while
+    the view is referenced. Falls back to a copy on big endian hosts.
+    :return: short ids
+    """
+    if UINT32_TYPE_CODE is None:
+        return list(struct.unpack_from(f"<{count}L", buffer, offset))
+
+    short_ids_bytes = memoryview(buffer)[offset:offset + count * constants.UL_INT_SIZE_IN_BYTES]
+    if len(short_ids_bytes) != count * constants.UL_INT_SIZE_IN_BYTES:
+        raise struct.error(f"unpack requires a buffer of {count * constants.UL_INT_SIZE_IN_BYTES} bytes")
+
+    if as_view and not _IS_BIG_ENDIAN:
+        return short_ids_bytes.cast("B").cast(UINT32_TYPE_CODE)
+
+    short_ids_array = array(UINT32_TYPE_CODE)
+    short_ids_array.frombytes(short_ids_bytes)
+    if _IS_BIG_ENDIAN:
+        short_ids_array.byteswap()
+    if as_view:
+        return short_ids_array
+    else:
+        return short_ids_array.tolist()
+
+
+def serialize_short_ids_to_buffer(short_ids: Sequence[int], buffer: bytearray, offset: int = 0) -> int:
     struct.pack_into("<L", buffer, offset, len(short_ids))
     offset += constants.UL_INT_SIZE_IN_BYTES
 
-    for short_id in short_ids:
-        struct.pack_into("<L", buffer, offset, short_id)
-        offset += constants.UL_INT_SIZE_IN_BYTES
-
-    return offset
+    return pack_short_ids_into(short_ids, buffer, offset)
 
 
-def serialize_short_ids(short_ids: List[int]) -> bytearray:
+def serialize_short_ids(short_ids: Sequence[int]) -> bytearray:
     serialized_bytes = bytearray(get_serialized_length(len(short_ids)))
     serialize_short_ids_to_buffer(short_ids, serialized_bytes, 0)
     return serialized_bytes
 
 
-def deserialize_short_ids_from_buffer(buffer: Union[bytearray, memoryview], offset: int = 0) -> Tuple[List[int], int]:
-    short_ids = []
-
+def deserialize_short_ids_from_buffer(
+    buffer: Union[bytearray, memoryview], offset: int = 0, as_view: bool = False
+) -> Tuple[Sequence[int], int]:
     short_ids_count, = struct.unpack_from("<L", buffer, offset)
     offset += constants.UL_INT_SIZE_IN_BYTES
 
-    for _ in range(short_ids_count):
-        short_id, = struct.unpack_from("<L", buffer, offset)
-        short_ids.append(short_id)
-        offset += constants.UL_INT_SIZE_IN_BYTES
+    short_ids = unpack_short_ids_from(buffer, offset, short_ids_count, as_view)
+    offset += short_ids_count * constants.UL_INT_SIZE_IN_BYTES
 
     return short_ids, offset
 
 
-def deserialize_short_ids(buffer: Union[bytearray, memoryview]) -> List[int]:
-    short_ids, _ = deserialize_short_ids_from_buffer(buffer, 0)
+def deserialize_short_ids(buffer: Union[bytearray, memoryview], as_view: bool = False) -> Sequence[int]:
+    short_ids, _ = deserialize_short_ids_from_buffer(buffer, 0, as_view)
     return short_ids
@@ -1,11 +1,14 @@
 import struct
-from typing import List, Tuple, Union
+from typing import List, Tuple, Union, Iterator
 
 from bxcommon import constants
 from bxcommon.models.transaction_info import TransactionInfo
 from bxcommon.utils import crypto
 from bxcommon.utils.object_hash import Sha256Hash
 
+# short id, hash and contents length preceding contents of each transaction
+TX_INFO_HEADER = struct.Struct(f"<L{crypto.SHA256_HASH_LEN}sL")
+
 
 def get_serialized_length(transactions_info: List[TransactionInfo]) -> int:
     message_size = constants.UL_INT_SIZE_IN_BYTES + len(transactions_info) * (
@@ -59,7 +62,34 @@ def deserialize_transactions_info_from_buffer(
     offset: int = 0
 ) -> Tuple[List[TransactionInfo], int]:
     txs = []
+    # transactions count is followed by the transactions, if any
+    end_offset = offset + constants.UL_INT_SIZE_IN_BYTES
+    for tx_info, tx_end_offset in _iter_transactions_info_with_offsets(buffer, offset):
+        txs.append(tx_info)
+        end_offset = tx_end_offset
+    return txs, end_offset
+
+
+def iter_transactions_info_from_buffer(
+    buffer: Union[bytearray, memoryview],
+    offset: int = 0
+) -> Iterator[TransactionInfo]:
+    """
+    Lazily deserializes transactions info from buffer, one transaction at a time.
+    Transaction contents are slices of the buffer, so they are not copied if the buffer is a memoryview.
 
+    :param buffer: buffer containing serialized transactions info
+    :param offset: offset in a buffer where serialized transactions info begin
+    :return: iterator over transactions info
+    """
+    for tx_info, _ in _iter_transactions_info_with_offsets(buffer, offset):
+        yield tx_info
+
+
+def _iter_transactions_info_with_offsets(
+    buffer: Union[bytearray, memoryview],
+    offset: int
+) -> Iterator[Tuple[TransactionInfo, int]]:
     txs_count, = struct.unpack_from("<L", buffer, offset)
     offset += constants.UL_INT_SIZE_IN_BYTES
 
@@ -76,9 +106,7 @@ def deserialize_transactions_info_from_buffer(
         tx = buffer[offset:offset + tx_size]
         offset += tx_size
 
-        txs.append(TransactionInfo(tx_hash, tx, tx_sid))
-
-    return txs, offset
+        yield TransactionInfo(tx_hash, tx, tx_sid), offset
 
 
 def deserialize_transactions_info(buffer: Union[bytearray, memoryview]) -> List[TransactionInfo]:
@@ -0,0 +1,127 @@
+import struct
+from typing import Iterator, List, Optional, Union
+
+from bxcommon import constants
+from bxcommon.messages.bloxroute.abstract_bloxroute_message import AbstractBloxrouteMessage
+from bxcommon.messages.bloxroute.bloxroute_message_type import BloxrouteMessageType
+from bxcommon.messages.bloxroute.tx_message import TxMessage
+from bxcommon.utils import crypto
+from bxcommon.utils.buffers.buffer_pool import message_buffer_pool
+from bxutils.logging.log_level import LogLevel
+
+# layout of the same fields in TxMessage bytes
+_TX_HASH_OFFSET = TxMessage.HEADER_LENGTH
+_TX_SOURCE_ID_OFFSET = TxMessage.SOURCE_ID_OFFSET
+_TX_NETWORK_NUM_OFFSET = _TX_HASH_OFFSET + crypto.SHA256_HASH_LEN
+_TX_FIELDS_OFFSET = _TX_SOURCE_ID_OFFSET + constants.NODE_ID_SIZE_IN_BYTES
+_TX_FIELDS_LEN = TxMessage.TX_VAL_OFFSET - _TX_FIELDS_OFFSET
+_TX_MESSAGE_MIN_LEN = TxMessage.TX_VAL_OFFSET + constants.CONTROL_FLAGS_LEN
+
+# tx hash, source id, short id, transaction flag, timestamp and account id, followed by tx contents length
+_ENTRY_SOURCE_ID_OFFSET = crypto.SHA256_HASH_LEN
+_ENTRY_FIELDS_OFFSET = _ENTRY_SOURCE_ID_OFFSET + constants.NODE_ID_SIZE_IN_BYTES
+_ENTRY_CONTENTS_LEN_OFFSET = _ENTRY_FIELDS_OFFSET + _TX_FIELDS_LEN
+_ENTRY_HEADER_LEN = _ENTRY_CONTENTS_LEN_OFFSET + constants.UL_INT_SIZE_IN_BYTES
+
+
+class TxBatchMessage(AbstractBloxrouteMessage):
+    """
+    Many transactions of a single network in one message, to save per message overhead of
+    TxMessage propagation. Each transaction keeps all TxMessage fields, except network number which is
+    shared by the whole batch.
+
+    Payload: network number, transactions count, and for each transaction:
+    tx hash, source id, short id, transaction flag, timestamp, account id, contents length, contents.
+    """
+    MESSAGE_TYPE = BloxrouteMessageType.TX_BATCH
+    TXS_OFFSET = AbstractBloxrouteMessage.HEADER_LENGTH + constants.NETWORK_NUM_LEN + constants.UL_INT_SIZE_IN_BYTES
+
+    def __init__(
+        self,
+        network_num: Optional[int] = None,
+        tx_messages: Optional[List[TxMessage]] = None,
+        buf: Optional[Union[bytearray, memoryview]] = None
+    ) -> None:
+        """
+        Constructor. Expects network number and transaction messages of that network, or message bytes.
+
+        :param network_num: network number of transactions
+        :param tx_messages: transaction messages to batch
+        :param buf: message bytes
+        """
+        if buf is None:
+            assert network_num is not None and tx_messages is not None
+            buf = self._tx_messages_to_bytes(network_num, tx_messages)
+
+        self._network_num: Optional[int] = None
+        self._tx_count: Optional[int] = None
+        # pyre-fixme[6]: Expected `bytearray` for 3rd param but got `Union[bytearray, memoryview]`.
+        super().__init__(self.MESSAGE_TYPE, len(buf) - self.HEADER_LENGTH, buf)
+
+    def __repr__(self) -> str:
+        return f"TxBatchMessage<network_num: {self.network_num()}, tx_count: {self.tx_count()}>"
+
+    def log_level(self) -> LogLevel:
+        return LogLevel.DEBUG
+
+    def network_num(self) -> int:
+        if self._network_num is None:
+            self._unpack()
+        network_num = self._network_num
+        assert network_num is not None
+        return network_num
+
+    def tx_count(self) -> int:
+        if self._tx_count is None:
+            self._unpack()
+        tx_count = self._tx_count
+        assert tx_count is not None
+        return tx_count
+
+    def tx_messages(self) -> Iterator[TxMessage]:
+        """
+        Lazily restores batched transaction messages, one at a time.
+        Each transaction message is copied into its own buffer, so it can be kept after the batch is released.
+        """
+        network_num_bytes = self._memoryview[self.HEADER_LENGTH:self.HEADER_LENGTH + constants.NETWORK_NUM_LEN]
+        buf = self._memoryview
+        off = self.TXS_OFFSET
+        for _ in range(self.tx_count()):
+            contents_len, = struct.unpack_from("<L", buf, off + _ENTRY_CONTENTS_LEN_OFFSET)
+
+            tx_msg_bytes = bytearray(_TX_MESSAGE_MIN_LEN + contents_len)
+            tx_msg_bytes[_TX_HASH_OFFSET:_TX_NETWORK_NUM_OFFSET] = buf[off:off + _ENTRY_SOURCE_ID_OFFSET]
+            tx_msg_bytes[_TX_NETWORK_NUM_OFFSET:_TX_SOURCE_ID_OFFSET] = network_num_bytes
+            tx_msg_bytes[_TX_SOURCE_ID_OFFSET:TxMessage.TX_VAL_OFFSET] = \
+                buf[off + _ENTRY_SOURCE_ID_OFFSET:off + _ENTRY_CONTENTS_LEN_OFFSET]
+            off += _ENTRY_HEADER_LEN
+            tx_msg_bytes[TxMessage.TX_VAL_OFFSET:-constants.CONTROL_FLAGS_LEN] = buf[off:off + contents_len]
+            off += contents_len
+
+            yield TxMessage(buf=tx_msg_bytes)
+
+    def _tx_messages_to_bytes(self, network_num: int, tx_messages: List[TxMessage]) -> bytearray:
+        msg_size = self.TXS_OFFSET + constants.CONTROL_FLAGS_LEN
+        for tx_message in tx_messages:
+            msg_size += _ENTRY_HEADER_LEN + len(tx_message.rawbytes()) - _TX_MESSAGE_MIN_LEN
+
+        buf = message_buffer_pool.allocate(msg_size)
+        struct.pack_into("<LL", buf, self.HEADER_LENGTH, network_num, len(tx_messages))
+        off = self.TXS_OFFSET
+
+        for tx_message in tx_messages:
+            tx_msg_bytes = tx_message.rawbytes()
+            contents_len = len(tx_msg_bytes) - _TX_MESSAGE_MIN_LEN
+
+            buf[off:off + _ENTRY_SOURCE_ID_OFFSET] = tx_msg_bytes[_TX_HASH_OFFSET:_TX_NETWORK_NUM_OFFSET]
+            buf[off + _ENTRY_SOURCE_ID_OFFSET:off + _ENTRY_CONTENTS_LEN_OFFSET] = \
+                tx_msg_bytes[_TX_SOURCE_ID_OFFSET:TxMessage.TX_VAL_OFFSET]
+            struct.pack_into("<L", buf, off + _ENTRY_CONTENTS_LEN_OFFSET, contents_len)
+            off += _ENTRY_HEADER_LEN
+            buf[off:off + contents_len] = tx_msg_bytes[TxMessage.TX_VAL_OFFSET:-constants.CONTROL_FLAGS_LEN]
+            off += contents_len
+
+        return buf
+
+    def _unpack(self) -> None:
+        self._network_num, self._tx_count = struct.unpack_from("<LL", self.buf, self.HEADER_LENGTH)
@@ -1,4 +1,3 @@
-import struct
 from typing import Optional, Union
 
 from bxcommon import constants
@@ -10,9 +9,18 @@ from bxcommon.messages.bloxroute.bloxroute_message_type import (
 )
 from bxcommon.models.quota_type_model import QuotaType
 from bxcommon.models.transaction_flag import TransactionFlag
+from bxcommon.utils.message_buffer_builder import PayloadBlock, PayloadElement
 from bxcommon.utils.object_hash import Sha256Hash
 
 
+def _decode_account_id(account_id: bytes) -> str:
+    return account_id.rstrip(constants.MSG_NULL_BYTE).decode(constants.DEFAULT_TEXT_ENCODING)
+
+
+def _encode_account_id(account_id: str) -> bytes:
+    return account_id.encode(constants.DEFAULT_TEXT_ENCODING)
+
+
 class TxMessage(AbstractBroadcastMessage):
     PAYLOAD_LENGTH = (
         AbstractBroadcastMessage.PAYLOAD_LENGTH
@@ -23,6 +31,35 @@ class TxMessage(AbstractBroadcastMessage):
     )
     MESSAGE_TYPE = BloxrouteMessageType.TRANSACTION
     EMPTY_TX_VAL = memoryview(bytes())
+    # fixed fields following the broadcast message fields, minus control flag
+    TX_MESSAGE_LAYOUT = PayloadBlock(
+        AbstractBroadcastMessage.HEADER_LENGTH
+        + AbstractBroadcastMessage.PAYLOAD_LENGTH
+        - constants.CONTROL_FLAGS_LEN,
+        "TxMessage",
+        0,
+        PayloadElement(name="short_id", structure="<L"),
+        PayloadElement(
+            name="transaction_flag",
+            structure="<H",
+            encode=lambda flag: flag.value,
+            decode=TransactionFlag
+        ),
+        PayloadElement(name="timestamp", structure="<d"),
+        PayloadElement(
+            name="account_id",
+            structure=f"<{constants.ACCOUNT_ID_SIZE_IN_BYTES}s",
+            encode=_encode_account_id,
+            decode=_decode_account_id
+        ),
+    ).layout
+    TX_VAL_OFFSET = TX_MESSAGE_LAYOUT.start_offset + TX_MESSAGE_LAYOUT.size
+    # fixed fields preceding account id are read together on the hot path, account id is decoded on demand
+    _NUMERIC_FIELDS_COUNT = TX_MESSAGE_LAYOUT.names.index("account_id")
+    _SHORT_ID_FIELD = TX_MESSAGE_LAYOUT["short_id"]
+    _TRANSACTION_FLAG_FIELD = TX_MESSAGE_LAYOUT["transaction_flag"]
+    _TIMESTAMP_FIELD = TX_MESSAGE_LAYOUT["timestamp"]
+    _ACCOUNT_ID_FIELD = TX_MESSAGE_LAYOUT["account_id"]
 
     def __init__(
         self,
@@ -51,28 +88,12 @@ class TxMessage(AbstractBroadcastMessage):
         super().__init__(message_hash, network_num, source_id, buf)
 
         if buf is None:
-            # minus control flag
-            off = (
-                self.HEADER_LENGTH
-                + AbstractBroadcastMessage.PAYLOAD_LENGTH
-                - constants.CONTROL_FLAGS_LEN
-            )
-
-            struct.pack_into("<L", self.buf, off, short_id)
-            off += constants.SID_LEN
-
             if transaction_flag is None:
                 transaction_flag = TransactionFlag.NO_FLAGS
-            struct.pack_into("<H", self.buf, off, transaction_flag.value)
-            off += constants.TRANSACTION_FLAG_LEN
-
-            struct.pack_into("<d", self.buf, off, timestamp)
-            off += constants.DOUBLE_SIZE_IN_BYTES
-
-            struct.pack_into("<36s", self.buf, off, account_id.encode(constants.DEFAULT_TEXT_ENCODING))
-            off += constants.ACCOUNT_ID_SIZE_IN_BYTES
+            self.TX_MESSAGE_LAYOUT.pack_into(self.buf, short_id, transaction_flag, timestamp, account_id)
 
             if tx_val is not None:
+                off = self.TX_VAL_OFFSET
                 self.buf[off:off + len(tx_val)] = tx_val
 
     def __repr__(self):
@@ -94,12 +115,7 @@ class TxMessage(AbstractBroadcastMessage):
 
     def short_id(self) -> int:
         if self._short_id is None:
-            off = (
-                self.HEADER_LENGTH
-                + AbstractBroadcastMessage.PAYLOAD_LENGTH
-                - constants.CONTROL_FLAGS_LEN
-            )
-            (self._short_id,) = struct.unpack_from("<L", self.buf, off)
+            self._unpack_fields()
         # pyre-fixme[7]: Expected `int` but got `None`.
         return self._short_id
 
@@ -108,54 +124,25 @@ class TxMessage(AbstractBroadcastMessage):
 
     def transaction_flag(self) -> TransactionFlag:
         if self._transaction_flag is None:
-            off = (
-                self.HEADER_LENGTH
-                + AbstractBroadcastMessage.PAYLOAD_LENGTH
-                + constants.SID_LEN
-                - constants.CONTROL_FLAGS_LEN
-            )
-
-            (transaction_flag, ) = struct.unpack_from("<H", self.buf, off)
-            self._transaction_flag = TransactionFlag(transaction_flag)
-        assert self._transaction_flag is not None
-        return TransactionFlag(self._transaction_flag)
+            self._unpack_fields()
+        transaction_flag = self._transaction_flag
+        assert transaction_flag is not None
+        return transaction_flag
 
     def set_transaction_flag(self, flag: TransactionFlag) -> None:
-        off = (
-            self.HEADER_LENGTH
-            + AbstractBroadcastMessage.PAYLOAD_LENGTH
-            + constants.SID_LEN
-            - constants.CONTROL_FLAGS_LEN
-        )
         self._transaction_flag = flag
-        struct.pack_into("<H", self.buf, off, flag.value)
+        self._TRANSACTION_FLAG_FIELD.set(self.buf, flag)
+        self.clear_converted_messages()
 
     def timestamp(self) -> float:
         if self._timestamp is None:
-            off = (
-                self.HEADER_LENGTH
-                + AbstractBroadcastMessage.PAYLOAD_LENGTH
-                + constants.SID_LEN
-                + constants.TRANSACTION_FLAG_LEN
-                - constants.CONTROL_FLAGS_LEN
-            )
-            (self._timestamp,) = struct.unpack_from("<d", self.buf, off)
+            self._unpack_fields()
         # pyre-fixme[7]: Expected `float` but got `None`.
         return self._timestamp
 
     def account_id(self) -> str:
         if self._account_id == constants.DECODED_EMPTY_ACCOUNT_ID:
-            off = (
-                self.HEADER_LENGTH
-                + AbstractBroadcastMessage.PAYLOAD_LENGTH
-                + constants.SID_LEN
-                + constants.TRANSACTION_FLAG_LEN
-                + constants.DOUBLE_SIZE_IN_BYTES
-                - constants.CONTROL_FLAGS_LEN
-            )
-            self._account_id = struct.unpack_from(
-                "<36s", self.buf, off
-            )[0].rstrip(constants.MSG_NULL_BYTE).decode(constants.DEFAULT_TEXT_ENCODING)
+            self._account_id = self._ACCOUNT_ID_FIELD.get(self.buf)
         return self._account_id
 
     def tx_val(self) -> memoryview:
@@ -163,17 +150,8 @@ class TxMessage(AbstractBroadcastMessage):
             if self.payload_len() == 0:
                 self._tx_val = self.EMPTY_TX_VAL
             else:
-                off = (
-                    self.HEADER_LENGTH
-                    + AbstractBroadcastMessage.PAYLOAD_LENGTH
-                    + constants.SID_LEN
-                    + constants.TRANSACTION_FLAG_LEN
-                    + constants.DOUBLE_SIZE_IN_BYTES
-                    + constants.ACCOUNT_ID_SIZE_IN_BYTES
-                    - constants.CONTROL_FLAGS_LEN
-                )
                 self._tx_val = self._memoryview[
-                    off: self.HEADER_LENGTH
+                    self.TX_VAL_OFFSET: self.HEADER_LENGTH
                     + self.payload_len()
                     - constants.CONTROL_FLAGS_LEN
                 ]
@@ -187,33 +165,17 @@ class TxMessage(AbstractBroadcastMessage):
 
     def set_timestamp(self, timestamp: Union[float, int]):
         self._timestamp = timestamp
-        off = (
-            self.HEADER_LENGTH
-            + AbstractBroadcastMessage.PAYLOAD_LENGTH
-            + constants.SID_LEN
-            + constants.TRANSACTION_FLAG_LEN
-            - constants.CONTROL_FLAGS_LEN
-        )
-        struct.pack_into("<d", self.buf, off, timestamp)
+        self._TIMESTAMP_FIELD.set(self.buf, timestamp)
+        self.clear_converted_messages()
 
     def clear_short_id(self):
-        off = (
-            self.HEADER_LENGTH
-            + AbstractBroadcastMessage.PAYLOAD_LENGTH
-            - constants.CONTROL_FLAGS_LEN
-        )
-        struct.pack_into("<L", self.buf, off, constants.NULL_TX_SID)
+        self._SHORT_ID_FIELD.set(self.buf, constants.NULL_TX_SID)
+        self.clear_converted_messages()
         self._short_id = constants.NULL_TX_SID
 
     def clear_timestamp(self):
-        off = (
-            self.HEADER_LENGTH
-            + AbstractBroadcastMessage.PAYLOAD_LENGTH
-            + constants.SID_LEN
-            + constants.TRANSACTION_FLAG_LEN
-            - constants.CONTROL_FLAGS_LEN
-        )
-        struct.pack_into("<d", self.buf, off, constants.NULL_TX_TIMESTAMP)
+        self._TIMESTAMP_FIELD.set(self.buf, constants.NULL_TX_TIMESTAMP)
+        self.clear_converted_messages()
         self._timestamp = constants.NULL_TX_TIMESTAMP
 
     def clear_protected_fields(self):
@@ -226,3 +188,11 @@ class TxMessage(AbstractBroadcastMessage):
 
     def quota_type(self) -> QuotaType:
         return self.transaction_flag().get_quota_type()
+
+    def _unpack_fields(self) -> None:
+        """
+        Unpacks numeric fixed fields with a single struct call, since they are usually read together.
+        """
+        self._short_id, self._transaction_flag, self._timestamp = self.TX_MESSAGE_LAYOUT.unpack_leading(
+            self.buf, self._NUMERIC_FIELDS_COUNT
+        )
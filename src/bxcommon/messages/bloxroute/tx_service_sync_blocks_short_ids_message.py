@@ -6,6 +6,7 @@ from bxcommon.messages.bloxroute import blocks_short_ids_serializer
 from bxcommon.messages.bloxroute.abstract_bloxroute_message import AbstractBloxrouteMessage
 from bxcommon.messages.bloxroute.blocks_short_ids_serializer import BlockShortIds
 from bxcommon.messages.bloxroute.bloxroute_message_type import BloxrouteMessageType
+from bxcommon.utils.buffers.output_priority import OutputPriority
 from bxutils.logging.log_level import LogLevel
 
 
@@ -48,6 +49,9 @@ class TxServiceSyncBlocksShortIdsMessage(AbstractBloxrouteMessage):
     def log_level(self) -> LogLevel:
         return LogLevel.DEBUG
 
+    def output_priority(self) -> OutputPriority:
+        return OutputPriority.BULK
+
     def network_num(self) -> int:
         if self._network_num is None:
             off = self.HEADER_LENGTH
@@ -1,11 +1,13 @@
 import struct
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Iterator
 
 from bxcommon.constants import UL_INT_SIZE_IN_BYTES, CONTROL_FLAGS_LEN, UL_SHORT_SIZE_IN_BYTES
 from bxcommon.messages.bloxroute import txs_serializer
 from bxcommon.messages.bloxroute.abstract_bloxroute_message import AbstractBloxrouteMessage
 from bxcommon.messages.bloxroute.bloxroute_message_type import BloxrouteMessageType
 from bxcommon.messages.bloxroute.txs_serializer import TxContentShortIds
+from bxcommon.utils.buffers.buffer_pool import message_buffer_pool
+from bxcommon.utils.buffers.output_priority import OutputPriority
 from bxutils.logging.log_level import LogLevel
 
 
@@ -36,7 +38,7 @@ class TxServiceSyncTxsMessage(AbstractBloxrouteMessage):
             self.buf.extend(bytearray(CONTROL_FLAGS_LEN))
         elif txs_buffer is not None and buf is None:
             txs_offset = self.HEADER_LENGTH + UL_INT_SIZE_IN_BYTES +  UL_INT_SIZE_IN_BYTES
-            self.buf = bytearray(txs_offset + len(txs_buffer) + CONTROL_FLAGS_LEN)
+            self.buf = message_buffer_pool.allocate(txs_offset + len(txs_buffer) + CONTROL_FLAGS_LEN)
             # pyre-fixme[8]: Attribute has type `int`; used as `Optional[int]`.
             self._tx_count = tx_count
             struct.pack_into("<LL", self.buf, self.HEADER_LENGTH, self._network_num, self._tx_count)
@@ -53,6 +55,9 @@ class TxServiceSyncTxsMessage(AbstractBloxrouteMessage):
     def log_level(self) -> LogLevel:
         return LogLevel.DEBUG
 
+    def output_priority(self) -> OutputPriority:
+        return OutputPriority.BULK
+
     def network_num(self) -> int:
         if self._network_num is None:
             off = self.HEADER_LENGTH
@@ -69,6 +74,14 @@ class TxServiceSyncTxsMessage(AbstractBloxrouteMessage):
         offset = self.HEADER_LENGTH + UL_INT_SIZE_IN_BYTES + UL_INT_SIZE_IN_BYTES
         return txs_serializer.deserialize_txs_content_short_ids_from_buffer(self._memoryview, offset, self.tx_count())
 
+    def iter_txs_content_short_ids(self) -> Iterator[TxContentShortIds]:
+        """
+        Iterates over transactions as they are parsed, without building the list of all transactions.
+        Transaction contents are views of the message buffer.
+        """
+        offset = self.HEADER_LENGTH + UL_INT_SIZE_IN_BYTES + UL_INT_SIZE_IN_BYTES
+        return txs_serializer.iter_txs_content_short_ids_from_buffer(self._memoryview, offset, self.tx_count())
+
     def __repr__(self) -> str:
         return "{}<network_num: {}, tx_count: {}>".format(self.__class__.__name__, self.network_num(), self.tx_count())
 
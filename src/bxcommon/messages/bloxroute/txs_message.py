@@ -5,6 +5,8 @@ from bxcommon.messages.bloxroute import transactions_info_serializer
 from bxcommon.messages.bloxroute.abstract_bloxroute_message import AbstractBloxrouteMessage
 from bxcommon.messages.bloxroute.bloxroute_message_type import BloxrouteMessageType
 from bxcommon.models.transaction_info import TransactionInfo
+from bxcommon.utils.buffers.buffer_pool import message_buffer_pool
+from bxcommon.utils.buffers.output_priority import OutputPriority
 from bxutils import logging
 from bxutils.logging.log_level import LogLevel
 
@@ -37,6 +39,9 @@ class TxsMessage(AbstractBloxrouteMessage):
     def log_level(self):
         return LogLevel.DEBUG
 
+    def output_priority(self) -> OutputPriority:
+        return OutputPriority.BLOCK
+
     def get_txs(self) -> List[TransactionInfo]:
         if self._txs is None:
             self._parse()
@@ -53,7 +58,7 @@ class TxsMessage(AbstractBloxrouteMessage):
             + constants.CONTROL_FLAGS_LEN
         )
 
-        buf = bytearray(msg_size)
+        buf = message_buffer_pool.allocate(msg_size)
         off = self.HEADER_LENGTH
 
         transactions_info_serializer.serialize_transactions_info_to_buffer(txs_details, buf, off)
@@ -1,5 +1,5 @@
 import struct
-from typing import NamedTuple, Optional, List, Union
+from typing import NamedTuple, Optional, List, Union, Iterator
 
 from bxcommon import constants
 from bxcommon.models.transaction_flag import TransactionFlag
@@ -116,8 +116,21 @@ def deserialize_txs_content_short_ids_from_buffer(
     :param tx_count: how many txs to deserialize
     :return: list of txs content short ids
     """
+    return list(iter_txs_content_short_ids_from_buffer(buffer, offset, tx_count))
 
-    txs_content_short_ids: List[TxContentShortIds] = []
+
+def iter_txs_content_short_ids_from_buffer(
+    buffer: Union[bytearray, memoryview], offset: int, tx_count: int
+) -> Iterator[TxContentShortIds]:
+    """
+    Lazily deserializes txs content short ids from buffer, one transaction at a time.
+    Transaction contents are slices of the buffer, so they are not copied if the buffer is a memoryview.
+
+    :param buffer: buffer containing serialized txs content short ids bytes
+    :param offset: offset in a buffer where serialized txs content short ids begin
+    :param tx_count: how many txs to deserialize
+    :return: iterator over txs content short ids
+    """
     for _ in range(tx_count):
         tx_hash = Sha256Hash(buffer[offset:offset + SHA256_HASH_LEN])
         offset = offset + SHA256_HASH_LEN
@@ -129,16 +142,11 @@ def deserialize_txs_content_short_ids_from_buffer(
         short_ids_count, = struct.unpack_from("<H", buffer, offset)
         offset += constants.UL_SHORT_SIZE_IN_BYTES
 
-        short_ids = []
-        short_id_flags = []
-        for _ in range(short_ids_count):
-            short_id, = struct.unpack_from("<L", buffer, offset)
-            short_ids.append(short_id)
-            offset += constants.SID_LEN
-        for _ in range(short_ids_count):
-            short_id_flag, = struct.unpack_from("<H", buffer, offset)
-            short_id_flags.append(TransactionFlag(short_id_flag))
-            offset += constants.TRANSACTION_FLAG_LEN
-        txs_content_short_ids.append(TxContentShortIds(tx_hash, tx_content, short_ids, short_id_flags))
-
-    return txs_content_short_ids
+        short_ids = list(struct.unpack_from(f"<{short_ids_count}L", buffer, offset))
+        offset += constants.SID_LEN * short_ids_count
+        short_id_flags = [
+            TransactionFlag(short_id_flag)
+            for short_id_flag in struct.unpack_from(f"<{short_ids_count}H", buffer, offset)
+        ]
+        offset += constants.TRANSACTION_FLAG_LEN * short_ids_count
+        yield TxContentShortIds(tx_hash, tx_content, short_ids, short_id_flags)
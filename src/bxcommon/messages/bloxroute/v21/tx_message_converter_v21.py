@@ -1,6 +1,10 @@
+import struct
 from typing import cast
 
+from bxcommon import constants
 from bxcommon.messages.abstract_internal_message import AbstractInternalMessage
+from bxcommon.messages.bloxroute.abstract_bloxroute_message import AbstractBloxrouteMessage
+from bxcommon.messages.bloxroute.abstract_broadcast_message import AbstractBroadcastMessage
 from bxcommon.messages.bloxroute.bloxroute_message_type import BloxrouteMessageType
 from bxcommon.messages.bloxroute.tx_message import TxMessage
 from bxcommon.messages.bloxroute.v21.tx_message_v21 import TxMessageV21
@@ -20,6 +24,17 @@ class _TxMessageConverterV21(AbstractMessageConverter):
         BloxrouteMessageType.TRANSACTION: TxMessage
     }
 
+    # v21 transaction message has no account id, fields before and after it are copied as is
+    _LEFT_BREAKPOINT = (
+        AbstractBroadcastMessage.HEADER_LENGTH
+        + AbstractBroadcastMessage.PAYLOAD_LENGTH
+        - constants.CONTROL_FLAGS_LEN
+        + constants.SID_LEN
+        + constants.TRANSACTION_FLAG_LEN
+        + constants.DOUBLE_SIZE_IN_BYTES
+    )
+    _RIGHT_BREAKPOINT = _LEFT_BREAKPOINT + constants.ACCOUNT_ID_SIZE_IN_BYTES
+
     def convert_from_older_version(
         self, msg: AbstractInternalMessage
     ) -> AbstractInternalMessage:
@@ -62,24 +77,24 @@ class _TxMessageConverterV21(AbstractMessageConverter):
                 f"message type to v21: {msg_type}"
             )
 
-        msg = cast(TxMessage, msg)
+        msg_bytes = msg.rawbytes()
+        old_version_payload_len = msg.payload_len() - constants.ACCOUNT_ID_SIZE_IN_BYTES
 
-        tx_hash = msg.tx_hash()
-        network_num = msg.network_num()
-        source_id = msg.source_id()
-        short_id = msg.short_id()
-        tx_val = msg.tx_val()
-        transaction_flag = msg.transaction_flag()
-        ts = msg.timestamp()
+        old_version_msg_bytes = bytearray(len(msg_bytes) - constants.ACCOUNT_ID_SIZE_IN_BYTES)
+        old_version_msg_bytes[:self._LEFT_BREAKPOINT] = msg_bytes[:self._LEFT_BREAKPOINT]
+        old_version_msg_bytes[self._LEFT_BREAKPOINT:] = msg_bytes[self._RIGHT_BREAKPOINT:]
 
-        return TxMessageV21(
-            message_hash=tx_hash,
-            network_num=network_num,
-            source_id=source_id,
-            short_id=short_id,
-            tx_val=tx_val,
-            transaction_flag=transaction_flag,
-            timestamp=ts
+        struct.pack_into(
+            "<12sL",
+            old_version_msg_bytes,
+            AbstractBloxrouteMessage.STARTING_BYTES_LEN,
+            msg_type,
+            old_version_payload_len,
+        )
+        return AbstractBloxrouteMessage.initialize_class(
+            TxMessageV21,
+            old_version_msg_bytes,
+            (msg_type, old_version_payload_len),
         )
 
     def convert_first_bytes_to_older_version(
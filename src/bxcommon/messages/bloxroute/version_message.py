@@ -1,5 +1,6 @@
 from bxcommon import constants
 from bxcommon.messages.bloxroute.abstract_bloxroute_message import AbstractBloxrouteMessage
+from bxcommon.utils.buffers.output_priority import OutputPriority
 from bxcommon.utils.message_buffer_builder import PayloadElement, PayloadBlock
 
 
@@ -38,6 +39,9 @@ class VersionMessage(AbstractBloxrouteMessage):
         self._protocol_version = contents.get("protocol_version")
         self._network_num = contents.get("network_num")
 
+    def output_priority(self) -> OutputPriority:
+        return OutputPriority.CONTROL
+
     def protocol_version(self):
         if self._protocol_version is None:
             self.__unpack()
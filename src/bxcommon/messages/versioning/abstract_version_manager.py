@@ -1,11 +1,12 @@
 import struct
 from abc import ABCMeta
+from typing import Dict, Tuple
 
 from bxcommon import constants
 from bxcommon.constants import VERSION_NUM_LEN
 from bxcommon.messages.bloxroute.abstract_bloxroute_message import AbstractBloxrouteMessage
-from bxcommon.messages.bloxroute.tx_message import TxMessage
 from bxcommon.messages.bloxroute.version_message import VersionMessage
+from bxcommon.messages.versioning.abstract_message_converter import AbstractMessageConverter
 from bxcommon.messages.versioning.nonversion_message_error import NonVersionMessageError
 from bxcommon.utils.buffers.input_buffer import InputBuffer
 from bxutils import log_messages
@@ -25,6 +26,8 @@ class AbstractVersionManager:
         self.protocol_to_factory_mapping = {}
         self.protocol_to_converter_factory_mapping = {}
         self.version_message_command = ""
+        # converters resolved from converter factories, by protocol version and message type
+        self._message_converters: Dict[Tuple[int, bytes], AbstractMessageConverter] = {}
 
     def is_protocol_supported(self, protocol_version):
         return protocol_version >= self.MIN_SUPPORTED_PROTOCOL_VERSION
@@ -46,7 +49,8 @@ class AbstractVersionManager:
 
     def convert_message_to_older_version(self, convert_to_version: int, msg: AbstractBloxrouteMessage):
         """
-        Converts message from current version to provided version
+        Converts message from current version to provided version. Converted messages are cached on the
+        original message, so a message broadcast to many peers is converted once per protocol version.
 
         :param convert_to_version: version to convert to
         :param msg: message
@@ -61,9 +65,8 @@ class AbstractVersionManager:
         if convert_to_version not in self.protocol_to_converter_factory_mapping:
             raise ValueError("Conversion for version {} is not supported".format(convert_to_version))
 
-        if isinstance(msg, TxMessage) and convert_to_version in msg.converted_message:
-            converted_msg = msg.converted_message[convert_to_version]
-        else:
+        converted_msg = msg.converted_message.get(convert_to_version)
+        if converted_msg is None:
             msg_converter = self._get_message_converter(convert_to_version, msg.msg_type())
             converted_msg = msg_converter.convert_to_older_version(msg)
             msg.converted_message[convert_to_version] = converted_msg
@@ -266,6 +269,11 @@ class AbstractVersionManager:
         version, = struct.unpack_from("<L", version_buf, 0)
         return version
 
-    def _get_message_converter(self, version, msg_type):
-        msg_converter_factory = self.protocol_to_converter_factory_mapping[version]
-        return msg_converter_factory.get_message_converter(msg_type)
+    def _get_message_converter(self, version, msg_type) -> AbstractMessageConverter:
+        converter_key = (version, msg_type)
+        msg_converter = self._message_converters.get(converter_key)
+        if msg_converter is None:
+            msg_converter_factory = self.protocol_to_converter_factory_mapping[version]
+            msg_converter = msg_converter_factory.get_message_converter(msg_type)
+            self._message_converters[converter_key] = msg_converter
+        return msg_converter
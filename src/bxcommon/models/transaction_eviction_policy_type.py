@@ -0,0 +1,7 @@
+from bxcommon.models.serializeable_enum import SerializeableEnum
+
+
+class TransactionEvictionPolicyType(SerializeableEnum):
+    OLDEST_FIRST = "oldest_first"
+    LARGEST_FIRST = "largest_first"
+    FLAG_AWARE = "flag_aware"
@@ -12,3 +12,10 @@ class TransactionInfo(NamedTuple):
 class TransactionSearchResult(NamedTuple):
     found: List[TransactionInfo]
     missing: List[TransactionInfo]
+
+
+class SerializedTransactionSearchResult(NamedTuple):
+    # found transactions in transactions info format, ready to be copied into CompressedBlockTxsMessage
+    found_txs_bytes: Union[bytearray, memoryview]
+    found_count: int
+    missing: List[TransactionInfo]
@@ -15,6 +15,14 @@ from bxutils import logging
 from bxutils.logging import LogRecordType
 from bxutils.ssl import ssl_certificate_factory
 
+try:
+    from uvloop.loop import TCPTransport as UvloopTCPTransport
+    # transports sending `writelines` buffers with a single vectored write, without joining them first.
+    # SSL transports and the stock asyncio transport copy the buffers into one.
+    VECTORED_WRITE_TRANSPORT_TYPES: typing.Tuple[type, ...] = (UvloopTCPTransport,)
+except ImportError:
+    VECTORED_WRITE_TRANSPORT_TYPES = ()
+
 if TYPE_CHECKING:
     # pylint: disable=ungrouped-imports,cyclic-import
     from bxcommon.connections.abstract_node import AbstractNode
@@ -32,10 +40,10 @@ class AbstractSocketConnectionProtocol(BaseProtocol):
     can_send: bool
     state: SocketConnectionState
     is_ssl: bool
+    vectored_writes: bool
 
     _node: "AbstractNode"
     _should_retry: bool
-    _receive_buf: bytearray
 
     # performance critical attributes, have been pulled out of state
     alive: bool
@@ -60,9 +68,9 @@ class AbstractSocketConnectionProtocol(BaseProtocol):
         self.can_send = False
         self.state = SocketConnectionStates.CONNECTING
         self.is_ssl = is_ssl
+        self.vectored_writes = False
         self._should_retry = self.direction == NetworkDirection.OUTBOUND
         self._initial_bytes = None
-        self._receive_buf = bytearray(node.opts.receive_buffer_size)
 
         self.alive = True
         self.initialized = False
@@ -72,6 +80,7 @@ class AbstractSocketConnectionProtocol(BaseProtocol):
 
     def connection_made(self, transport: BaseTransport) -> None:
         self.transport = typing.cast(Transport, transport)
+        self.vectored_writes = isinstance(transport, VECTORED_WRITE_TRANSPORT_TYPES)
 
         sock = transport.get_extra_info("socket")
         self.file_no = sock.fileno()
@@ -122,8 +131,12 @@ class AbstractSocketConnectionProtocol(BaseProtocol):
         logger.debug("[{}] - resumed writing.", self)
 
     def send(self) -> None:
-        # TODO: send should buffer together multiple pending buffers and write\
-        #  them together to the Transport.
+        """
+        Writes pending output messages of the connection to the transport, as many as fit under the transport
+        high water mark at once, until the transport pauses writing or there are no more messages.
+        Multiple messages are written with a single `writelines` call only if the transport does vectored writes,
+        other transports would copy them into one buffer, so they are written one by one.
+        """
         total_bytes_sent = 0
 
         conn = self._node.connection_pool.get_by_fileno(self.file_no)
@@ -131,27 +144,34 @@ class AbstractSocketConnectionProtocol(BaseProtocol):
         if not conn:
             return
 
+        transport = self.transport
+        assert transport is not None, "Connection is broken!"
+        # pyre-fixme[16]: `Transport` has no attribute `get_write_buffer_limits`.
+        _low_water_mark, high_water_mark = transport.get_write_buffer_limits()
+
         while self.is_sendable():
-            data = conn.get_bytes_to_send()
-            if not data:
+            # note: transport accepts any length of data, even if data is crossing the buffer high limit
+            #       (will cause a pause), so at least one message is written
+            write_buffer_size = transport.get_write_buffer_size()
+            buffers = conn.get_buffers_to_send(high_water_mark - write_buffer_size)
+            if not buffers:
                 break
 
-            transport = self.transport
-            assert transport is not None, "Connection is broken!"
-            # note: transport.write() is non blocking and accepts any length of data
-            #       even if data is crossing the buffer high limit (will cause a pause)
-            bytes_to_send = len(data)
-            # pyre-fixme[16]: `Transport` has no attribute `get_write_buffer_limits`.
-            buffer_limits = transport.get_write_buffer_limits()
+            bytes_to_send = sum(len(buffer) for buffer in buffers)
             logger.trace(
-                "[{}] - about to send {} bytes, current buffer used {} with limits {}",
+                "[{}] - about to send {} bytes in {} buffers, current buffer used {} with high limit {}",
                 self,
                 bytes_to_send,
-                transport.get_write_buffer_size(),
-                buffer_limits
+                len(buffers),
+                write_buffer_size,
+                high_water_mark
             )
-            transport.write(data)
-            conn.advance_sent_bytes(bytes_to_send)
+            if self.vectored_writes and len(buffers) > 1:
+                transport.writelines(buffers)
+            else:
+                for buffer in buffers:
+                    transport.write(buffer)
+            conn.advance_sent_buffers(bytes_to_send)
             total_bytes_sent += bytes_to_send
 
         if total_bytes_sent:
@@ -2,10 +2,11 @@ import asyncio
 import functools
 import signal
 import socket
-from asyncio import CancelledError, Future
+import threading
+from asyncio import CancelledError, TimerHandle
 from asyncio.events import AbstractServer
 from ssl import SSLContext
-from typing import Iterator, List, Coroutine, Generator, Callable, Awaitable, Optional
+from typing import Iterator, List, Coroutine, Generator, Optional
 
 from bxcommon import constants
 from bxcommon.connections.abstract_node import AbstractNode
@@ -22,20 +23,14 @@ from bxutils import logging, constants as utils_constants
 logger = logging.get_logger(__name__)
 
 
-async def run_until_other_completed(
-    callback: Callable[..., Awaitable], tsk_future: Future, wait_future: Future
-) -> None:
-    done = False
-    future_to_set: Optional[Future] = tsk_future
-    while not done:
-        await callback()
-        done = wait_future.done()
-        if future_to_set is not None:
-            future_to_set.set_result(True)
-            future_to_set = None
-
-
 class NodeEventLoop:
+    """
+    Runs node on asyncio event loop.
+
+    Alarms are fired by a timer scheduled on the event loop for the next alarm fire time, which is moved
+    earlier when an earlier alarm is registered. Connection requests wake up the event loop through an event,
+    so an idle node is not woken up until its next alarm.
+    """
     _node: AbstractNode
     _stop_requested: bool
 
@@ -43,7 +38,13 @@ class NodeEventLoop:
         self._node = node
         self._stop_requested = False
         loop = asyncio.get_event_loop()
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
         self._started = loop.create_future()
+        self._wakeup_event = asyncio.Event()
+        self._alarm_timer: Optional[TimerHandle] = None
+        self._firing_alarms = False
+        self._alarms_error: Optional[Exception] = None
         loop.add_signal_handler(signal.SIGTERM, self.stop)
         loop.add_signal_handler(signal.SIGINT, self.stop)
         loop.add_signal_handler(signal.SIGSEGV, self.stop)
@@ -73,6 +74,7 @@ class NodeEventLoop:
         logger.info("Stopping node event loop due to a termination request.")
         self._node.should_force_exit = True
         self._stop_requested = True
+        self._wakeup_event.set()
 
     async def wait_started(self) -> None:
         if self._started is not None:
@@ -83,21 +85,29 @@ class NodeEventLoop:
         node_servers = await self._create_servers()
         try:
             await self._node.init()
-            loop = asyncio.get_event_loop()
             await self._connect_to_peers()
-            self._node.fire_alarms()
+            self._node.alarm_queue.next_alarm_listener = self._on_next_alarm_changed
+            self._node.connection_requests_listener = self._wakeup_event.set
+            if self._node.pending_connection_requests:
+                self._wakeup_event.set()
+            self._fire_alarms()
+            if self._alarms_error is not None:
+                raise self._alarms_error
             self._started.set_result(True)
             while not self._stop_requested:
-                node_future = loop.create_future()
-                connection_future = loop.create_future()
-                await asyncio.gather(
-                    run_until_other_completed(self._perform_node_tasks, node_future, connection_future),
-                    run_until_other_completed(self._process_new_connections_requests, connection_future, node_future)
-                )
+                await self._wakeup_event.wait()
+                self._wakeup_event.clear()
+                alarms_error = self._alarms_error
+                if alarms_error is not None:
+                    raise alarms_error
                 if self._node.force_exit():
                     logger.info("Ending event loop. Shutdown has been requested.")
                     break
+                await self._process_new_connections_requests()
         finally:
+            self._node.alarm_queue.next_alarm_listener = None
+            self._node.connection_requests_listener = None
+            self._cancel_alarm_timer()
             await self.close()
             for server in node_servers:
                 server.close()
@@ -108,8 +118,6 @@ class NodeEventLoop:
         peers_info = self._node.dequeue_connection_requests()
         if peers_info is not None:
             await asyncio.gather(*self._gather_connections(iter(peers_info)))
-        else:
-            await asyncio.sleep(constants.MAX_EVENT_LOOP_TIMEOUT)
 
     async def _connect_to_peers(self) -> None:
         connection_futures = self._gather_connections(self._iter_outbound_peers())
@@ -202,14 +210,55 @@ class NodeEventLoop:
         else:
             return None
 
-    async def _perform_node_tasks(self) -> None:
-        timeout = self._node.fire_alarms()
-        self._node.flush_all_send_buffers()
-        if timeout is None or timeout < 0:
-            timeout = constants.MAX_EVENT_LOOP_TIMEOUT
+    def _fire_alarms(self) -> None:
+        """
+        Fires ready alarms, then schedules the timer for the next alarm.
+        """
+        self._alarm_timer = None
+        self._firing_alarms = True
+        try:
+            self._node.fire_alarms()
+        except Exception as e:  # pylint: disable=broad-except
+            # raised from the event loop coroutine, as if alarms were fired there
+            self._alarms_error = e
+            self._wakeup_event.set()
+            return
+        finally:
+            self._firing_alarms = False
+
+        self._schedule_alarm_timer()
+        if self._node.force_exit():
+            self._wakeup_event.set()
+
+    def _schedule_alarm_timer(self) -> None:
+        time_to_next_alarm = self._node.alarm_queue.time_to_next_alarm()
+        if time_to_next_alarm is None:
+            self._cancel_alarm_timer()
+            return
+
+        loop = self._loop
+        fire_time = loop.time() + max(time_to_next_alarm, 0)
+        alarm_timer = self._alarm_timer
+        if alarm_timer is not None:
+            if alarm_timer.when() <= fire_time:
+                return
+            alarm_timer.cancel()
+        self._alarm_timer = loop.call_at(fire_time, self._fire_alarms)
+
+    def _cancel_alarm_timer(self) -> None:
+        alarm_timer = self._alarm_timer
+        if alarm_timer is not None:
+            alarm_timer.cancel()
+            self._alarm_timer = None
+
+    def _on_next_alarm_changed(self) -> None:
+        # alarms registered while firing alarms are scheduled once firing is done
+        if self._firing_alarms:
+            return
+        if threading.get_ident() == self._loop_thread_id:
+            self._schedule_alarm_timer()
         else:
-            timeout = min(timeout, constants.MAX_EVENT_LOOP_TIMEOUT)
-        await asyncio.sleep(timeout)
+            self._loop.call_soon_threadsafe(self._schedule_alarm_timer)
 
     def _protocol_factory(
         self,
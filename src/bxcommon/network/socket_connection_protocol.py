@@ -2,6 +2,7 @@ import time
 from asyncio import BufferedProtocol
 from typing import Optional, TYPE_CHECKING
 
+from bxcommon import constants
 from bxcommon.network.abstract_socket_connection_protocol import AbstractSocketConnectionProtocol
 from bxcommon.network.ip_endpoint import IpEndpoint
 from bxutils import logging
@@ -27,18 +28,31 @@ class SocketConnectionProtocol(AbstractSocketConnectionProtocol, BufferedProtoco
         AbstractSocketConnectionProtocol.__init__(self, node, endpoint, is_ssl)
         self._buffer_request_time: Optional[float] = None
         self._buffer_update_time: Optional[float] = None
+        # bytes read while the connection is not in the pool are discarded
+        self._discard_buf: Optional[bytearray] = None
 
     # pylint: disable=arguments-differ
     def get_buffer(self, _sizehint: int):
         self._buffer_request_time = time.time()
         logger.trace("[{}] - get_buffer {}.", self, _sizehint)
-        return self._receive_buf
+        receive_buffer_size = self._node.opts.receive_buffer_size
+        # input buffer grows with the size of the pending message, a read gets all of its free space
+        receive_buf = self._node.get_receive_buffer(
+            self.file_no, min(receive_buffer_size, constants.INPUT_BUFFER_BASELINE_SIZE)
+        )
+        if receive_buf is None:
+            discard_buf = self._discard_buf
+            if discard_buf is None:
+                discard_buf = bytearray(receive_buffer_size)
+                self._discard_buf = discard_buf
+            return discard_buf
+        return receive_buf
 
     def buffer_updated(self, nbytes: int) -> None:
         if self.is_receivable():
             self._buffer_update_time = time.time()
             logger.trace("[{}] - buffer_updated {}.", self, nbytes)
-            self._node.on_bytes_received(self.file_no, self._receive_buf[:nbytes])
+            self._node.on_bytes_received_into_buffer(self.file_no, nbytes)
 
     def get_last_read_duration_ms(self) -> float:
         if self._buffer_request_time and self._buffer_update_time:
@@ -22,10 +22,50 @@ def contents_cleanup(
 ):
     start_datetime = datetime.utcnow()
     start_time = time.time()
+    cleanup_task = _init_cleanup_task(transaction_service, block_confirmation_message, cleanup_tasks)
+    task_pool_proxy.run_task(cleanup_task)
+    _finish_cleanup_task(
+        transaction_service, block_confirmation_message, cleanup_tasks, cleanup_task, start_datetime, start_time
+    )
+
+
+async def contents_cleanup_async(
+    transaction_service: TransactionService,
+    block_confirmation_message: AbstractCleanupMessage,
+    cleanup_tasks
+):
+    """
+    Same as `contents_cleanup`, but lets the event loop process network events while the cleanup task runs
+    """
+    start_datetime = datetime.utcnow()
+    start_time = time.time()
+    cleanup_task = _init_cleanup_task(transaction_service, block_confirmation_message, cleanup_tasks)
+    await task_pool_proxy.run_task_async(cleanup_task)
+    _finish_cleanup_task(
+        transaction_service, block_confirmation_message, cleanup_tasks, cleanup_task, start_datetime, start_time
+    )
+
+
+def _init_cleanup_task(
+    transaction_service: TransactionService,
+    block_confirmation_message: AbstractCleanupMessage,
+    cleanup_tasks
+):
     tx_service = typing.cast(ExtensionTransactionService, transaction_service)
     cleanup_task = cleanup_tasks.borrow_task()
     cleanup_task.init(tpe.InputBytes(block_confirmation_message.buf), tx_service.proxy)
-    task_pool_proxy.run_task(cleanup_task)
+    return cleanup_task
+
+
+def _finish_cleanup_task(
+    transaction_service: TransactionService,
+    block_confirmation_message: AbstractCleanupMessage,
+    cleanup_tasks,
+    cleanup_task,
+    start_datetime: datetime,
+    start_time: float
+):
+    tx_service = typing.cast(ExtensionTransactionService, transaction_service)
     short_ids = cleanup_task.short_ids()
     total_content_removed = cleanup_task.total_content_removed()
     tx_count = cleanup_task.tx_count()
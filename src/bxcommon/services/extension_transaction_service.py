@@ -1,7 +1,7 @@
 import struct
 import time
 from datetime import datetime
-from typing import Any, List, Union, Optional
+from typing import Any, List, Union, Optional, Tuple, Iterable
 
 import task_pool_executor as tpe
 
@@ -9,7 +9,11 @@ from bxcommon import constants
 from bxcommon.messages.bloxroute import transactions_info_serializer
 from bxcommon.messages.bloxroute.tx_service_sync_txs_message import TxServiceSyncTxsMessage
 from bxcommon.models.transaction_flag import TransactionFlag
-from bxcommon.models.transaction_info import TransactionSearchResult, TransactionInfo
+from bxcommon.models.transaction_info import (
+    TransactionSearchResult,
+    TransactionInfo,
+    SerializedTransactionSearchResult
+)
 from bxcommon.models.transaction_key import TransactionKey, TransactionCacheKeyType
 from bxcommon.services.transaction_service import TransactionService, TxSyncMsgProcessingItem
 from bxcommon.services.transaction_service import TxRemovalReason
@@ -79,19 +83,21 @@ class ExtensionTransactionService(TransactionService):
         result = self.proxy.track_seen_short_ids(wrapped_block_hash, tpe.UIntList(short_ids))
         removed_contents_size, dup_sids = result
         self.update_removed_transactions(removed_contents_size, dup_sids)
-        logger_memory_cleanup.statistics(
-            {
-                "type": "MemoryCleanup",
-                "event": "ExtensionTransactionServiceTrackSeenSummary",
-                "seen_short_ids_count": len(short_ids),
-                "total_content_size_removed": removed_contents_size,
-                "total_duplicate_short_ids": len(dup_sids),
-                "proxy_call_datetime": proxy_start_datetime,
-                "data": self.get_cache_state_json(),
-                "start_datetime": start_datetime,
-                "block_hash": repr(block_hash)
-            }
-        )
+        # with sliced clean up, cache state is logged once the queued clean up is complete
+        if self._block_cleanup_time_budget_s <= 0:
+            logger_memory_cleanup.statistics(
+                {
+                    "type": "MemoryCleanup",
+                    "event": "ExtensionTransactionServiceTrackSeenSummary",
+                    "seen_short_ids_count": len(short_ids),
+                    "total_content_size_removed": removed_contents_size,
+                    "total_duplicate_short_ids": len(dup_sids),
+                    "proxy_call_datetime": proxy_start_datetime,
+                    "data": self.get_cache_state_json(),
+                    "start_datetime": start_datetime,
+                    "block_hash": repr(block_hash)
+                }
+            )
 
     def set_final_tx_confirmations_count(self, val: int):
         super(ExtensionTransactionService, self).set_final_tx_confirmations_count(val)
@@ -110,14 +116,14 @@ class ExtensionTransactionService(TransactionService):
 
     def update_removed_transactions(self, removed_content_size: int, short_ids: List[int]) -> None:
         self._total_tx_contents_size -= removed_content_size
+        if self._block_cleanup_time_budget_s > 0:
+            self._queue_block_cleanup(short_ids, TxRemovalReason.EXTENSION_BLOCK_CLEANUP)
+            return
+
         for short_id in short_ids:
-            tx_stats.add_tx_by_hash_event(
-                UNKNOWN_TRANSACTION_HASH, TransactionStatEventType.TX_REMOVED_FROM_MEMORY,
-                self.network_num, short_id, reason=TxRemovalReason.EXTENSION_BLOCK_CLEANUP.value
+            self.remove_transaction_by_short_id(
+                short_id, remove_related_short_ids=True, removal_reason=TxRemovalReason.EXTENSION_BLOCK_CLEANUP
             )
-            self._tx_assignment_expire_queue.remove(short_id)
-            if self.node.opts.dump_removed_short_ids:
-                self._removed_short_ids.add(short_id)
 
     @deprecated
     def assign_short_id(
@@ -180,6 +186,31 @@ class ExtensionTransactionService(TransactionService):
             len(transaction_contents)
         )
 
+    def _add_transaction_batch_item(
+        self,
+        transaction_key: TransactionKey,
+        short_id: Optional[int],
+        transaction_contents: Optional[Union[bytearray, memoryview]]
+    ) -> Tuple[bool, bool, int]:
+        has_short_id = False
+        has_contents = False
+        previous_size = 0
+
+        if transaction_contents is not None:
+            has_short_id, previous_size = self.proxy.set_transaction_contents(
+                # pyre-fixme[6]: Expected `tpe.Sha256` got `TransactionCacheKeyType`.
+                transaction_key.transaction_cache_key,
+                tpe.InputBytes(transaction_contents)
+            )
+            has_contents = True
+
+        if short_id is not None:
+            # pyre-fixme[6]: Expected `tpe.Sha256` got `TransactionCacheKeyType`.
+            has_contents = self.proxy.assign_short_id(transaction_key.transaction_cache_key, short_id)
+            has_short_id = True
+
+        return has_short_id, has_contents, previous_size
+
     def get_transactions(
         self,
         serialized_short_ids: Optional[bytearray] = None
@@ -191,6 +222,20 @@ class ExtensionTransactionService(TransactionService):
         :param serialized_short_ids: instance of get transactions message
         :return: list of found and missing short ids
         """
+        found_txs_bytes, _, missing_txs_info = self.get_serialized_transactions(serialized_short_ids)
+        found_txs_info = transactions_info_serializer.deserialize_transactions_info(found_txs_bytes)
+        return TransactionSearchResult(found_txs_info, missing_txs_info)
+
+    def get_serialized_transactions(
+        self,
+        serialized_short_ids: Optional[bytearray] = None
+    ) -> SerializedTransactionSearchResult:
+        """
+        Fetches all transaction info for a set of short ids.
+        Found transactions are returned as a view of the extension result bytes, no parsing is done.
+        :param serialized_short_ids: serialized list of short ids
+        :return: serialized found transactions and list of missing short ids
+        """
 
         assert serialized_short_ids is not None
         input_bytes = tpe.InputBytes(serialized_short_ids)
@@ -202,8 +247,7 @@ class ExtensionTransactionService(TransactionService):
         found_txs_size, = struct.unpack_from("<L", result_memory_view, 0)
 
         txs_bytes = result_memory_view[constants.UL_INT_SIZE_IN_BYTES:constants.UL_INT_SIZE_IN_BYTES + found_txs_size]
-        found_txs_info = transactions_info_serializer \
-            .deserialize_transactions_info(txs_bytes)
+        found_txs_count, = struct.unpack_from("<L", txs_bytes, 0)
 
         missing_txs_info = []
         offset = constants.UL_INT_SIZE_IN_BYTES + found_txs_size
@@ -226,9 +270,9 @@ class ExtensionTransactionService(TransactionService):
 
             missing_txs_info.append(TransactionInfo(tx_hash, None, tx_sid))
 
-        return TransactionSearchResult(found_txs_info, missing_txs_info)
+        return SerializedTransactionSearchResult(txs_bytes, found_txs_count, missing_txs_info)
 
-    def process_tx_sync_message(self, msg: TxServiceSyncTxsMessage) -> List[TxSyncMsgProcessingItem]:
+    def process_tx_sync_message(self, msg: TxServiceSyncTxsMessage) -> Iterable[TxSyncMsgProcessingItem]:
         input_bytes = tpe.InputBytes(msg.rawbytes())
         result_bytes = self.proxy.process_tx_sync_message(input_bytes)
 
@@ -292,15 +336,23 @@ class ExtensionTransactionService(TransactionService):
         super(ExtensionTransactionService, self).log_tx_service_mem_stats(include_data_structure_memory)
 
         if include_data_structure_memory:
+            if self.node.opts.incremental_memory_stats:
+                size_type = SizeType.ESTIMATE
+            else:
+                size_type = SizeType.OBJECT
             hooks.add_obj_mem_stats(
                 self.__class__.__name__,
                 self.network_num,
                 self._tx_not_seen_in_blocks,
                 "tx_not_seen_in_blocks",
-                self.get_collection_mem_stats(SizeType.OBJECT, self._tx_not_seen_in_blocks),
+                self.get_collection_mem_stats(
+                    size_type,
+                    self._tx_not_seen_in_blocks,
+                    self.ESTIMATED_TX_HASH_NOT_SEEN_IN_BLOCK_ITEM_SIZE * len(self._tx_not_seen_in_blocks)
+                ),
                 object_item_count=len(self._tx_not_seen_in_blocks),
                 object_type=memory_utils.ObjectType.BASE,
-                size_type=SizeType.OBJECT
+                size_type=size_type
             )
 
     def get_collection_mem_stats(self, size_type: SizeType, collection_obj: Any, estimated_size: int = 0) -> ObjectSize:
@@ -310,6 +362,10 @@ class ExtensionTransactionService(TransactionService):
                 collection_size += (
                     len(self._short_id_to_tx_cache_key) * constants.UL_INT_SIZE_IN_BYTES)
             return memory_utils.ObjectSize(size=collection_size, flat_size=0, is_actual_size=True)
+        elif size_type == SizeType.INCREMENTAL and \
+                self.get_object_type(collection_obj) == memory_utils.ObjectType.MAP_PROXY:
+            # items of extension maps are not python objects, item count based estimate is already constant time
+            return ObjectSize(size=estimated_size, flat_size=0, is_actual_size=False)
         else:
             return super(ExtensionTransactionService, self).get_collection_mem_stats(
                 size_type, collection_obj, estimated_size
@@ -393,6 +449,8 @@ class ExtensionTransactionService(TransactionService):
 
     def clear(self):
         self.proxy.clear()
+        self._eviction_policy.clear()
+        self._block_cleanup_short_ids.clear()
 
         self._short_id_to_tx_flag.clear()
         self.tx_hashes_without_content.clear()
@@ -0,0 +1,188 @@
+import heapq
+import itertools
+from abc import ABCMeta, abstractmethod
+from typing import TYPE_CHECKING, List, Tuple, Optional, Iterable, Dict, Set
+
+from bxcommon.models.transaction_eviction_policy_type import TransactionEvictionPolicyType
+from bxcommon.models.transaction_flag import TransactionFlag
+
+if TYPE_CHECKING:
+    # pylint: disable=ungrouped-imports,cyclic-import
+    from bxcommon.services.transaction_service import TransactionService
+
+# heap is rebuilt from tracked short ids once stale entries outnumber them by this factor
+_HEAP_COMPACTION_FACTOR = 2
+_HEAP_COMPACTION_MIN_SIZE = 1024
+
+EvictionPriority = Tuple[float, ...]
+
+
+class AbstractTransactionEvictionPolicy(metaclass=ABCMeta):
+    """
+    Decides in which order short ids are evicted when transaction contents exceed the memory limit.
+    Transaction service evicts short ids in batches until it is back under the limit.
+    """
+
+    # if `on_short_ids_updated` must be called when transaction contents of assigned short ids change
+    TRACKS_CONTENTS_CHANGES: bool = False
+
+    def __init__(self, transaction_service: "TransactionService") -> None:
+        self._transaction_service = transaction_service
+
+    def on_short_ids_updated(self, short_ids: Iterable[int]) -> None:
+        """
+        Called when short ids are assigned or transaction contents of already assigned short ids change
+        """
+
+    def on_short_id_fee_updated(self, short_id: int, fee: int) -> None:
+        """
+        Called when fee of the transaction of an assigned short id becomes known
+        """
+
+    @abstractmethod
+    def evict(self, count: int) -> List[int]:
+        """
+        Selects short ids to evict. Selected short ids are no longer tracked and must be removed by the caller.
+        :param count: number of short ids to select
+        :return: up to `count` distinct short ids, in eviction order
+        """
+
+    def clear(self) -> None:
+        pass
+
+
+class OldestFirstEvictionPolicy(AbstractTransactionEvictionPolicy):
+    """
+    Evicts short ids in order of assignment.
+    """
+
+    def evict(self, count: int) -> List[int]:
+        return list(itertools.islice(self._transaction_service.iter_short_ids_from_oldest(), count))
+
+
+class AbstractHeapEvictionPolicy(AbstractTransactionEvictionPolicy):
+    """
+    Keeps short ids in a binary heap ordered by eviction priority, lowest first.
+
+    Heap entries are not removed when short ids are removed or their priority changes. Outdated entries are
+    detected when they reach the top of the heap and are either dropped or pushed back with a fresh priority,
+    so both tracking and selection of a candidate take O(log n).
+    """
+
+    def __init__(self, transaction_service: "TransactionService") -> None:
+        super().__init__(transaction_service)
+        self._heap: List[Tuple[EvictionPriority, int]] = []
+
+    def on_short_ids_updated(self, short_ids: Iterable[int]) -> None:
+        for short_id in short_ids:
+            priority = self._get_priority(short_id)
+            if priority is not None:
+                heapq.heappush(self._heap, (priority, short_id))
+
+        if len(self._heap) > _HEAP_COMPACTION_MIN_SIZE and \
+                len(self._heap) > _HEAP_COMPACTION_FACTOR * self._transaction_service.get_short_id_count():
+            self._rebuild()
+
+    def evict(self, count: int) -> List[int]:
+        heap = self._heap
+        short_ids = []
+        selected_short_ids: Set[int] = set()
+        while heap and len(short_ids) < count:
+            priority, short_id = heap[0]
+            if short_id in selected_short_ids:
+                heapq.heappop(heap)
+                continue
+
+            current_priority = self._get_priority(short_id)
+            if current_priority is None:
+                heapq.heappop(heap)
+            elif current_priority != priority:
+                heapq.heapreplace(heap, (current_priority, short_id))
+            else:
+                heapq.heappop(heap)
+                short_ids.append(short_id)
+                selected_short_ids.add(short_id)
+        return short_ids
+
+    def clear(self) -> None:
+        self._heap.clear()
+
+    @abstractmethod
+    def _get_priority(self, short_id: int) -> Optional[EvictionPriority]:
+        """
+        :return: eviction priority of the short id, None if short id is no longer tracked
+        """
+
+    def _rebuild(self) -> None:
+        heap = []
+        for short_id in self._transaction_service.iter_short_ids_from_oldest():
+            priority = self._get_priority(short_id)
+            if priority is not None:
+                heap.append((priority, short_id))
+        heapq.heapify(heap)
+        self._heap = heap
+
+
+class LargestFirstEvictionPolicy(AbstractHeapEvictionPolicy):
+    """
+    Evicts short ids of transactions with the largest contents first, oldest first among equally sized.
+    """
+
+    TRACKS_CONTENTS_CHANGES = True
+
+    def _get_priority(self, short_id: int) -> Optional[EvictionPriority]:
+        assignment_time = self._transaction_service.get_short_id_assignment_time(short_id)
+        if assignment_time is None:
+            return None
+        return -self._transaction_service.get_transaction_contents_length(short_id), assignment_time
+
+
+class FlagAwareEvictionPolicy(AbstractHeapEvictionPolicy):
+    """
+    Evicts short ids of unpaid transactions before paid ones, lowest fee first within each group
+    and oldest first among equal fees. Short ids of transactions with unknown fee are evicted first.
+    """
+
+    def __init__(self, transaction_service: "TransactionService") -> None:
+        super().__init__(transaction_service)
+        self._short_id_to_fee: Dict[int, int] = {}
+
+    def on_short_id_fee_updated(self, short_id: int, fee: int) -> None:
+        self._short_id_to_fee[short_id] = fee
+        self.on_short_ids_updated((short_id,))
+
+    def evict(self, count: int) -> List[int]:
+        short_ids = super().evict(count)
+        short_id_to_fee = self._short_id_to_fee
+        for short_id in short_ids:
+            short_id_to_fee.pop(short_id, None)
+        return short_ids
+
+    def clear(self) -> None:
+        super().clear()
+        self._short_id_to_fee.clear()
+
+    def _get_priority(self, short_id: int) -> Optional[EvictionPriority]:
+        assignment_time = self._transaction_service.get_short_id_assignment_time(short_id)
+        if assignment_time is None:
+            self._short_id_to_fee.pop(short_id, None)
+            return None
+        is_paid = TransactionFlag.PAID_TX in self._transaction_service.get_short_id_transaction_type(short_id)
+        return float(is_paid), self._short_id_to_fee.get(short_id, -1), assignment_time
+
+    def _rebuild(self) -> None:
+        super()._rebuild()
+        self._short_id_to_fee = {
+            short_id: fee for short_id, fee in self._short_id_to_fee.items()
+            if self._transaction_service.get_short_id_assignment_time(short_id) is not None
+        }
+
+
+def create_eviction_policy(
+    policy_type: TransactionEvictionPolicyType, transaction_service: "TransactionService"
+) -> AbstractTransactionEvictionPolicy:
+    if policy_type == TransactionEvictionPolicyType.LARGEST_FIRST:
+        return LargestFirstEvictionPolicy(transaction_service)
+    if policy_type == TransactionEvictionPolicyType.FLAG_AWARE:
+        return FlagAwareEvictionPolicy(transaction_service)
+    return OldestFirstEvictionPolicy(transaction_service)
@@ -1,24 +1,47 @@
 # pylint: disable=too-many-lines
 
 import functools
+import itertools
+import os
+import struct
+import sys
 import time
 import typing
-from collections import defaultdict, OrderedDict, Counter
+from collections import defaultdict, OrderedDict, Counter, deque
+from concurrent import futures
+from concurrent.futures import Future
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from functools import reduce
-from typing import List, Tuple, Generator, Optional, Union, Dict, Set, Any, Iterator, TYPE_CHECKING
+from typing import (
+    List, Tuple, Generator, Optional, Union, Dict, Set, Any, Iterator, Iterable, Deque, Callable, TYPE_CHECKING
+)
 
 from prometheus_client import Gauge
 
 from bxcommon import constants
-from bxcommon.messages.bloxroute import short_ids_serializer
+from bxcommon.messages.bloxroute import short_ids_serializer, transactions_info_serializer
 from bxcommon.messages.bloxroute.tx_service_sync_txs_message import TxServiceSyncTxsMessage
 from bxcommon.models.transaction_flag import TransactionFlag
-from bxcommon.models.transaction_info import TransactionSearchResult, TransactionInfo
+from bxcommon.models.transaction_info import (
+    TransactionSearchResult,
+    TransactionInfo,
+    SerializedTransactionSearchResult
+)
 from bxcommon.models.transaction_key import TransactionKey, TransactionCacheKeyType
 from bxcommon.utils import memory_utils, convert
+from bxcommon.services import transaction_service_snapshot
+from bxcommon.services.transaction_eviction_policy import create_eviction_policy
+from bxcommon.services.transaction_service_snapshot import SnapshotShortIdRecord, SnapshotWriter
+from bxcommon.utils.buffers.slab_contents_store import SlabContentsStore
+from bxcommon.utils.collections.short_id_array_map import (
+    AbstractShortIdArrayMap,
+    ShortIdArray,
+    ShortIdArrayMap,
+    ShortIdFlagArrayMap
+)
+from bxcommon.utils.collections.time_rotated_bloom_filter import TimeRotatedBloomFilter
 from bxcommon.utils.crypto import SHA256_HASH_LEN
 from bxcommon.utils.deprecated import deprecated
 from bxcommon.utils.expiration_queue import ExpirationQueue
@@ -53,6 +76,11 @@ total_cached_transactions_size = Gauge(
     "Size of cached transactions",
     ("network",)
 )
+block_cleanup_backlog = Gauge(
+    "block_cleanup_backlog",
+    "Number of short ids of finalized blocks waiting to be removed",
+    ("network",)
+)
 
 
 def wrap_sha256(transaction_hash: Union[bytes, bytearray, memoryview, Sha256Hash]) -> Sha256Hash:
@@ -109,6 +137,15 @@ class TxSyncMsgProcessingItem(typing.NamedTuple):
     transaction_flag_types: List[TransactionFlag] = []
 
 
+class TransactionBatchItem(typing.NamedTuple):
+    transaction_key: TransactionKey
+    short_id: Optional[int] = None
+    transaction_contents: Optional[Union[bytearray, memoryview]] = None
+    transaction_flag: TransactionFlag = TransactionFlag.NO_FLAGS
+    # time the short id was assigned, defaults to time of the batch
+    assignment_time: Optional[float] = None
+
+
 # pylint: disable=too-many-public-methods
 class TransactionService:
     """
@@ -129,8 +166,13 @@ class TransactionService:
     _tx_cache_key_to_short_ids: mapping of transaction long hashes to (potentially multiple) short ids
     _short_id_to_tx_cache_key: mapping of short id to transaction long hashes
     _short_id_to_tx_flag: mapping of short id to transaction flag type
+    (the three mappings above are backed by typed arrays if `compact_short_id_index` option is set)
+    _binary_tx_cache_keys: use raw 32 bytes of transaction hash as cache key instead of hex string
     _tx_cache_key_to_contents: mapping of transaction long hashes to transaction contents
+    (packed into preallocated slabs if `transaction_contents_slab_size` option is set, lookups then return
+    copies of the contents, only serialization of found transactions reads slabs without copying)
     _tx_assignment_expire_queue: expiration time of short ids
+    _eviction_policy: order in which short ids are removed when transaction contents exceed memory limit
     """
 
     node: "AbstractNode"
@@ -142,8 +184,8 @@ class TransactionService:
     _tx_cache_key_to_contents: Dict[TransactionCacheKeyType, Union[bytearray, memoryview]]
     _tx_cache_key_to_short_ids: Dict[TransactionCacheKeyType, Set[int]]
     _tx_assignment_expire_queue: ExpirationQueue[int]
-    _tx_hash_to_time_removed: OrderedDict
-    _short_id_to_time_removed: OrderedDict
+    _tx_hash_to_time_removed: Union[OrderedDict, TimeRotatedBloomFilter]
+    _short_id_to_time_removed: Union[OrderedDict, TimeRotatedBloomFilter]
     tx_hashes_without_short_id: ExpirationQueue[Sha256Hash]
     tx_hashes_without_content: ExpirationQueue[Sha256Hash]  # but has short ID
 
@@ -156,6 +198,17 @@ class TransactionService:
     ESTIMATED_SHORT_ID_EXPIRATION_ITEM_SIZE = 88
     ESTIMATED_TX_HASH_NOT_SEEN_IN_BLOCK_ITEM_SIZE = 312
 
+    # sizes of objects referenced by data structure items, used by incremental memory stats
+    INCREMENTAL_SHORT_ID_SIZE = sys.getsizeof(MAX_ID - 1)
+    INCREMENTAL_TIMESTAMP_SIZE = sys.getsizeof(0.0)
+    INCREMENTAL_CONTENTS_OVERHEAD_SIZE = sys.getsizeof(bytearray())
+    INCREMENTAL_SHORT_IDS_SET_SIZE = sys.getsizeof(set())
+    INCREMENTAL_SHORT_IDS_LIST_SIZE = sys.getsizeof([])
+    INCREMENTAL_POINTER_SIZE = struct.calcsize("P")
+    INCREMENTAL_HEX_CACHE_KEY_SIZE = sys.getsizeof("0" * 2 * SHA256_HASH_LEN)
+    INCREMENTAL_BINARY_CACHE_KEY_SIZE = sys.getsizeof(bytes(SHA256_HASH_LEN))
+    INCREMENTAL_SHA256_HASH_SIZE = memory_utils.get_object_size(Sha256Hash(bytearray(SHA256_HASH_LEN))).size
+
     def __init__(self, node: "AbstractNode", network_num: int) -> None:
         """
         Constructor
@@ -175,31 +228,42 @@ class TransactionService:
         self.tx_content_without_sid_alarm_scheduled = False
         self.tx_without_content_alarm_scheduled = False
 
-        self._tx_cache_key_to_short_ids = defaultdict(set)
-        self._short_id_to_tx_flag = {}
-        self._short_id_to_tx_cache_key = {}
-        self._tx_cache_key_to_contents = {}
+        if node.opts.compact_short_id_index:
+            self._tx_cache_key_to_short_ids = defaultdict(ShortIdArray)
+            self._short_id_to_tx_flag = ShortIdFlagArrayMap()
+            self._short_id_to_tx_cache_key = ShortIdArrayMap()
+        else:
+            self._tx_cache_key_to_short_ids = defaultdict(set)
+            self._short_id_to_tx_flag = {}
+            self._short_id_to_tx_cache_key = {}
+        if node.opts.transaction_contents_slab_size > 0:
+            self._tx_cache_key_to_contents = SlabContentsStore(node.opts.transaction_contents_slab_size * 1024)
+        else:
+            self._tx_cache_key_to_contents = {}
         self._tx_assignment_expire_queue = ExpirationQueue(node.opts.sid_expire_time)
         self.tx_hashes_without_short_id = ExpirationQueue(constants.TX_CONTENT_NO_SID_EXPIRE_S)
         self.tx_hashes_without_content = ExpirationQueue(constants.TX_CONTENT_NO_SID_EXPIRE_S)
+        self._binary_tx_cache_keys = node.opts.binary_tx_cache_keys
         self.network = None
         if self.network_num in self.node.opts.blockchain_networks:
             self.network = self.node.opts.blockchain_networks[self.network_num]
 
-        self._tx_hash_to_time_removed = OrderedDict()
-        self._short_id_to_time_removed = OrderedDict()
-
         self._final_tx_confirmations_count = self._get_final_tx_confirmations_count()
         self._tx_content_memory_limit = self._get_tx_contents_memory_limit()
+        self._eviction_policy = create_eviction_policy(node.opts.transaction_eviction_policy, self)
         logger.debug("Memory limit for transaction service by network number {} is {} bytes.",
                      self.network_num, self._tx_content_memory_limit)
-        self._removed_txs_expiration_time_s = self._get_removed_transactions_history_expiration_time_s()
+        self._init_removed_transactions_history()
 
         # short ids seen in block ordered by them block hash
         self._short_ids_seen_in_block: Dict[Sha256Hash, List[int]] = OrderedDict()
+        # total number of short ids in _short_ids_seen_in_block, maintained on insert and remove
+        self._short_ids_seen_in_block_count = 0
         self._total_tx_contents_size = 0
         self._total_tx_removed_by_memory_limit = 0
 
+        self._init_block_cleanup()
+
         self._last_transaction_stats = TransactionServiceStats()
         self._removed_short_ids = set()
         if node.opts.dump_removed_short_ids:
@@ -207,19 +271,9 @@ class TransactionService:
                 constants.DUMP_REMOVED_SHORT_IDS_INTERVAL_S,
                 self._dump_removed_short_ids
             )
-        self.node.alarm_queue.register_alarm(
-            constants.REMOVED_TRANSACTIONS_HISTORY_CLEANUP_INTERVAL_S,
-            self._cleanup_removed_transactions_history
-        )
 
-        self.total_cached_transactions = total_cached_transactions.labels(network_num)
-        self.total_cached_transactions.set_function(
-            functools.partial(len, self._tx_cache_key_to_contents)
-        )
-        self.total_cached_transactions_size = total_cached_transactions_size.labels(network_num)
-        self.total_cached_transactions_size.set_function(
-            functools.partial(utils.identity, self._total_tx_contents_size)
-        )
+        self._init_snapshots()
+        self._init_metrics()
 
     def get_short_id_transaction_type(self, short_id: int) -> TransactionFlag:
         if short_id in self._short_id_to_tx_flag:
@@ -231,6 +285,13 @@ class TransactionService:
         if TransactionFlag.PAID_TX & tx_flag:
             self._short_id_to_tx_flag[short_id] = tx_flag
 
+    def set_short_id_fee(self, short_id: int, fee: int) -> None:
+        """
+        Records fee (e.g. gas price) of the transaction of an assigned short id,
+        used by the flag aware eviction policy to keep transactions with higher fees.
+        """
+        self._eviction_policy.on_short_id_fee_updated(short_id, fee)
+
     def get_short_id_by_key(self, transaction_key: TransactionKey) -> int:
         """
         Fetches a single short id for transaction. If the transaction has multiple short id mappings, just gets
@@ -248,7 +309,10 @@ class TransactionService:
         """
 
         if transaction_key.transaction_cache_key in self._tx_cache_key_to_short_ids:
-            return self._tx_cache_key_to_short_ids[transaction_key.transaction_cache_key]
+            short_ids = self._tx_cache_key_to_short_ids[transaction_key.transaction_cache_key]
+            if isinstance(short_ids, ShortIdArray):
+                return set(short_ids)
+            return short_ids
         else:
             return constants.NULL_TX_SIDS
 
@@ -309,37 +373,84 @@ class TransactionService:
         Fetches all transaction info for a set of short ids.
         Short ids without a transaction entry will be omitted.
         Function allows to pass a single short id or serialized list of short ids
+        Use `get_serialized_transactions` to reply with CompressedBlockTxsMessage, it does not build
+        TransactionInfo objects for found transactions.
         :param serialized_short_ids: instance of get transactions message
         :return: list of found and missing short ids
         """
 
         assert serialized_short_ids is not None
         short_ids = short_ids_serializer.deserialize_short_ids(serialized_short_ids)
+        transaction_cache_keys = list(map(self._short_id_to_tx_cache_key.get, short_ids))
+        tx_cache_key_to_contents = self._tx_cache_key_to_contents
+        tx_cache_key_to_hash = self._tx_cache_key_to_hash
 
         found = []
         missing = []
-        for short_id in short_ids:
-            if short_id in self._short_id_to_tx_cache_key:
-                transaction_cache_key = self._short_id_to_tx_cache_key[short_id]
-                if transaction_cache_key in self._tx_cache_key_to_contents:
-                    found.append(TransactionInfo(
-                        self._tx_cache_key_to_hash(transaction_cache_key),
-                        self._tx_cache_key_to_contents[transaction_cache_key],
-                        short_id
-                    ))
-                else:
-                    missing.append(TransactionInfo(
-                        self._tx_cache_key_to_hash(transaction_cache_key),
-                        None,
-                        short_id
-                    ))
-                    logger.trace("Short id {} was requested but is unknown.", short_id)
-            else:
+        for short_id, transaction_cache_key in zip(short_ids, transaction_cache_keys):
+            if transaction_cache_key is None:
                 missing.append(TransactionInfo(None, None, short_id))
-                logger.trace("Short id {} was requested but is unknown.", short_id)
+                continue
+
+            transaction_hash = tx_cache_key_to_hash(transaction_cache_key)
+            transaction_contents = tx_cache_key_to_contents.get(transaction_cache_key)
+            if transaction_contents is None:
+                missing.append(TransactionInfo(transaction_hash, None, short_id))
+            else:
+                found.append(TransactionInfo(transaction_hash, transaction_contents, short_id))
+
+        if missing:
+            logger.trace("{} of {} requested short ids are unknown.", len(missing), len(short_ids))
 
         return TransactionSearchResult(found, missing)
 
+    def get_serialized_transactions(
+        self,
+        serialized_short_ids: Optional[bytearray] = None
+    ) -> SerializedTransactionSearchResult:
+        """
+        Fetches all transaction info for a set of short ids.
+        Found transactions are returned already serialized in transactions info format,
+        so they can be put into CompressedBlockTxsMessage without another serialization pass.
+        Headers and contents of found transactions are joined into the result in a single copy.
+        :param serialized_short_ids: serialized list of short ids
+        :return: serialized found transactions and list of missing short ids
+        """
+        assert serialized_short_ids is not None
+        short_ids = short_ids_serializer.deserialize_short_ids(serialized_short_ids)
+        tx_cache_key_to_contents = self._tx_cache_key_to_contents
+        tx_cache_key_to_hash = self._tx_cache_key_to_hash
+        # contents are joined right away, so slab views are consumed before the store is modified
+        if isinstance(tx_cache_key_to_contents, SlabContentsStore):
+            get_contents = tx_cache_key_to_contents.get_view
+        else:
+            get_contents = tx_cache_key_to_contents.__getitem__
+        pack_header = transactions_info_serializer.TX_INFO_HEADER.pack
+
+        found_count = 0
+        parts: List[Union[bytes, bytearray, memoryview]] = [b""]
+        missing = []
+        for short_id, transaction_cache_key in zip(short_ids, map(self._short_id_to_tx_cache_key.get, short_ids)):
+            if transaction_cache_key is None:
+                missing.append(TransactionInfo(None, None, short_id))
+                continue
+
+            transaction_hash = tx_cache_key_to_hash(transaction_cache_key)
+            if transaction_cache_key not in tx_cache_key_to_contents:
+                missing.append(TransactionInfo(transaction_hash, None, short_id))
+                continue
+
+            transaction_contents = get_contents(transaction_cache_key)
+            parts.append(pack_header(short_id, transaction_hash.binary, len(transaction_contents)))
+            parts.append(transaction_contents)
+            found_count += 1
+
+        if missing:
+            logger.trace("{} of {} requested short ids are unknown.", len(missing), len(short_ids))
+
+        parts[0] = struct.pack("<L", found_count)
+        return SerializedTransactionSearchResult(bytearray().join(parts), found_count, missing)
+
     def get_tx_hash_to_contents_len(self) -> int:
         return len(self._tx_cache_key_to_contents)
 
@@ -522,6 +633,7 @@ class TransactionService:
             self._tx_cache_key_to_short_ids[transaction_key.transaction_cache_key].add(short_id)
             self._short_id_to_tx_cache_key[short_id] = transaction_key.transaction_cache_key
         self._tx_assignment_expire_queue.add(short_id)
+        self._eviction_policy.on_short_ids_updated((short_id,))
         self.tx_hashes_without_short_id.remove(transaction_key.transaction_hash)
 
         if not self.tx_assign_alarm_scheduled:
@@ -553,7 +665,7 @@ class TransactionService:
         previous_size = 0
 
         if transaction_key.transaction_cache_key in self._tx_cache_key_to_contents:
-            previous_size = len(self._tx_cache_key_to_contents[transaction_key.transaction_cache_key])
+            previous_size = self._get_contents_length(transaction_key.transaction_cache_key)
         has_short_id = transaction_key.transaction_cache_key in self._tx_cache_key_to_short_ids
 
         self.set_transaction_contents_base_by_key(
@@ -602,6 +714,68 @@ class TransactionService:
         else:
             logger.debug("both transaction contents and transaction contents length are missing.")
 
+        if has_short_id and self._eviction_policy.TRACKS_CONTENTS_CHANGES:
+            self._eviction_policy.on_short_ids_updated(
+                self._tx_cache_key_to_short_ids[transaction_key.transaction_cache_key]
+            )
+        self._memory_limit_clean_up()
+
+    def add_transactions_by_key(self, items: Iterable[TransactionBatchItem]) -> None:
+        """
+        Bulk version of `set_transaction_contents_by_key` and `assign_short_id_by_key`.
+        Expiration queue timestamps, alarm scheduling and memory limit clean up are handled
+        once for the whole batch instead of once per item.
+        Transactions with multiple short ids are passed as multiple items with the same transaction key.
+
+        :param items: list of transaction key, short id, transaction contents and flag tuples
+        """
+        timestamp = time.time()
+
+        for transaction_key, short_id, transaction_contents, transaction_flag, assignment_time in items:
+            if short_id == constants.NULL_TX_SID:
+                logger.warning(log_messages.ATTEMPTED_TO_ASSIGN_NULL_SHORT_ID_TO_TX_HASH, transaction_key)
+                short_id = None
+            if short_id is None and transaction_contents is None:
+                continue
+
+            has_short_id, has_contents, previous_size = self._add_transaction_batch_item(
+                transaction_key, short_id, transaction_contents
+            )
+            transaction_hash = transaction_key.transaction_hash
+
+            if transaction_contents is not None:
+                self._total_tx_contents_size += len(transaction_contents) - previous_size
+                self.tx_hashes_without_content.remove(transaction_hash)
+
+            if short_id is not None:
+                self._tx_assignment_expire_queue.add(
+                    short_id, timestamp if assignment_time is None else assignment_time
+                )
+                self._eviction_policy.on_short_ids_updated((short_id,))
+                self.tx_hashes_without_short_id.remove(transaction_hash)
+                self.set_short_id_transaction_type(short_id, transaction_flag)
+                if not has_contents:
+                    self.tx_hashes_without_content.add(transaction_hash, timestamp)
+            elif has_short_id:
+                if self._eviction_policy.TRACKS_CONTENTS_CHANGES:
+                    self._eviction_policy.on_short_ids_updated(
+                        self._tx_cache_key_to_short_ids[transaction_key.transaction_cache_key]
+                    )
+            else:
+                self.tx_hashes_without_short_id.add(transaction_hash, timestamp)
+
+        if self._tx_assignment_expire_queue and not self.tx_assign_alarm_scheduled:
+            self.node.alarm_queue.register_alarm(self.node.opts.sid_expire_time, self.expire_old_assignments)
+            self.tx_assign_alarm_scheduled = True
+        if self.tx_hashes_without_short_id and not self.tx_content_without_sid_alarm_scheduled:
+            self.node.alarm_queue.register_alarm(constants.TX_CONTENT_NO_SID_EXPIRE_S,
+                                                 self.expire_content_without_sid)
+            self.tx_content_without_sid_alarm_scheduled = True
+        if self.tx_hashes_without_content and not self.tx_without_content_alarm_scheduled:
+            self.node.alarm_queue.register_alarm(constants.TX_CONTENT_NO_SID_EXPIRE_S,
+                                                 self.expire_sid_without_content)
+            self.tx_without_content_alarm_scheduled = True
+
         self._memory_limit_clean_up()
 
     @deprecated
@@ -662,7 +836,7 @@ class TransactionService:
             short_ids = None
 
         if transaction_key.transaction_cache_key in self._tx_cache_key_to_contents:
-            self._total_tx_contents_size -= len(self._tx_cache_key_to_contents[transaction_key.transaction_cache_key])
+            self._total_tx_contents_size -= self._get_contents_length(transaction_key.transaction_cache_key)
             del self._tx_cache_key_to_contents[transaction_key.transaction_cache_key]
             self._tx_hash_to_time_removed[transaction_key.transaction_cache_key] = time.time()
             removed_txns += 1
@@ -727,7 +901,7 @@ class TransactionService:
                             self._removed_short_ids.add(dup_short_id)
 
                 if transaction_cache_key in self._tx_cache_key_to_contents:
-                    self._total_tx_contents_size -= len(self._tx_cache_key_to_contents[transaction_cache_key])
+                    self._total_tx_contents_size -= self._get_contents_length(transaction_cache_key)
                     del self._tx_cache_key_to_contents[transaction_cache_key]
                     self._tx_hash_to_time_removed[transaction_cache_key] = time_removed
 
@@ -749,6 +923,24 @@ class TransactionService:
         for block_hash, short_ids in self._short_ids_seen_in_block.items():
             yield block_hash, short_ids
 
+    def iter_short_ids_from_oldest(self) -> Iterator[int]:
+        """
+        Iterates over assigned short ids in order of assignment. Short ids must not be removed during iteration.
+        """
+        return iter(self._tx_assignment_expire_queue.queue)
+
+    def get_oldest_short_id(self) -> Optional[int]:
+        return self._tx_assignment_expire_queue.get_oldest()
+
+    def get_short_id_assignment_time(self, short_id: int) -> Optional[float]:
+        return self._tx_assignment_expire_queue.queue.get(short_id)
+
+    def get_transaction_contents_length(self, short_id: int) -> int:
+        transaction_cache_key = self._short_id_to_tx_cache_key.get(short_id)
+        if transaction_cache_key is None or transaction_cache_key not in self._tx_cache_key_to_contents:
+            return 0
+        return self._get_contents_length(transaction_cache_key)
+
     def iter_transaction_hashes_from_oldest(
         self, newest_time: float = float("inf")
     ) -> Generator[Tuple[Sha256Hash, float], None, None]:
@@ -801,17 +993,13 @@ class TransactionService:
         :param block_hash: the block sha
         """
         if block_hash in self._short_ids_seen_in_block:
-            del self._short_ids_seen_in_block[block_hash]
+            self._short_ids_seen_in_block_count -= len(self._short_ids_seen_in_block.pop(block_hash))
 
     def get_short_ids_seen_in_block_count_info(self) -> Tuple[int, int]:
         """
         :return: tuple of number of blocks and total count of short ids seen in all blocks
         """
-        total_short_ids_seen_in_blocks = 0
-        for _, seen_short_ids_in_block in self._short_ids_seen_in_block.items():
-            total_short_ids_seen_in_blocks += len(seen_short_ids_in_block)
-
-        return self.get_tracked_seen_block_count(), total_short_ids_seen_in_blocks
+        return self.get_tracked_seen_block_count(), self._short_ids_seen_in_block_count
 
     def get_snapshot(self, duration: float = 0) -> List[Sha256Hash]:
         if duration > 0:
@@ -941,26 +1129,90 @@ class TransactionService:
         """
 
         wrapped_block_hash = wrap_sha256(block_hash)
+        if wrapped_block_hash in self._short_ids_seen_in_block:
+            self._short_ids_seen_in_block_count -= len(self._short_ids_seen_in_block[wrapped_block_hash])
         self._short_ids_seen_in_block[wrapped_block_hash] = short_ids
+        self._short_ids_seen_in_block_count += len(short_ids)
 
         if len(self._short_ids_seen_in_block) >= self._final_tx_confirmations_count:
 
             # pyre-fixme[28]: Unexpected keyword argument `last`.
             _, final_short_ids = self._short_ids_seen_in_block.popitem(last=False)
+            self._short_ids_seen_in_block_count -= len(final_short_ids)
 
-            for short_id in final_short_ids:
-                self.remove_transaction_by_short_id(short_id, remove_related_short_ids=True, force=True,
-                                                    removal_reason=TxRemovalReason.BLOCK_CLEANUP)
+            if self._block_cleanup_time_budget_s > 0:
+                self._queue_block_cleanup(final_short_ids, TxRemovalReason.BLOCK_CLEANUP)
+            else:
+                for short_id in final_short_ids:
+                    self.remove_transaction_by_short_id(short_id, remove_related_short_ids=True, force=True,
+                                                        removal_reason=TxRemovalReason.BLOCK_CLEANUP)
+
+        # with sliced clean up, cache state is logged once the queued clean up is complete
+        if self._block_cleanup_time_budget_s <= 0:
+            logger_memory_cleanup.statistics(
+                {
+                    "type": "MemoryCleanup",
+                    "event": "TransactionServiceTrackSeenSummary",
+                    "data": self.get_cache_state_json(),
+                    "seen_short_ids_count": len(short_ids),
+                    "block_hash": repr(block_hash)
+                }
+            )
 
+    def _queue_block_cleanup(self, short_ids: Iterable[int], removal_reason: TxRemovalReason) -> None:
+        """
+        Queues short ids to be removed in time budgeted slices and schedules the clean up alarm.
+        :param short_ids: transaction short ids
+        :param removal_reason: reason recorded for the removed transactions
+        """
+        self._block_cleanup_short_ids.extend(zip(short_ids, itertools.repeat(removal_reason)))
+        if not self.block_cleanup_alarm_scheduled:
+            self.node.alarm_queue.register_alarm(0, self._clean_up_finalized_short_ids)
+            self.block_cleanup_alarm_scheduled = True
+            self._block_cleanup_start_time = time.time()
+            self._block_cleanup_duration_s = 0.0
+            self._block_cleanup_removed_count = 0
+            self._block_cleanup_slice_count = 0
+
+    def _clean_up_finalized_short_ids(self) -> float:
+        """
+        Removes transactions of finalized blocks until the queue is empty or the slice time budget is exceeded.
+        Cache state is logged once the queue is empty, not for every slice.
+        """
+        start_time = time.time()
+        deadline = start_time + self._block_cleanup_time_budget_s
+        block_cleanup_short_ids = self._block_cleanup_short_ids
+        removed_count = 0
+        end_time = start_time
+        while block_cleanup_short_ids:
+            short_id, removal_reason = block_cleanup_short_ids.popleft()
+            self.remove_transaction_by_short_id(
+                short_id, remove_related_short_ids=True, force=True, removal_reason=removal_reason
+            )
+            removed_count += 1
+            end_time = time.time()
+            if end_time >= deadline:
+                break
+
+        self._block_cleanup_duration_s += end_time - start_time
+        self._block_cleanup_removed_count += removed_count
+        self._block_cleanup_slice_count += 1
+        if block_cleanup_short_ids:
+            return constants.BLOCK_CLEANUP_SLICE_INTERVAL_S
+
+        self.block_cleanup_alarm_scheduled = False
         logger_memory_cleanup.statistics(
             {
                 "type": "MemoryCleanup",
-                "event": "TransactionServiceTrackSeenSummary",
+                "event": "TransactionServiceBlockCleanupSummary",
                 "data": self.get_cache_state_json(),
-                "seen_short_ids_count": len(short_ids),
-                "block_hash": repr(block_hash)
+                "removed_short_ids_count": self._block_cleanup_removed_count,
+                "slice_count": self._block_cleanup_slice_count,
+                "duration": self._block_cleanup_duration_s,
+                "elapsed_time": end_time - self._block_cleanup_start_time
             }
         )
+        return 0
 
     def track_seen_short_ids_delayed(self, block_hash: Sha256Hash, short_ids: List[int]) -> None:
         """
@@ -977,10 +1229,23 @@ class TransactionService:
             short_ids
         )
 
-    def process_tx_sync_message(self, msg: TxServiceSyncTxsMessage) -> List[TxSyncMsgProcessingItem]:
+    def process_tx_sync_message(self, msg: TxServiceSyncTxsMessage) -> Iterable[TxSyncMsgProcessingItem]:
+        """
+        Adds transactions of a sync message in batches while the message is parsed. Results of a batch
+        are yielded once its transactions are added, so objects of a single batch are alive at once.
+        The results must be consumed for all transactions of the message to be added.
+        :param msg: transaction service sync message
+        :return: processing results of the message transactions
+        """
         result_items = []
-        txs_content_short_ids = msg.txs_content_short_ids()
-        for tx_content_short_ids in txs_content_short_ids:
+        batch_items = []
+        for tx_content_short_ids in msg.iter_txs_content_short_ids():
+            if len(batch_items) >= constants.TX_SYNC_PROCESSING_BATCH_SIZE:
+                self.add_transactions_by_key(batch_items)
+                yield from result_items
+                result_items = []
+                batch_items = []
+
             transaction_key = self.get_transaction_key(tx_content_short_ids.tx_hash)
 
             tx_content = tx_content_short_ids.tx_content
@@ -988,12 +1253,17 @@ class TransactionService:
 
             if tx_content:
                 tx_content_len = len(tx_content)
-                self.set_transaction_contents_by_key(transaction_key, tx_content)
+            else:
+                tx_content = None
 
-            for short_id, _ in zip(
+            for short_id, short_id_flag in zip(
                 tx_content_short_ids.short_ids, tx_content_short_ids.short_id_flags
             ):
-                self.assign_short_id_by_key(transaction_key, short_id)
+                # contents are attached to the first short id entry only
+                batch_items.append(TransactionBatchItem(transaction_key, short_id, tx_content, short_id_flag))
+                tx_content = None
+            if tx_content is not None:
+                batch_items.append(TransactionBatchItem(transaction_key, None, tx_content))
 
             result_item = TxSyncMsgProcessingItem(transaction_key.transaction_hash,
                                                   tx_content_len,
@@ -1001,7 +1271,8 @@ class TransactionService:
                                                   tx_content_short_ids.short_id_flags)
             result_items.append(result_item)
 
-        return result_items
+        self.add_transactions_by_key(batch_items)
+        yield from result_items
 
     def log_block_transaction_cleanup_stats(self, block_hash: Sha256Hash, tx_count: int, tx_before_cleanup: int,
                                             tx_after_cleanup: int, short_id_count_before_cleanup: int,
@@ -1022,7 +1293,9 @@ class TransactionService:
         """
         Logs transactions service memory statistics
         """
-        if self.node.opts.stats_calculate_actual_size and include_data_structure_memory:
+        if self.node.opts.incremental_memory_stats:
+            size_type = memory_utils.SizeType.INCREMENTAL
+        elif self.node.opts.stats_calculate_actual_size and include_data_structure_memory:
             size_type = memory_utils.SizeType.OBJECT
         else:
             size_type = memory_utils.SizeType.ESTIMATE
@@ -1195,7 +1468,9 @@ class TransactionService:
             oldest_transaction_date = self._tx_assignment_expire_queue.get_oldest_item_timestamp()
             oldest_transaction_sid = self._tx_assignment_expire_queue.get_oldest()
             if oldest_transaction_sid in self._short_id_to_tx_cache_key:
-                oldest_transaction_hash = self._short_id_to_tx_cache_key[oldest_transaction_sid]
+                oldest_transaction_hash = str(
+                    self._tx_cache_key_to_hash(self._short_id_to_tx_cache_key[oldest_transaction_sid])
+                )
 
         current_stats = TransactionServiceStats(
             len(self._short_id_to_tx_cache_key),
@@ -1215,11 +1490,59 @@ class TransactionService:
         }
 
     def get_collection_mem_stats(self, size_type: SizeType, collection_obj: Any, estimated_size: int = 0) -> ObjectSize:
-        if size_type == SizeType.OBJECT:
+        if isinstance(collection_obj, (AbstractShortIdArrayMap, SlabContentsStore, TimeRotatedBloomFilter)):
+            return ObjectSize(size=collection_obj.get_bytes_length(), flat_size=0, is_actual_size=True)
+        elif size_type == SizeType.OBJECT:
             return memory_utils.get_object_size(collection_obj)
+        elif size_type == SizeType.INCREMENTAL:
+            if isinstance(collection_obj, ExpirationQueue):
+                collection_obj = collection_obj.queue
+            return memory_utils.get_incremental_collection_size(
+                collection_obj, self._get_incremental_items_size(collection_obj)
+            )
         else:
             return ObjectSize(size=estimated_size, flat_size=0, is_actual_size=False)
 
+    def _get_incremental_items_size(self, collection_obj: Any) -> int:
+        """
+        Calculates total size of objects referenced by items of a transaction service data structure in constant
+        time, from its item count and running counters of variable sized items.
+        Keys are of uniform size for a data structure, objects shared between data structures
+        (e.g. cache keys referenced by short id mapping) are attributed only to a single one of them.
+        :param collection_obj: transaction service data structure
+        :return: size of items in bytes
+        """
+        if self._binary_tx_cache_keys:
+            cache_key_size = self.INCREMENTAL_BINARY_CACHE_KEY_SIZE
+        else:
+            cache_key_size = self.INCREMENTAL_HEX_CACHE_KEY_SIZE
+
+        variable_items_size = 0
+        if collection_obj is self._tx_cache_key_to_contents:
+            item_size = cache_key_size + self.INCREMENTAL_CONTENTS_OVERHEAD_SIZE
+            variable_items_size = self._total_tx_contents_size
+        elif collection_obj is self._short_id_to_tx_cache_key or collection_obj is self._removed_short_ids:
+            item_size = self.INCREMENTAL_SHORT_ID_SIZE
+        elif collection_obj is self._tx_cache_key_to_short_ids:
+            # short ids are shared with short id mapping, only the sets are owned
+            item_size = self.INCREMENTAL_SHORT_IDS_SET_SIZE
+        elif collection_obj is self._short_ids_seen_in_block:
+            item_size = self.INCREMENTAL_SHA256_HASH_SIZE + self.INCREMENTAL_SHORT_IDS_LIST_SIZE
+            variable_items_size = self._short_ids_seen_in_block_count * (
+                self.INCREMENTAL_POINTER_SIZE + self.INCREMENTAL_SHORT_ID_SIZE
+            )
+        elif collection_obj is self._tx_assignment_expire_queue.queue:
+            # short ids are shared with short id mapping, only the timestamps are owned
+            item_size = self.INCREMENTAL_TIMESTAMP_SIZE
+        elif collection_obj is self._tx_hash_to_time_removed:
+            item_size = cache_key_size + self.INCREMENTAL_TIMESTAMP_SIZE
+        elif collection_obj is self._short_id_to_time_removed:
+            item_size = self.INCREMENTAL_SHORT_ID_SIZE + self.INCREMENTAL_TIMESTAMP_SIZE
+        else:
+            # expiration queues of transaction hashes
+            item_size = self.INCREMENTAL_SHA256_HASH_SIZE + self.INCREMENTAL_TIMESTAMP_SIZE
+        return len(collection_obj) * item_size + variable_items_size
+
     def get_cache_state_json(self) -> Dict[str, Any]:
         return {
             "tx_hash_to_short_ids_len": len(self._tx_cache_key_to_short_ids),
@@ -1227,6 +1550,7 @@ class TransactionService:
             "tx_hash_to_contents_len": len(self._tx_cache_key_to_contents),
             "short_ids_seen_in_block_len": len(self._short_ids_seen_in_block),
             "total_tx_contents_size": self._total_tx_contents_size,
+            "block_cleanup_backlog_len": len(self._block_cleanup_short_ids),
             "network_num": self.network_num
         }
 
@@ -1234,23 +1558,34 @@ class TransactionService:
         return json_encoder.to_json(self.get_cache_state_json())
 
     def get_removed_tx_hash_time_and_count(self, tx_hashes: List[Sha256Hash]) -> Tuple[float, int]:
+        """
+        With `removed_transactions_history_filter` option the count may include false positives,
+        and the time is an upper bound of the latest removal time.
+        :return: latest removal time of the removed transactions and their count
+        """
+        get_time_removed = self._get_time_removed_lookup(self._tx_hash_to_time_removed)
         oldest_removed_tx_hash = 0
         removed_tx_hash_count = 0
         for tx_hash in tx_hashes:
-            if tx_hash in self._tx_hash_to_time_removed:
+            tx_cache_key = self._tx_hash_to_cache_key(tx_hash)
+            if tx_cache_key in self._tx_hash_to_time_removed:
                 removed_tx_hash_count += 1
-                if oldest_removed_tx_hash < self._tx_hash_to_time_removed[tx_hash]:
-                    oldest_removed_tx_hash = self._tx_hash_to_time_removed[tx_hash]
+                oldest_removed_tx_hash = max(oldest_removed_tx_hash, get_time_removed(tx_cache_key))
         return oldest_removed_tx_hash, removed_tx_hash_count
 
     def get_removed_short_id_time_and_count(self, short_ids: List[int]) -> Tuple[float, int]:
+        """
+        With `removed_transactions_history_filter` option the count may include false positives,
+        and the time is an upper bound of the latest removal time.
+        :return: latest removal time of the removed short ids and their count
+        """
+        get_time_removed = self._get_time_removed_lookup(self._short_id_to_time_removed)
         oldest_removed_short_id = 0
         removed_short_id_count = 0
         for short_id in short_ids:
             if short_id in self._short_id_to_time_removed:
                 removed_short_id_count += 1
-                if oldest_removed_short_id < self._short_id_to_time_removed[short_id]:
-                    oldest_removed_short_id = self._short_id_to_time_removed[short_id]
+                oldest_removed_short_id = max(oldest_removed_short_id, get_time_removed(short_id))
         return oldest_removed_short_id, removed_short_id_count
 
     def get_transaction_key(
@@ -1276,9 +1611,211 @@ class TransactionService:
             self._removed_short_ids.clear()
         return constants.DUMP_REMOVED_SHORT_IDS_INTERVAL_S
 
+    def save_snapshot(self) -> None:
+        """
+        Writes short ids, flags, assignment times, transaction contents and short ids seen in blocks
+        to the snapshot file, so the state can be restored by `load_snapshot` after restart.
+        Captures the whole state at once, used on shutdown. Periodic snapshots are captured in slices.
+        """
+        # drop snapshot being captured in slices, the state is captured again
+        self._snapshot_writer = None
+        self._snapshot_short_id_items = iter(())
+        snapshot_write = self._snapshot_write
+        if snapshot_write is not None:
+            futures.wait([snapshot_write])
+
+        writer = SnapshotWriter(self.network_num, time.time())
+        self._capture_snapshot_short_ids(writer, iter(self._tx_assignment_expire_queue.queue.items()))
+        self._capture_snapshot_short_ids_seen_in_block(writer)
+        self._write_snapshot(writer)
+
+    def load_snapshot(self) -> int:
+        """
+        Restores state written by `save_snapshot`. Short ids assigned earlier than `sid_expire_time` ago are skipped.
+
+        :return: number of restored short ids
+        """
+        file_path = transaction_service_snapshot.get_snapshot_file_path(self._snapshot_dir, self.network_num)
+        if not os.path.exists(file_path):
+            return 0
+
+        start_time = time.time()
+        try:
+            snapshot = transaction_service_snapshot.read_snapshot(
+                file_path, start_time - self.node.opts.sid_expire_time
+            )
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning(log_messages.TRANSACTION_SERVICE_SNAPSHOT_FAILURE, "load", file_path, e)
+            return 0
+        if snapshot.network_num != self.network_num:
+            logger.warning(log_messages.TRANSACTION_SERVICE_SNAPSHOT_FAILURE, "load", file_path,
+                           f"snapshot is for network {snapshot.network_num}")
+            return 0
+
+        has_short_ids = bool(self._tx_assignment_expire_queue)
+        self.add_transactions_by_key(
+            TransactionBatchItem(
+                self.get_transaction_key(record.transaction_hash),
+                record.short_id,
+                record.transaction_contents,
+                record.transaction_flag,
+                record.assignment_time
+            )
+            for record in snapshot.short_id_records
+        )
+        if has_short_ids:
+            # restored short ids were assigned before short ids added since the node started
+            self._tx_assignment_expire_queue.sort()
+        for block_hash, short_ids in snapshot.short_ids_seen_in_block:
+            if block_hash in self._short_ids_seen_in_block:
+                self._short_ids_seen_in_block_count -= len(self._short_ids_seen_in_block[block_hash])
+            self._short_ids_seen_in_block[block_hash] = short_ids
+            self._short_ids_seen_in_block_count += len(short_ids)
+
+        logger.info("Restored {} short ids of transaction service for network {} from snapshot taken at {} in {:.3f}s.",
+                    len(snapshot.short_id_records), self.network_num, datetime.fromtimestamp(snapshot.snapshot_time),
+                    time.time() - start_time)
+        return len(snapshot.short_id_records)
+
+    def _load_snapshot_on_start(self) -> int:
+        self.load_snapshot()
+        return constants.CANCEL_ALARMS
+
+    def _init_removed_transactions_history(self) -> None:
+        self._removed_txs_expiration_time_s = self._get_removed_transactions_history_expiration_time_s()
+        if self.node.opts.removed_transactions_history_filter:
+            self._tx_hash_to_time_removed = self._create_removed_transactions_history_filter()
+            self._short_id_to_time_removed = self._create_removed_transactions_history_filter()
+        else:
+            self._tx_hash_to_time_removed = OrderedDict()
+            self._short_id_to_time_removed = OrderedDict()
+        self.node.alarm_queue.register_alarm(
+            constants.REMOVED_TRANSACTIONS_HISTORY_CLEANUP_INTERVAL_S,
+            self._cleanup_removed_transactions_history
+        )
+
+    def _init_block_cleanup(self) -> None:
+        # short ids of finalized blocks waiting to be removed in slices, with their removal reason
+        self._block_cleanup_short_ids: Deque[Tuple[int, TxRemovalReason]] = deque()
+        self._block_cleanup_time_budget_s = self.node.opts.block_cleanup_time_budget_ms / 1000
+        self.block_cleanup_alarm_scheduled = False
+        # totals of the slices of current clean up, logged once the backlog is empty
+        self._block_cleanup_start_time = 0.0
+        self._block_cleanup_duration_s = 0.0
+        self._block_cleanup_removed_count = 0
+        self._block_cleanup_slice_count = 0
+
+    def _init_metrics(self) -> None:
+        self.total_cached_transactions = total_cached_transactions.labels(self.network_num)
+        self.total_cached_transactions.set_function(
+            functools.partial(len, self._tx_cache_key_to_contents)
+        )
+        self.total_cached_transactions_size = total_cached_transactions_size.labels(self.network_num)
+        self.total_cached_transactions_size.set_function(
+            functools.partial(utils.identity, self._total_tx_contents_size)
+        )
+        self.block_cleanup_backlog = block_cleanup_backlog.labels(self.network_num)
+        self.block_cleanup_backlog.set_function(
+            functools.partial(len, self._block_cleanup_short_ids)
+        )
+
+    def _init_snapshots(self) -> None:
+        self._snapshot_dir = self.node.opts.transaction_service_snapshot_dir
+        # snapshot being captured in slices, and short ids left to capture
+        self._snapshot_writer: Optional[SnapshotWriter] = None
+        self._snapshot_short_id_items: Iterator[Tuple[int, float]] = iter(())
+        self._snapshot_write: Optional[Future] = None
+        if not self._snapshot_dir:
+            return
+
+        self.node.snapshot_tx_services.append(self)
+        # restored once the node starts, after subclasses finish setting up their data structures
+        self.node.alarm_queue.register_alarm(0, self._load_snapshot_on_start)
+        self.node.alarm_queue.register_alarm(
+            constants.TRANSACTION_SERVICE_SNAPSHOT_INTERVAL_S,
+            self._save_snapshot_periodically
+        )
+
+    def _save_snapshot_periodically(self) -> float:
+        """
+        Captures state in slices limited by time budget, to let the event loop process network events in between.
+        Once captured, the snapshot file is written by a thread of the node requester.
+        """
+        writer = self._snapshot_writer
+        if writer is None:
+            snapshot_write = self._snapshot_write
+            if snapshot_write is not None and not snapshot_write.done():
+                logger.debug("Previous snapshot of transaction service for network {} is still being written.",
+                             self.network_num)
+                return constants.TRANSACTION_SERVICE_SNAPSHOT_INTERVAL_S
+            writer = SnapshotWriter(self.network_num, time.time())
+            self._snapshot_writer = writer
+            # short ids assigned after the capture started are left for the next snapshot
+            self._snapshot_short_id_items = iter(list(self._tx_assignment_expire_queue.queue.items()))
+
+        deadline = time.time() + constants.TRANSACTION_SERVICE_SNAPSHOT_SLICE_TIME_BUDGET_S
+        if not self._capture_snapshot_short_ids(writer, self._snapshot_short_id_items, deadline):
+            return constants.TRANSACTION_SERVICE_SNAPSHOT_SLICE_INTERVAL_S
+
+        self._capture_snapshot_short_ids_seen_in_block(writer)
+        self._snapshot_writer = None
+        self._snapshot_write = self.node.requester.send_threaded_request(self._write_snapshot, writer)
+        return constants.TRANSACTION_SERVICE_SNAPSHOT_INTERVAL_S
+
+    def _capture_snapshot_short_ids(
+        self,
+        writer: SnapshotWriter,
+        short_id_items: Iterator[Tuple[int, float]],
+        deadline: Optional[float] = None
+    ) -> bool:
+        """
+        Adds short id records to the snapshot until there are no more short ids or the deadline passes.
+
+        :return: if all short ids were captured
+        """
+        for short_id, assignment_time in short_id_items:
+            transaction_info = self.get_transaction(short_id)
+            if transaction_info.hash is not None:
+                writer.add_short_id_record(
+                    SnapshotShortIdRecord(
+                        short_id,
+                        self.get_short_id_transaction_type(short_id),
+                        assignment_time,
+                        transaction_info.hash,
+                        transaction_info.contents
+                    )
+                )
+            if deadline is not None and time.time() >= deadline:
+                return False
+        return True
+
+    def _capture_snapshot_short_ids_seen_in_block(self, writer: SnapshotWriter) -> None:
+        for block_hash, short_ids in self._short_ids_seen_in_block.items():
+            writer.add_short_ids_seen_in_block(block_hash, short_ids)
+
+    def _write_snapshot(self, writer: SnapshotWriter) -> int:
+        """
+        Writes captured snapshot to the snapshot file, may be called outside of the event loop thread.
+
+        :return: number of bytes written
+        """
+        start_time = time.time()
+        file_path = transaction_service_snapshot.get_snapshot_file_path(self._snapshot_dir, self.network_num)
+        try:
+            snapshot_size = writer.write(file_path)
+        except OSError as e:
+            logger.warning(log_messages.TRANSACTION_SERVICE_SNAPSHOT_FAILURE, "save", file_path, e)
+            return 0
+
+        logger.debug("Saved {} short ids ({} bytes) of transaction service for network {} to {} in {:.3f}s, "
+                     "captured at {}.", writer.short_id_record_count, snapshot_size, self.network_num, file_path,
+                     time.time() - start_time, datetime.fromtimestamp(writer.snapshot_time))
+        return snapshot_size
+
     def _memory_limit_clean_up(self) -> None:
         """
-        Removes oldest transactions if total bytes consumed by transaction contents exceed memory limit
+        Removes transactions selected by eviction policy if total bytes consumed by transaction contents
+        exceed memory limit. Transactions without short ids are removed after all short ids are evicted.
         """
         if self._total_tx_contents_size <= self._tx_content_memory_limit:
             return
@@ -1287,21 +1824,35 @@ class TransactionService:
                      self._tx_content_memory_limit, self._total_tx_contents_size)
         removed_tx_count = 0
 
-        while self._is_exceeding_memory_limit() and self._tx_assignment_expire_queue:
-            self._tx_assignment_expire_queue.remove_oldest(
-                remove_callback=self.remove_transaction_by_short_id,
-                removal_reason=TxRemovalReason.MEMORY_LIMIT
-            )
+        while self._is_exceeding_memory_limit():
+            # batch is sized for transactions of average contents size
+            average_contents_size = self._total_tx_contents_size / max(len(self._tx_cache_key_to_contents), 1)
+            excess_size = self._total_tx_contents_size - self._tx_content_memory_limit
+            short_ids = self._eviction_policy.evict(max(int(excess_size / average_contents_size), 1))
+            if not short_ids:
+                break
+
+            for short_id in short_ids:
+                self.remove_transaction_by_short_id(short_id, removal_reason=TxRemovalReason.MEMORY_LIMIT)
+                self._tx_assignment_expire_queue.remove(short_id)
+            removed_tx_count += len(short_ids)
+
+        while self._is_exceeding_memory_limit() and self.tx_hashes_without_short_id:
+            self.tx_hashes_without_short_id.remove_oldest(remove_callback=self._remove_transaction_without_short_id)
             removed_tx_count += 1
-        if self._is_exceeding_memory_limit() and not self._tx_assignment_expire_queue:
+
+        if self._is_exceeding_memory_limit():
             logger.warning(log_messages.SID_MEMORY_MANAGEMENT_FAILURE, self.get_cache_state_json())
             removed_tx_count += len(self._tx_cache_key_to_contents)
             self.clear()
 
         self._total_tx_removed_by_memory_limit += removed_tx_count
-        logger.trace("Removed {} oldest transactions from transaction service cache. Size after clean up: {}",
+        logger.trace("Removed {} transactions from transaction service cache. Size after clean up: {}",
                      removed_tx_count, self._total_tx_contents_size)
 
+    def _remove_transaction_without_short_id(self, transaction_hash: Sha256Hash) -> None:
+        self.remove_transaction_by_key(self.get_transaction_key(transaction_hash), assume_no_sid=True)
+
     def _get_final_tx_confirmations_count(self) -> int:
         """
         Returns configuration value of number of block confirmations required before transaction can be removed
@@ -1330,6 +1881,22 @@ class TransactionService:
 
         return constants.REMOVED_TRANSACTIONS_HISTORY_EXPIRATION_S
 
+    @staticmethod
+    def _get_time_removed_lookup(
+        removed_transactions_history: Union[OrderedDict, TimeRotatedBloomFilter]
+    ) -> Callable[[Any], float]:
+        if isinstance(removed_transactions_history, TimeRotatedBloomFilter):
+            return removed_transactions_history.get_time_added_upper_bound
+        return removed_transactions_history.__getitem__
+
+    def _create_removed_transactions_history_filter(self) -> TimeRotatedBloomFilter:
+        return TimeRotatedBloomFilter(
+            self._removed_txs_expiration_time_s,
+            constants.REMOVED_TRANSACTIONS_HISTORY_LENGTH_LIMIT,
+            constants.REMOVED_TRANSACTIONS_HISTORY_FILTER_GENERATIONS,
+            constants.REMOVED_TRANSACTIONS_HISTORY_FILTER_FALSE_POSITIVE_RATE
+        )
+
     def _get_tx_contents_memory_limit(self) -> int:
         """
         Returns configuration value for memory limit for total transaction contents
@@ -1354,7 +1921,11 @@ class TransactionService:
         )
         return constants.DEFAULT_TX_CACHE_MEMORY_LIMIT_BYTES
 
-    def _tx_hash_to_cache_key(self, transaction_hash: Union[Sha256Hash, bytes, bytearray, memoryview, str]) -> str:
+    def _tx_hash_to_cache_key(
+        self, transaction_hash: Union[Sha256Hash, bytes, bytearray, memoryview, str]
+    ) -> Union[str, bytes]:
+        if self._binary_tx_cache_keys:
+            return self._tx_hash_to_binary_cache_key(transaction_hash)
 
         if isinstance(transaction_hash, Sha256Hash):
             return convert.bytes_to_hex(transaction_hash.binary)
@@ -1368,6 +1939,24 @@ class TransactionService:
 
         raise ValueError("Attempted to find cache entry with incorrect key type")
 
+    def _tx_hash_to_binary_cache_key(
+        self, transaction_hash: Union[Sha256Hash, bytes, bytearray, memoryview, str]
+    ) -> bytes:
+        if isinstance(transaction_hash, Sha256Hash):
+            transaction_hash = transaction_hash.binary
+
+        if isinstance(transaction_hash, bytes):
+            return transaction_hash
+
+        if isinstance(transaction_hash, (bytearray, memoryview)):
+            return bytes(transaction_hash)
+
+        # pyre-fixme[25]: Assertion will always fail.
+        if isinstance(transaction_hash, str):
+            return bytes(convert.hex_to_bytes(transaction_hash))
+
+        raise ValueError("Attempted to find cache entry with incorrect key type")
+
     def _wrap_sha256(self, transaction_hash: Union[bytes, bytearray, memoryview, Sha256Hash]) -> Sha256Hash:
         if isinstance(transaction_hash, Sha256Hash):
             return transaction_hash
@@ -1388,6 +1977,41 @@ class TransactionService:
         # pyre-fixme[6]:
         return Sha256Hash(convert.hex_to_bytes(transaction_cache_key))
 
+    def _get_contents_length(self, transaction_cache_key: TransactionCacheKeyType) -> int:
+        tx_cache_key_to_contents = self._tx_cache_key_to_contents
+        if isinstance(tx_cache_key_to_contents, SlabContentsStore):
+            return tx_cache_key_to_contents.get_length(transaction_cache_key)
+        return len(tx_cache_key_to_contents[transaction_cache_key])
+
+    def _add_transaction_batch_item(
+        self,
+        transaction_key: TransactionKey,
+        short_id: Optional[int],
+        transaction_contents: Optional[Union[bytearray, memoryview]]
+    ) -> Tuple[bool, bool, int]:
+        """
+        Stores short id and contents of a single batch item
+        :return: tuple of flags if the transaction has short id and contents after the update,
+        and the size of replaced transaction contents
+        """
+        transaction_cache_key = transaction_key.transaction_cache_key
+        previous_size = 0
+
+        if transaction_contents is not None:
+            if transaction_cache_key in self._tx_cache_key_to_contents:
+                previous_size = self._get_contents_length(transaction_cache_key)
+            self._tx_cache_key_to_contents[transaction_cache_key] = transaction_contents
+
+        if short_id is not None:
+            self._tx_cache_key_to_short_ids[transaction_cache_key].add(short_id)
+            self._short_id_to_tx_cache_key[short_id] = transaction_cache_key
+
+        return (
+            transaction_cache_key in self._tx_cache_key_to_short_ids,
+            transaction_cache_key in self._tx_cache_key_to_contents,
+            previous_size
+        )
+
     def _track_seen_transaction(self, transaction_cache_key):
         pass
 
@@ -1401,10 +2025,13 @@ class TransactionService:
         return self._total_tx_contents_size > self._tx_content_memory_limit
 
     def clear(self) -> None:
+        self._eviction_policy.clear()
         self._tx_cache_key_to_contents.clear()
         self._tx_cache_key_to_short_ids.clear()
         self._short_id_to_tx_cache_key.clear()
         self._short_ids_seen_in_block.clear()
+        self._short_ids_seen_in_block_count = 0
+        self._block_cleanup_short_ids.clear()
         self._short_id_to_tx_flag.clear()
         self.tx_hashes_without_content.clear()
         self.tx_hashes_without_short_id.clear()
@@ -1450,6 +2077,11 @@ class TransactionService:
         )
 
         current_time = time.time()
+        if isinstance(self._tx_hash_to_time_removed, TimeRotatedBloomFilter):
+            self._tx_hash_to_time_removed.cleanup(current_time)
+            self._short_id_to_time_removed.cleanup(current_time)
+            return constants.REMOVED_TRANSACTIONS_HISTORY_CLEANUP_INTERVAL_S
+
         tx_hash_history_len_before = len(self._tx_hash_to_time_removed)
         if self._tx_hash_to_time_removed:
             oldest_tx = next(iter(self._tx_hash_to_time_removed))
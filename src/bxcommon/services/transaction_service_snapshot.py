@@ -0,0 +1,211 @@
+import mmap
+import os
+import struct
+from typing import List, Tuple, NamedTuple, Optional, Union, Set
+
+from bxcommon import constants
+from bxcommon.models.transaction_flag import TransactionFlag
+from bxcommon.utils import crypto
+from bxcommon.utils.object_hash import Sha256Hash
+
+SNAPSHOT_MAGIC = b"BXTS"
+SNAPSHOT_VERSION = 1
+
+# magic, version, network number, snapshot time, short id record count, seen in block entry count
+_HEADER = struct.Struct("<4sHIdII")
+# short id, transaction flag, assignment time, transaction hash, transaction contents length
+_SHORT_ID_RECORD = struct.Struct(f"<LHd{crypto.SHA256_HASH_LEN}sL")
+# block hash, short id count
+_SEEN_IN_BLOCK_ENTRY = struct.Struct(f"<{crypto.SHA256_HASH_LEN}sL")
+
+# contents length of short id records that carry no contents
+# (transaction contents unknown or already stored with a previous short id of the same transaction)
+NO_CONTENTS = 0xFFFFFFFF
+
+
+class SnapshotShortIdRecord(NamedTuple):
+    short_id: int
+    transaction_flag: TransactionFlag
+    assignment_time: float
+    transaction_hash: Sha256Hash
+    transaction_contents: Optional[Union[bytearray, memoryview]]
+
+
+class TransactionServiceSnapshot(NamedTuple):
+    network_num: int
+    snapshot_time: float
+    # ordered by assignment time, oldest first
+    short_id_records: List[SnapshotShortIdRecord]
+    short_ids_seen_in_block: List[Tuple[Sha256Hash, List[int]]]
+
+
+def get_snapshot_file_path(directory: str, network_num: int) -> str:
+    return os.path.join(directory, f"tx_service_{network_num}.snapshot")
+
+
+class SnapshotWriter:
+    """
+    Packs transaction service state into a snapshot incrementally, so the state can be captured in slices
+    between network events and written to a file outside of the event loop.
+    Records are expected to be added in order of assignment time, contents of a transaction are written only once
+    with its oldest short id.
+    """
+
+    def __init__(self, network_num: int, snapshot_time: float) -> None:
+        self.network_num = network_num
+        self.snapshot_time = snapshot_time
+        self.short_id_record_count = 0
+        self.seen_in_block_count = 0
+
+        self._short_id_chunks: List[bytes] = []
+        self._seen_in_block_chunks: List[bytes] = []
+        self._hashes_with_contents: Set[Sha256Hash] = set()
+
+    def add_short_id_record(self, record: SnapshotShortIdRecord) -> None:
+        short_id, transaction_flag, assignment_time, transaction_hash, transaction_contents = record
+        if transaction_contents is not None:
+            if transaction_hash in self._hashes_with_contents:
+                transaction_contents = None
+            else:
+                self._hashes_with_contents.add(transaction_hash)
+        contents_length = NO_CONTENTS if transaction_contents is None else len(transaction_contents)
+        self._short_id_chunks.append(
+            _SHORT_ID_RECORD.pack(
+                short_id, transaction_flag.value, assignment_time, bytes(transaction_hash.binary), contents_length
+            )
+        )
+        if transaction_contents is not None:
+            # copied, contents may be reused by the transaction service before the snapshot is written
+            self._short_id_chunks.append(bytes(transaction_contents))
+        self.short_id_record_count += 1
+
+    def add_short_ids_seen_in_block(self, block_hash: Sha256Hash, short_ids: List[int]) -> None:
+        self._seen_in_block_chunks.append(_SEEN_IN_BLOCK_ENTRY.pack(bytes(block_hash.binary), len(short_ids)))
+        self._seen_in_block_chunks.append(struct.pack(f"<{len(short_ids)}L", *short_ids))
+        self.seen_in_block_count += 1
+
+    def write(self, file_path: str) -> int:
+        """
+        Writes packed state to a file. The file is replaced atomically once its contents are flushed to disk,
+        so a crash during the write leaves previous snapshot in place.
+
+        :param file_path: snapshot file path
+        :return: number of bytes written
+        """
+        temp_file_path = f"{file_path}.tmp"
+        with open(temp_file_path, "wb") as file_handle:
+            file_handle.write(
+                _HEADER.pack(
+                    SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self.network_num, self.snapshot_time,
+                    self.short_id_record_count, self.seen_in_block_count
+                )
+            )
+            file_handle.writelines(self._short_id_chunks)
+            file_handle.writelines(self._seen_in_block_chunks)
+            bytes_written = file_handle.tell()
+            file_handle.flush()
+            os.fsync(file_handle.fileno())
+
+        os.replace(temp_file_path, file_path)
+        _fsync_directory(os.path.dirname(file_path))
+        return bytes_written
+
+
+def _fsync_directory(directory: str) -> None:
+    """
+    Flushes directory entries to disk, so a replaced file survives a crash. Directories can not be opened
+    on Windows, which persists the rename without it.
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    directory_fd = os.open(directory or os.curdir, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(directory_fd)
+    finally:
+        os.close(directory_fd)
+
+
+def write_snapshot(
+    file_path: str,
+    network_num: int,
+    snapshot_time: float,
+    short_id_records: List[SnapshotShortIdRecord],
+    short_ids_seen_in_block: List[Tuple[Sha256Hash, List[int]]]
+) -> int:
+    """
+    Writes transaction service state to a file, see `SnapshotWriter`.
+
+    :param file_path: snapshot file path
+    :param network_num: network number of the transaction service
+    :param snapshot_time: time the state was captured
+    :param short_id_records: short id records ordered by assignment time
+    :param short_ids_seen_in_block: block hashes and short ids seen in the blocks
+    :return: number of bytes written
+    """
+    writer = SnapshotWriter(network_num, snapshot_time)
+    for short_id_record in short_id_records:
+        writer.add_short_id_record(short_id_record)
+    for block_hash, short_ids in short_ids_seen_in_block:
+        writer.add_short_ids_seen_in_block(block_hash, short_ids)
+    return writer.write(file_path)
+
+
+def read_snapshot(file_path: str, min_assignment_time: float = 0) -> TransactionServiceSnapshot:
+    """
+    Reads transaction service state from a snapshot file. The file is memory mapped, so only transaction
+    contents of short ids that are not expired are copied out of it.
+
+    :param file_path: snapshot file path
+    :param min_assignment_time: short ids assigned before this time are skipped
+    :return: snapshot contents
+    """
+    with open(file_path, "rb") as file_handle, \
+            mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ) as snapshot_file, \
+            memoryview(snapshot_file) as snapshot_buffer:
+        magic, version, network_num, snapshot_time, short_id_count, seen_in_block_count = \
+            _HEADER.unpack_from(snapshot_buffer, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported transaction service snapshot format: {magic}, version {version}.")
+        offset = _HEADER.size
+
+        short_id_records = []
+        # contents stored with expired short ids, kept for other short ids of the same transaction
+        expired_contents_offsets = {}
+        for _ in range(short_id_count):
+            short_id, flag_value, assignment_time, hash_bytes, contents_length = \
+                _SHORT_ID_RECORD.unpack_from(snapshot_buffer, offset)
+            offset += _SHORT_ID_RECORD.size
+
+            contents_offset = offset
+            if contents_length == NO_CONTENTS:
+                contents_offset, contents_length = expired_contents_offsets.pop(hash_bytes, (0, NO_CONTENTS))
+            else:
+                offset += contents_length
+
+            if assignment_time < min_assignment_time:
+                if contents_length != NO_CONTENTS:
+                    expired_contents_offsets[hash_bytes] = (contents_offset, contents_length)
+                continue
+
+            transaction_contents = None
+            if contents_length != NO_CONTENTS:
+                transaction_contents = bytearray(snapshot_buffer[contents_offset:contents_offset + contents_length])
+            short_id_records.append(
+                SnapshotShortIdRecord(
+                    short_id,
+                    TransactionFlag(flag_value),
+                    assignment_time,
+                    Sha256Hash(bytearray(hash_bytes)),
+                    transaction_contents
+                )
+            )
+
+        short_ids_seen_in_block = []
+        for _ in range(seen_in_block_count):
+            hash_bytes, count = _SEEN_IN_BLOCK_ENTRY.unpack_from(snapshot_buffer, offset)
+            offset += _SEEN_IN_BLOCK_ENTRY.size
+            short_ids = list(struct.unpack_from(f"<{count}L", snapshot_buffer, offset))
+            offset += count * constants.UL_INT_SIZE_IN_BYTES
+            short_ids_seen_in_block.append((Sha256Hash(bytearray(hash_bytes)), short_ids))
+
+    return TransactionServiceSnapshot(network_num, snapshot_time, short_id_records, short_ids_seen_in_block)
@@ -0,0 +1,93 @@
+from bxcommon.models.transaction_eviction_policy_type import TransactionEvictionPolicyType
+from bxcommon.models.transaction_flag import TransactionFlag
+from bxcommon.services.transaction_service import TransactionBatchItem
+from bxcommon.test_utils.abstract_transaction_service_test_case import AbstractTransactionServiceTestCase
+
+
+# pylint: disable=protected-access,abstract-method
+class AbstractTransactionServiceMemoryLimitTestCase(AbstractTransactionServiceTestCase):
+    """
+    Memory limit tests of transaction services, separate from `AbstractTransactionServiceTestCase` to keep
+    it at a manageable size.
+    """
+
+    def _test_contents_memory_limit_largest_first(self):
+        self.mock_node.opts.transaction_eviction_policy = TransactionEvictionPolicyType.LARGEST_FIRST
+        self.transaction_service = self._get_transaction_service()
+
+        small_transactions = self._add_transactions(10, 500)
+        large_transactions = self._add_transactions(5, 1000, short_id_offset=100)
+        stats = self.transaction_service.get_aggregate_stats()
+        self.assertEqual(0, stats["aggregate"]["transactions_removed_by_memory_limit"])
+
+        self._add_transactions(1, 800, short_id_offset=200)
+        stats = self.transaction_service.get_aggregate_stats()
+        self.assertEqual(1, stats["aggregate"]["transactions_removed_by_memory_limit"])
+        self.assertFalse(self.transaction_service.has_short_id(large_transactions[0].short_id))
+        for transaction_info in small_transactions + large_transactions[1:]:
+            self.assertTrue(self.transaction_service.has_short_id(transaction_info.short_id))
+
+    def _test_contents_memory_limit_flag_aware(self):
+        self.mock_node.opts.transaction_eviction_policy = TransactionEvictionPolicyType.FLAG_AWARE
+        self.transaction_service = self._get_transaction_service()
+
+        transactions = self._add_transactions(20, 500)
+        paid_short_ids = [transaction_info.short_id for transaction_info in transactions[::2]]
+        for short_id in paid_short_ids:
+            self.transaction_service.set_short_id_transaction_type(short_id, TransactionFlag.PAID_TX)
+
+        self._add_transactions(4, 500, short_id_offset=100)
+        for transaction_info in transactions:
+            expected = transaction_info.short_id in paid_short_ids or transaction_info.short_id > 8
+            self.assertEqual(expected, self.transaction_service.has_short_id(transaction_info.short_id))
+
+    def _test_contents_memory_limit_fee_aware(self):
+        self.mock_node.opts.transaction_eviction_policy = TransactionEvictionPolicyType.FLAG_AWARE
+        self.transaction_service = self._get_transaction_service()
+
+        transactions = self._add_transactions(20, 500)
+        for transaction_info in transactions:
+            # fees of older transactions are higher
+            self.transaction_service.set_short_id_fee(transaction_info.short_id, 100 - transaction_info.short_id)
+        self.transaction_service.set_short_id_transaction_type(transactions[-1].short_id, TransactionFlag.PAID_TX)
+
+        # lowest fee unpaid transactions are evicted
+        self._add_transactions(1, 4 * 500, short_id_offset=100)
+        stats = self.transaction_service.get_aggregate_stats()
+        self.assertEqual(4, stats["aggregate"]["transactions_removed_by_memory_limit"])
+        for transaction_info in transactions:
+            expected = transaction_info.short_id < 16 or transaction_info.short_id == 20
+            self.assertEqual(expected, self.transaction_service.has_short_id(transaction_info.short_id))
+
+    def _test_contents_memory_limit_without_short_ids(self):
+        tx_size = 500
+        tx_count = self.transaction_service._tx_content_memory_limit // tx_size + 2
+        transaction_keys = []
+        for _ in range(tx_count):
+            tx_hash, tx_content = self.get_fake_tx(tx_size)
+            transaction_key = self.transaction_service.get_transaction_key(tx_hash)
+            self.transaction_service.set_transaction_contents_by_key(transaction_key, tx_content)
+            transaction_keys.append(transaction_key)
+
+        self.assertEqual(tx_count - 2, len(self.transaction_service._tx_cache_key_to_contents))
+        for i, transaction_key in enumerate(transaction_keys):
+            self.assertEqual(i >= 2, self.transaction_service.has_transaction_contents_by_key(transaction_key))
+
+    def _test_add_transactions_by_key_memory_limit(self):
+        tx_size = 500
+        memory_limit_bytes = int(self.TEST_MEMORY_LIMIT_MB * 1000000)
+        tx_count = int(memory_limit_bytes / tx_size) * 2
+
+        batch_items = []
+        for i in range(tx_count):
+            tx_hash, tx_content = self.get_fake_tx(tx_size)
+            batch_items.append(
+                TransactionBatchItem(self.transaction_service.get_transaction_key(tx_hash), i + 1, tx_content)
+            )
+        self.transaction_service.add_transactions_by_key(batch_items)
+
+        self.assertLessEqual(self.transaction_service._total_tx_contents_size, memory_limit_bytes)
+        for transaction_key, short_id, tx_content, _, _ in batch_items[-10:]:
+            self.assertTrue(self.transaction_service.has_short_id(short_id))
+            self.assertEqual(tx_content, self.transaction_service.get_transaction_by_key(transaction_key))
+        self.assertFalse(self.transaction_service.has_short_id(1))
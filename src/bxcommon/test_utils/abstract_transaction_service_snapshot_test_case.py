@@ -0,0 +1,170 @@
+import os
+import tempfile
+import time
+
+from mock import MagicMock, patch
+
+from bxcommon import constants
+from bxcommon.models.transaction_flag import TransactionFlag
+from bxcommon.services import transaction_service_snapshot
+from bxcommon.services.transaction_service import TransactionBatchItem
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_transaction_service_test_case import AbstractTransactionServiceTestCase
+from bxcommon.utils import crypto
+from bxcommon.utils.object_hash import Sha256Hash
+
+
+# pylint: disable=protected-access,abstract-method
+class AbstractTransactionServiceSnapshotTestCase(AbstractTransactionServiceTestCase):
+    """
+    Snapshot tests of transaction services, separate from `AbstractTransactionServiceTestCase` to keep
+    it at a manageable size.
+    """
+
+    def _test_save_and_load_snapshot(self):
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            self.mock_node.opts.transaction_service_snapshot_dir = snapshot_dir
+            self.transaction_service = self._get_transaction_service()
+
+            expired_tx_hash, expired_tx_content = self.get_fake_tx()
+            multi_sid_tx_hash, multi_sid_tx_content = self.get_fake_tx()
+            paid_tx_hash, paid_tx_content = self.get_fake_tx()
+            no_content_tx_hash, _ = self.get_fake_tx()
+            block_hash = Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN))
+
+            expired_tx_key = self.transaction_service.get_transaction_key(expired_tx_hash)
+            multi_sid_tx_key = self.transaction_service.get_transaction_key(multi_sid_tx_hash)
+            paid_tx_key = self.transaction_service.get_transaction_key(paid_tx_hash)
+            no_content_tx_key = self.transaction_service.get_transaction_key(no_content_tx_hash)
+            self.transaction_service.add_transactions_by_key([
+                TransactionBatchItem(expired_tx_key, 1, expired_tx_content),
+                TransactionBatchItem(multi_sid_tx_key, 2, multi_sid_tx_content),
+                TransactionBatchItem(paid_tx_key, 3, paid_tx_content, TransactionFlag.PAID_TX),
+                TransactionBatchItem(no_content_tx_key, 4),
+                TransactionBatchItem(multi_sid_tx_key, 5),
+            ])
+            expired_time = time.time() - self.mock_node.opts.sid_expire_time - 1
+            for short_id in [1, 2]:
+                self.transaction_service._tx_assignment_expire_queue.queue[short_id] = expired_time
+            self.transaction_service._short_ids_seen_in_block[block_hash] = [3, 4]
+
+            self.transaction_service.save_snapshot()
+            self.transaction_service = self._get_transaction_service()
+            self.assertEqual(3, self.transaction_service.load_snapshot())
+
+            self.assertFalse(self.transaction_service.has_short_id(1))
+            self.assertFalse(self.transaction_service.has_transaction_contents(expired_tx_hash))
+            self.assertFalse(self.transaction_service.has_short_id(2))
+            self.assertEqual(
+                (multi_sid_tx_hash, multi_sid_tx_content, 5), self.transaction_service.get_transaction(5)
+            )
+            self.assertEqual((paid_tx_hash, paid_tx_content, 3), self.transaction_service.get_transaction(3))
+            self.assertEqual(TransactionFlag.PAID_TX, self.transaction_service.get_short_id_transaction_type(3))
+            self.assertEqual((no_content_tx_hash, None, 4), self.transaction_service.get_transaction(4))
+            self.assertEqual(
+                [(block_hash, [3, 4])], list(self.transaction_service.iter_short_ids_seen_in_block())
+            )
+            self.assertEqual(
+                len(multi_sid_tx_content) + len(paid_tx_content), self.transaction_service._total_tx_contents_size
+            )
+
+    @patch("bxcommon.constants.TRANSACTION_SERVICE_SNAPSHOT_SLICE_TIME_BUDGET_S", 0)
+    def _test_save_snapshot_periodically(self):
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            self.mock_node.opts.transaction_service_snapshot_dir = snapshot_dir
+            self.transaction_service = self._get_transaction_service()
+            self.assertIn(self.transaction_service, self.mock_node.snapshot_tx_services)
+            self.mock_node.requester.send_threaded_request = MagicMock()
+
+            txs = [self.get_fake_tx() for _ in range(4)]
+            self.transaction_service.add_transactions_by_key(
+                TransactionBatchItem(self.transaction_service.get_transaction_key(tx_hash), short_id, tx_content)
+                for short_id, (tx_hash, tx_content) in enumerate(txs[:3], 1)
+            )
+
+            # each slice captures a single short id
+            self.assertEqual(
+                constants.TRANSACTION_SERVICE_SNAPSHOT_SLICE_INTERVAL_S,
+                self.transaction_service._save_snapshot_periodically()
+            )
+            # short ids removed or assigned during the capture are not in the snapshot
+            self.transaction_service.remove_transaction_by_short_id(3)
+            self.transaction_service.assign_short_id_by_key(
+                self.transaction_service.get_transaction_key(txs[3][0]), 4
+            )
+            self.assertEqual(
+                constants.TRANSACTION_SERVICE_SNAPSHOT_SLICE_INTERVAL_S,
+                self.transaction_service._save_snapshot_periodically()
+            )
+            self.assertEqual(
+                constants.TRANSACTION_SERVICE_SNAPSHOT_SLICE_INTERVAL_S,
+                self.transaction_service._save_snapshot_periodically()
+            )
+            self.mock_node.requester.send_threaded_request.assert_not_called()
+            self.assertEqual(
+                constants.TRANSACTION_SERVICE_SNAPSHOT_INTERVAL_S,
+                self.transaction_service._save_snapshot_periodically()
+            )
+
+            # file is written outside of the event loop
+            self.mock_node.requester.send_threaded_request.assert_called_once()
+            write_snapshot, writer = self.mock_node.requester.send_threaded_request.call_args[0]
+            self.assertLess(0, write_snapshot(writer))
+
+            self.transaction_service = self._get_transaction_service()
+            self.assertEqual(2, self.transaction_service.load_snapshot())
+            for short_id, (tx_hash, tx_content) in enumerate(txs[:2], 1):
+                self.assertEqual((tx_hash, tx_content, short_id), self.transaction_service.get_transaction(short_id))
+            self.assertFalse(self.transaction_service.has_short_id(3))
+            self.assertFalse(self.transaction_service.has_short_id(4))
+
+    def _test_load_snapshot_after_new_short_ids(self):
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            self.mock_node.opts.transaction_service_snapshot_dir = snapshot_dir
+            self.transaction_service = self._get_transaction_service()
+
+            txs = [self.get_fake_tx() for _ in range(3)]
+            tx_keys = [self.transaction_service.get_transaction_key(tx_hash) for tx_hash, _ in txs]
+            assignment_time = time.time() - 10
+            self.transaction_service.add_transactions_by_key([
+                TransactionBatchItem(tx_keys[0], 1, txs[0][1], assignment_time=assignment_time),
+                TransactionBatchItem(tx_keys[1], 2, txs[1][1], assignment_time=assignment_time + 1),
+            ])
+            self.transaction_service.save_snapshot()
+
+            self.transaction_service = self._get_transaction_service()
+            self.transaction_service.add_transactions_by_key([TransactionBatchItem(tx_keys[2], 3, txs[2][1])])
+            self.assertEqual(2, self.transaction_service.load_snapshot())
+
+            # restored short ids expire first
+            self.assertEqual([1, 2, 3], list(self.transaction_service.iter_short_ids_from_oldest()))
+            self.assertEqual(
+                assignment_time, self.transaction_service._tx_assignment_expire_queue.get_oldest_item_timestamp()
+            )
+
+    def _test_load_snapshot_invalid_file(self):
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            self.mock_node.opts.transaction_service_snapshot_dir = snapshot_dir
+            self.transaction_service = self._get_transaction_service()
+            self.assertEqual(0, self.transaction_service.load_snapshot())
+
+            with open(transaction_service_snapshot.get_snapshot_file_path(snapshot_dir, 0), "wb") as file_handle:
+                file_handle.write(helpers.generate_bytearray(100))
+            self.assertEqual(0, self.transaction_service.load_snapshot())
+            self.assertEqual(0, self.transaction_service.get_short_id_count())
+
+    def _test_save_snapshot_syncs_to_disk(self):
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            self.mock_node.opts.transaction_service_snapshot_dir = snapshot_dir
+            self.transaction_service = self._get_transaction_service()
+            self._add_transactions(3, 100)
+
+            with patch("os.fsync", wraps=os.fsync) as fsync_mock:
+                self.transaction_service.save_snapshot()
+
+            # snapshot file contents before it replaces previous snapshot, then the directory entry
+            self.assertEqual(2, fsync_mock.call_count)
+            self.assertEqual(
+                [transaction_service_snapshot.get_snapshot_file_path(snapshot_dir, 0)],
+                [os.path.join(snapshot_dir, file_name) for file_name in os.listdir(snapshot_dir)]
+            )
@@ -1,3 +1,4 @@
+import itertools
 import time
 from abc import ABCMeta, abstractmethod
 
@@ -6,13 +7,14 @@ from mock import MagicMock, patch
 from bxcommon import constants
 from bxcommon.constants import NULL_TX_SID
 from bxcommon.messages.bloxroute import short_ids_serializer
+from bxcommon.messages.bloxroute.compressed_block_txs_message import CompressedBlockTxsMessage
 from bxcommon.messages.bloxroute.tx_message import TxMessage
 from bxcommon.messages.bloxroute.tx_service_sync_txs_message import TxServiceSyncTxsMessage
 from bxcommon.messages.bloxroute.txs_serializer import TxContentShortIds
 from bxcommon.models.node_type import NodeType
 from bxcommon.models.transaction_flag import TransactionFlag
 from bxcommon.models.transaction_info import TransactionInfo
-from bxcommon.services.transaction_service import TransactionService
+from bxcommon.services.transaction_service import TransactionService, TransactionBatchItem
 from bxcommon.test_utils import helpers
 from bxcommon.test_utils.abstract_test_case import AbstractTestCase
 from bxcommon.test_utils.mocks.mock_node import MockNode
@@ -319,6 +321,38 @@ class AbstractTransactionServiceTestCase(AbstractTestCase):
         self.assertFalse(self.transaction_service.has_transaction_contents(transaction_hashes[3]))
         self.assertFalse(self.transaction_service.has_transaction_contents(transaction_hashes[4]))
 
+    def _test_track_short_ids_seen_in_block_time_budget(self):
+        self.mock_node.opts.block_cleanup_time_budget_ms = 1
+        self.transaction_service = self._get_transaction_service()
+        self._add_transactions(4, 50)
+        self.transaction_service.set_final_tx_confirmations_count(2)
+
+        # each call of time.time advances 10ms, so every slice exceeds its time budget after a single removal
+        with patch("time.time", side_effect=itertools.count(time.time(), 0.01)), \
+                patch("bxcommon.services.transaction_service.logger_memory_cleanup") as logger_mock:
+            self.transaction_service.track_seen_short_ids(Sha256Hash(helpers.generate_bytearray(32)), [1, 2, 3])
+            self.transaction_service.track_seen_short_ids(Sha256Hash(helpers.generate_bytearray(32)), [4])
+            self._verify_txs_in_tx_service([1, 2, 3, 4], [])
+            self.assertEqual(3, self.transaction_service.get_cache_state_json()["block_cleanup_backlog_len"])
+            self.assertTrue(self.transaction_service.block_cleanup_alarm_scheduled)
+
+            self.transaction_service.node.alarm_queue.fire_alarms()
+            self._verify_txs_in_tx_service([2, 3, 4], [1])
+            self.assertEqual(2, self.transaction_service.get_cache_state_json()["block_cleanup_backlog_len"])
+
+            self.transaction_service.node.alarm_queue.fire_alarms()
+            self.transaction_service.node.alarm_queue.fire_alarms()
+            self._verify_txs_in_tx_service([4], [1, 2, 3])
+            self.assertEqual(0, self.transaction_service.get_cache_state_json()["block_cleanup_backlog_len"])
+            self.assertFalse(self.transaction_service.block_cleanup_alarm_scheduled)
+
+        # cache state is logged once for the whole clean up, not for each tracked block
+        cleanup_stats = [call[0][0] for call in logger_mock.statistics.call_args_list]
+        self.assertEqual(1, len(cleanup_stats))
+        self.assertEqual("TransactionServiceBlockCleanupSummary", cleanup_stats[0]["event"])
+        self.assertEqual(3, cleanup_stats[0]["removed_short_ids_count"])
+        self.assertEqual(3, cleanup_stats[0]["slice_count"])
+
     def _test_transactions_contents_memory_limit(self):
         tx_size = 500
         memory_limit_bytes = int(self.TEST_MEMORY_LIMIT_MB * 1000000)
@@ -434,6 +468,40 @@ class AbstractTransactionServiceTestCase(AbstractTestCase):
         self.transaction_service.log_tx_service_mem_stats(True)
         memory_statistics.flush_info()
 
+    def _test_memory_stats_incremental(self):
+        self.mock_node.opts.incremental_memory_stats = True
+        transactions = self._add_transactions(50, 100)
+        self.transaction_service.set_final_tx_confirmations_count(10)
+        self.transaction_service.track_seen_short_ids(
+            Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN)), [1, 2, 3]
+        )
+        block_hash = Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN))
+        self.transaction_service.track_seen_short_ids(block_hash, [4, 5])
+        self.assertEqual((2, 5), self.transaction_service.get_short_ids_seen_in_block_count_info())
+
+        self.transaction_service.on_block_cleaned_up(block_hash)
+        self.assertEqual((1, 3), self.transaction_service.get_short_ids_seen_in_block_count_info())
+
+        with patch("bxcommon.utils.memory_utils.get_object_size") as get_object_size_mock, \
+                patch("bxcommon.utils.memory_utils.asizeof") as asizeof_mock, \
+                patch("bxcommon.utils.stats.hooks.add_obj_mem_stats") as add_obj_mem_stats_mock:
+            self.transaction_service.log_tx_service_mem_stats(True)
+        get_object_size_mock.assert_not_called()
+        # no items are sized, sizes are derived from item counts and running counters
+        self.assertEqual([], asizeof_mock.mock_calls)
+
+        reported_sizes = {
+            call_args[0][3]: call_args[0][4] for call_args in add_obj_mem_stats_mock.call_args_list
+        }
+        self.assertIn("short_ids_seen_in_block", reported_sizes)
+        contents_size = reported_sizes["tx_cache_key_to_contents"]
+        self.assertGreater(contents_size.size, sum(len(transaction.contents) for transaction in transactions))
+        for object_size in reported_sizes.values():
+            self.assertGreaterEqual(object_size.size, 0)
+
+        self.transaction_service.clear()
+        self.assertEqual((0, 0), self.transaction_service.get_short_ids_seen_in_block_count_info())
+
     def _test_iter_transaction_hashes_from_oldest(self):
         transactions = self._add_transactions(30, 250)
         self.transaction_service = self._get_transaction_service()
@@ -535,6 +603,42 @@ class AbstractTransactionServiceTestCase(AbstractTestCase):
 
         self._verify_expired_removed_transactions(transactions, original_time, 10)
 
+    def _test_removed_transactions_history_filter(self):
+        self.mock_node.opts.removed_transactions_history_filter = True
+        self.transaction_service = self._get_transaction_service()
+        transactions = self._add_transactions(30, 250)
+
+        removal_time = time.time()
+        with patch("time.time", return_value=removal_time):
+            for transaction in transactions[:10]:
+                self.transaction_service.remove_transaction_by_short_id(transaction.short_id)
+            for transaction in transactions[10:20]:
+                self.transaction_service.remove_transaction_by_key(
+                    self.transaction_service.get_transaction_key(transaction.hash)
+                )
+
+        for i, transaction in enumerate(transactions):
+            transaction_key = self.transaction_service.get_transaction_key(transaction.hash)
+            self.assertEqual(i < 20, self.transaction_service.removed_transaction_by_key(transaction_key))
+
+        removed_time, removed_count = self.transaction_service.get_removed_tx_hash_time_and_count(
+            [transaction.hash for transaction in transactions]
+        )
+        self.assertEqual(20, removed_count)
+        self.assertEqual(removal_time, removed_time)
+        removed_time, removed_count = self.transaction_service.get_removed_short_id_time_and_count(
+            [transaction.short_id for transaction in transactions]
+        )
+        self.assertEqual(20, removed_count)
+        self.assertEqual(removal_time, removed_time)
+
+        expiration_time = self.transaction_service._removed_txs_expiration_time_s
+        with patch("time.time", return_value=removal_time + expiration_time + 1):
+            self.transaction_service._cleanup_removed_transactions_history()
+        for transaction in transactions:
+            transaction_key = self.transaction_service.get_transaction_key(transaction.hash)
+            self.assertFalse(self.transaction_service.removed_transaction_by_key(transaction_key))
+
     def _add_transactions(self, tx_count, tx_size, short_id_offset=0):
         transactions = []
 
@@ -730,6 +834,24 @@ class AbstractTransactionServiceTestCase(AbstractTestCase):
             self.assertIsNone(missing_tx.contents)
             self.assertIsNone(missing_tx.hash)
 
+    def _test_get_serialized_transactions(self):
+        transactions_set = self._add_transactions(20, 100)
+        existing_short_ids = list(map(lambda x: x[2], transactions_set))
+        missing_short_ids = [existing_short_ids[-1] + 1, existing_short_ids[-1] + 2]
+        serialized_short_ids = short_ids_serializer.serialize_short_ids(existing_short_ids + missing_short_ids)
+        block_hash = Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN))
+
+        found, missing = self.transaction_service.get_transactions(serialized_short_ids)
+        serialized_result = self.transaction_service.get_serialized_transactions(serialized_short_ids)
+
+        self.assertEqual(len(found), serialized_result.found_count)
+        self.assertEqual(missing, serialized_result.missing)
+
+        expected_message = CompressedBlockTxsMessage(5, block_hash, found)
+        message = CompressedBlockTxsMessage(5, block_hash, txs_bytes=serialized_result.found_txs_bytes)
+        self.assertEqual(expected_message.rawbytes(), message.rawbytes())
+        self.assertEqual(found, message.get_txs())
+
     def _test_clear(self):
         self._add_transactions(50, 100)
 
@@ -770,7 +892,7 @@ class AbstractTransactionServiceTestCase(AbstractTestCase):
 
         txs_sync_message = TxServiceSyncTxsMessage(1, txs_content_short_ids=content_short_ids)
 
-        result_items = self.transaction_service.process_tx_sync_message(txs_sync_message)
+        result_items = list(self.transaction_service.process_tx_sync_message(txs_sync_message))
 
         self.assertEqual(len(result_items), len(tx_hashes))
 
@@ -798,6 +920,44 @@ class AbstractTransactionServiceTestCase(AbstractTestCase):
                 assign_time = self.transaction_service.get_short_id_assign_time(sid)
                 self.assertTrue(assign_time > 0)
 
+    def _test_add_transactions_by_key(self):
+        tx_hash_1, tx_content_1 = self.get_fake_tx()
+        tx_hash_2, tx_content_2 = self.get_fake_tx()
+        tx_hash_3, _ = self.get_fake_tx()
+        transaction_key_1 = self.transaction_service.get_transaction_key(tx_hash_1)
+        transaction_key_2 = self.transaction_service.get_transaction_key(tx_hash_2)
+        transaction_key_3 = self.transaction_service.get_transaction_key(tx_hash_3)
+
+        self.transaction_service.add_transactions_by_key([
+            TransactionBatchItem(transaction_key_1, 1, tx_content_1, TransactionFlag.PAID_TX),
+            TransactionBatchItem(transaction_key_1, 2),
+            TransactionBatchItem(transaction_key_2, None, tx_content_2),
+            TransactionBatchItem(transaction_key_3, 3),
+        ])
+
+        self.assertEqual({1, 2}, set(self.transaction_service.get_short_ids_by_key(transaction_key_1)))
+        self.assertEqual(tx_content_1, self.transaction_service.get_transaction_by_key(transaction_key_1))
+        self.assertEqual(TransactionFlag.PAID_TX, self.transaction_service.get_short_id_transaction_type(1))
+        self.assertEqual(TransactionFlag.NO_FLAGS, self.transaction_service.get_short_id_transaction_type(2))
+        self.assertEqual(tx_content_2, self.transaction_service.get_transaction_by_key(transaction_key_2))
+        self.assertFalse(self.transaction_service.has_transaction_short_id_by_key(transaction_key_2))
+        self.assertEqual(3, self.transaction_service.get_short_id_by_key(transaction_key_3))
+        self.assertFalse(self.transaction_service.has_transaction_contents_by_key(transaction_key_3))
+
+        self.assertEqual(len(tx_content_1) + len(tx_content_2), self.transaction_service._total_tx_contents_size)
+        self.assertEqual(3, len(self.transaction_service._tx_assignment_expire_queue))
+        self.assertEqual([tx_hash_2], list(self.transaction_service.tx_hashes_without_short_id.queue))
+        self.assertEqual([tx_hash_3], list(self.transaction_service.tx_hashes_without_content.queue))
+        self.assertTrue(self.transaction_service.tx_assign_alarm_scheduled)
+        self.assertTrue(self.transaction_service.tx_content_without_sid_alarm_scheduled)
+        self.assertTrue(self.transaction_service.tx_without_content_alarm_scheduled)
+
+        # contents arriving later for a transaction with short id only
+        self.transaction_service.add_transactions_by_key([TransactionBatchItem(transaction_key_3, None, tx_content_1)])
+        self.assertTrue(self.transaction_service.has_transaction_contents_by_key(transaction_key_3))
+        self.assertEqual(0, len(self.transaction_service.tx_hashes_without_content))
+        self.assertEqual(1, len(self.transaction_service.tx_hashes_without_short_id))
+
     def get_fake_tx(self, content_length=128):
         tx_hash = Sha256Hash(binary=helpers.generate_bytearray(crypto.SHA256_HASH_LEN))
         tx_content = helpers.generate_bytearray(content_length)
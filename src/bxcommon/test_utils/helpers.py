@@ -20,6 +20,7 @@ from bxcommon.models.blockchain_network_environment import BlockchainNetworkEnvi
 from bxcommon.models.blockchain_network_model import BlockchainNetworkModel
 from bxcommon.models.blockchain_network_type import BlockchainNetworkType
 from bxcommon.models.outbound_peer_model import OutboundPeerModel
+from bxcommon.models.transaction_eviction_policy_type import TransactionEvictionPolicyType
 from bxcommon.network.ip_endpoint import IpEndpoint
 from bxcommon.network.network_direction import NetworkDirection
 from bxcommon.test_utils.mocks.mock_node import MockNode
@@ -274,10 +275,22 @@ def get_common_opts(
             "dump_detailed_report_at_memory_usage": 100,
             "dump_removed_short_ids": False,
             "dump_removed_short_ids_path": "",
+            "transaction_service_snapshot_dir": "",
             "transaction_pool_memory_limit": 200000000,
             "use_extensions": constants.USE_EXTENSION_MODULES,
             "import_extensions": constants.USE_EXTENSION_MODULES,
             "tx_mem_pool_bucket_size": constants.DEFAULT_TX_MEM_POOL_BUCKET_SIZE,
+            "compact_short_id_index": False,
+            "binary_tx_cache_keys": False,
+            "transaction_contents_slab_size": 0,
+            "transaction_eviction_policy": TransactionEvictionPolicyType.OLDEST_FIRST,
+            "removed_transactions_history_filter": False,
+            "incremental_memory_stats": False,
+            "block_cleanup_time_budget_ms": 0,
+            "message_buffer_pool": False,
+            "message_compression": False,
+            "message_compression_min_size": constants.MESSAGE_COMPRESSION_MIN_SIZE_BYTES,
+            "tx_batch_max_delay_ms": 0,
             "throughput_stats_interval": constants.THROUGHPUT_STATS_INTERVAL_S,
             "info_stats_interval": constants.INFO_STATS_INTERVAL_S,
             "sync_tx_service": True,
@@ -11,12 +11,14 @@ from bxcommon.network.network_direction import NetworkDirection
 from bxcommon.utils import memory_utils
 from bxcommon.utils.buffers.input_buffer import InputBuffer
 from bxcommon.utils.buffers.output_buffer import OutputBuffer
+from bxcommon.utils.buffers.output_priority import OutputPriority
 from bxcommon.utils.memory_utils import SpecialMemoryProperties, SpecialTuple
 from bxcommon.models.broadcast_message_type import BroadcastMessageType
 
 
 class MockConnection(AbstractConnection, SpecialMemoryProperties):
     CONNECTION_TYPE = ConnectionType.EXTERNAL_GATEWAY
+    SEND_OUTPUT_BUFFER_BATCHES = False
 
     # pylint: disable=super-init-not-called
     def __init__(self, sock: AbstractSocketConnectionProtocol, node) -> None:
@@ -53,6 +55,7 @@ class MockConnection(AbstractConnection, SpecialMemoryProperties):
         self.node_privileges = "general"
         self.subscribed_broadcasts = [BroadcastMessageType.BLOCK]
         self.ping_alarm_id = None
+        self.output_flush_alarm_id = None
 
     def __repr__(self):
         return f"MockConnection<file_no: {self.file_no}, address: ({self.peer_ip}, {self.peer_port}), " \
@@ -81,18 +84,19 @@ class MockConnection(AbstractConnection, SpecialMemoryProperties):
         if not self.is_alive():
             return
 
-        self.outputbuf.enqueue_msgbytes(msg.rawbytes())
+        self.outputbuf.enqueue_msgbytes(msg.rawbytes(), msg.output_priority())
         self.enqueued_messages.append(msg)
 
     def enqueue_msg_bytes(
         self,
         msg_bytes: Union[bytearray, memoryview],
         prepend: bool = False,
+        priority: OutputPriority = OutputPriority.NORMAL,
     ):
         if not self.is_alive():
             return
 
-        self.outputbuf.enqueue_msgbytes(msg_bytes)
+        self.outputbuf.enqueue_msgbytes(msg_bytes, priority)
         self.enqueued_messages.append(msg_bytes)
 
     def process_message(self):
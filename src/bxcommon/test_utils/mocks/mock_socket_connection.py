@@ -38,7 +38,9 @@ class MockSocketConnection(SocketConnectionProtocol):
         self.socket_opts: Dict[Tuple[int, int], Any] = default_socket_opts
 
         self.transport.write = self.socket_instance_send
+        self.transport.writelines = self.socket_instance_send_buffers
         self.transport.get_write_buffer_size = MagicMock(return_value=0)
+        self.transport.get_write_buffer_limits = MagicMock(return_value=(16 * 1024, 64 * 1024))
 
         self.authenticated_peer_info = authenticated_peer_info
         self.initialized = True
@@ -59,6 +61,10 @@ class MockSocketConnection(SocketConnectionProtocol):
         self.bytes_sent.append(bytes_written)
         return len(bytes_written)
 
+    def socket_instance_send_buffers(self, buffers):
+        for buffer in buffers:
+            self.socket_instance_send(buffer)
+
     def socket_instance_get_opt(self, level: int, opt_name: int):
         return self.socket_opts[(level, opt_name)]
 
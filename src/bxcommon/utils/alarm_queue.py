@@ -97,6 +97,8 @@ class AlarmQueue:
     uniq_count: counter used for tiebreakers in heap comparison if same fire time
     approx_alarms_scheduled: function => min-heap of scheduled alarms. used to ensure multiple alarms
                              with the same function handle are not executed repeatedly
+    next_alarm_listener: called when a registered alarm becomes the next alarm to fire, so an event loop
+                         waiting for the previous next alarm can wake up earlier
     """
 
     def __init__(self) -> None:
@@ -104,6 +106,7 @@ class AlarmQueue:
         self.uniq_count: int = 0
         self.approx_alarms_scheduled: Dict[Callable, List[AlarmId]] = {}
         self.lock = RLock()
+        self.next_alarm_listener: Optional[Callable[[], None]] = None
 
     def register_alarm(
         self,
@@ -144,6 +147,11 @@ class AlarmQueue:
         with self.lock:
             heappush(self.alarms, alarm_id)
             self.uniq_count += 1
+            is_next_alarm = self.alarms[0] is alarm_id
+
+        next_alarm_listener = self.next_alarm_listener
+        if is_next_alarm and next_alarm_listener is not None:
+            next_alarm_listener()
         return alarm_id
 
     def register_approx_alarm(
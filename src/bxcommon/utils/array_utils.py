@@ -0,0 +1,15 @@
+from array import array
+from typing import Optional
+
+from bxcommon import constants
+
+# array type code of 32 bit unsigned ints, item sizes of array types differ between platforms
+UINT32_TYPE_CODE: Optional[str] = next(
+    (type_code for type_code in ("I", "L") if array(type_code).itemsize == constants.UL_INT_SIZE_IN_BYTES), None
+)
+
+
+def get_uint32_type_code() -> str:
+    if UINT32_TYPE_CODE is None:
+        raise RuntimeError("No array type of 32 bit unsigned integers is available on this platform.")
+    return UINT32_TYPE_CODE
@@ -0,0 +1,133 @@
+from collections import deque
+from typing import Deque, Dict, Union
+
+from bxcommon import constants
+
+
+class PooledBytearray(bytearray):
+    """
+    Message buffer allocated by a BufferPool.
+
+    `ref_count` counts output buffers holding the bytes for sending. Buffer returns to its pool once
+    all of them have sent or dropped the bytes.
+    """
+    __slots__ = ("pool", "size_class", "ref_count", "is_free")
+
+    def __init__(self, pool: "BufferPool", size_class: int) -> None:
+        super().__init__(size_class)
+        self.pool = pool
+        self.size_class = size_class
+        self.ref_count = 0
+        self.is_free = False
+
+
+class BufferPool:
+    """
+    Pool of reusable message buffers, grouped into power of two size classes.
+
+    Buffers are returned to the pool by output buffers, not by message owners, so a message can be broadcast
+    to any number of connections and dropped as usual. A returned buffer is reused only once nothing views it
+    anymore: Python refuses to resize a bytearray with live memoryviews (e.g. held by the message object or by
+    stored transaction contents), which is checked before the buffer is handed out again. Buffers still pinned
+    by a view at that point are dropped from the free list, so they do not keep their size class full.
+    """
+
+    def __init__(
+        self,
+        min_size: int = constants.MESSAGE_BUFFER_POOL_MIN_SIZE,
+        max_size: int = constants.MESSAGE_BUFFER_POOL_MAX_SIZE,
+        size_class_max_bytes: int = constants.MESSAGE_BUFFER_POOL_SIZE_CLASS_MAX_BYTES,
+        enabled: bool = False
+    ) -> None:
+        self.min_size = min_size
+        self.max_size = max_size
+        self.size_class_max_bytes = size_class_max_bytes
+        self.enabled = enabled
+
+        self._free_buffers: Dict[int, Deque[PooledBytearray]] = {}
+        # zeroes copied into reused buffers, messages expect freshly allocated buffers to be zero filled
+        self._zeroes = memoryview(bytes(max_size))
+
+        self.reused_count = 0
+        self.allocated_count = 0
+
+    def __len__(self) -> int:
+        return sum(len(free_buffers) for free_buffers in self._free_buffers.values())
+
+    def allocate(self, length: int) -> bytearray:
+        """
+        Returns zero filled buffer of the requested length, reusing a free buffer of its size class if possible.
+        Falls back to a regular bytearray if the pool is disabled or the length is outside of pooled sizes.
+        """
+        if not self.enabled or length > self.max_size:
+            return bytearray(length)
+
+        size_class = self._get_size_class(length)
+        free_buffers = self._free_buffers.get(size_class)
+        while free_buffers:
+            buffer = free_buffers.popleft()
+            try:
+                # fails if any view of the buffer is still alive
+                buffer.append(0)
+            except BufferError:
+                buffer.is_free = False
+                continue
+            buffer[:] = self._zeroes[:length]
+            buffer.ref_count = 0
+            buffer.is_free = False
+            self.reused_count += 1
+            return buffer
+
+        buffer = PooledBytearray(self, size_class)
+        # shrinking within the size class keeps the allocated capacity for later reuse
+        del buffer[length:]
+        self.allocated_count += 1
+        return buffer
+
+    def release(self, buffer: PooledBytearray) -> None:
+        """
+        Puts buffer back to its free list, dropping it if the size class is full
+        """
+        if buffer.is_free:
+            return
+
+        size_class = buffer.size_class
+        free_buffers = self._free_buffers.get(size_class)
+        if free_buffers is None:
+            free_buffers = deque()
+            self._free_buffers[size_class] = free_buffers
+        if (len(free_buffers) + 1) * size_class <= self.size_class_max_bytes:
+            buffer.is_free = True
+            free_buffers.append(buffer)
+
+    def clear(self) -> None:
+        self._free_buffers.clear()
+
+    def _get_size_class(self, length: int) -> int:
+        if length <= self.min_size:
+            return self.min_size
+        return 1 << (length - 1).bit_length()
+
+
+def retain_buffer(msg_bytes: Union[bytearray, memoryview]) -> None:
+    """
+    Marks message bytes as held by an output buffer, if they belong to a pooled buffer
+    """
+    buffer = msg_bytes.obj if isinstance(msg_bytes, memoryview) else msg_bytes
+    if isinstance(buffer, PooledBytearray):
+        buffer.ref_count += 1
+
+
+def release_buffer(msg_bytes: Union[bytearray, memoryview]) -> None:
+    """
+    Marks message bytes as no longer held by an output buffer, returning pooled buffer to its pool
+    after the last release
+    """
+    buffer = msg_bytes.obj if isinstance(msg_bytes, memoryview) else msg_bytes
+    if isinstance(buffer, PooledBytearray):
+        buffer.ref_count -= 1
+        if buffer.ref_count <= 0:
+            buffer.pool.release(buffer)
+
+
+message_buffer_pool = BufferPool()
@@ -1,32 +1,47 @@
-from collections import deque
-from typing import Deque, Union
+from typing import Union
 from typing import Set, Optional
 
+from bxcommon import constants
 from bxcommon.utils import memory_utils
 from bxcommon.utils.memory_utils import SpecialMemoryProperties, SpecialTuple
 
 
 class InputBuffer(SpecialMemoryProperties):
+    """
+    Buffer of received bytes, that are read into free space at the end of the buffer and consumed from its start.
+
+    Bytes can be read directly into the buffer with `get_receive_buffer()` and `advance_received_bytes()`,
+    so messages arriving in many reads are never concatenated. Unread bytes are moved back to the start of
+    the buffer (or to a larger buffer) only when free space runs out.
+
+    Slices returned by `peek_message()` and `get_slice()` are views into the buffer. Unread bytes are never
+    moved within a buffer that is still viewed, they are copied to a new buffer instead, so a held view keeps
+    its contents but pins the old buffer; views should not be held across reads. `remove_bytes()` returns
+    a copy, that can be kept by the message. Buffers larger than `INPUT_BUFFER_BASELINE_SIZE` are released
+    once all bytes are consumed.
+    """
+
     def __init__(self) -> None:
-        self.input_list: Deque[Union[memoryview, bytearray, bytes]] = deque()
+        self._buf = bytearray(0)
+        self._view = memoryview(self._buf)
+        # offsets of unread bytes in the buffer
+        self._start = 0
+        self._end = 0
         self.length = 0
 
     def endswith(self, suffix: Union[memoryview, bytearray, bytes]) -> bool:
-        if not self.input_list:
+        if not self.length:
             return False
 
         # pyre-fixme[25]: Assertion will always fail.
         if not isinstance(suffix, (memoryview, bytearray, bytes)):
             raise ValueError(f"Suffix must be memoryview, bytearray or bytes, not {type(suffix)}.")
 
-        end_slice = self.input_list[-1]
-        if len(end_slice) < len(suffix):
-            end_slice = self.get_slice(self.length - len(suffix), self.length)
-        if not isinstance(end_slice, bytearray):
-            end_slice = bytearray(end_slice)
-            self.input_list[-1] = end_slice
+        suffix_len = len(suffix)
+        if self.length < suffix_len:
+            return False
 
-        return end_slice.endswith(suffix)  # pyre-ignore
+        return self._view[self._end - suffix_len:self._end] == suffix
 
     def add_bytes(self, piece: Union[bytearray, bytes, memoryview]) -> None:
         """
@@ -35,26 +50,52 @@ class InputBuffer(SpecialMemoryProperties):
         # pyre-fixme[25]: Assertion will always fail.
         if not isinstance(piece, (bytearray, memoryview, bytes)):
             raise ValueError("Piece must be a bytearray, bytes or memoryview.")
-        self.input_list.append(piece)
-        self.length += len(piece)
+        piece_len = len(piece)
+        self.get_receive_buffer(piece_len)[:piece_len] = piece
+        self.advance_received_bytes(piece_len)
+
+    def get_receive_buffer(self, min_size: int) -> memoryview:
+        """
+        Returns free space at the end of the input buffer, of at least `min_size` bytes, for bytes to be read into.
+        `advance_received_bytes()` must be called with the number of bytes that were read.
+        """
+        if len(self._buf) - self._end < min_size:
+            self._make_room(min_size)
+        return self._view[self._end:]
+
+    def advance_received_bytes(self, num_bytes: int) -> None:
+        """
+        Adds `num_bytes` bytes, read into the buffer returned by `get_receive_buffer()`, to the end of the input buffer.
+        """
+        if num_bytes < 0 or self._end + num_bytes > len(self._buf):
+            raise ValueError("Invalid num_bytes {}".format(num_bytes))
+
+        self._end += num_bytes
+        self.length += num_bytes
 
     def remove_bytes(self, num_bytes: int) -> Union[bytearray, bytes, memoryview]:
         """
-        Removes the first num_bytes bytes in the input buffer and returns them.
+        Removes the first num_bytes bytes in the input buffer and returns a copy of them.
         """
         if num_bytes is None or num_bytes < 0:
             raise ValueError("Invalid num_bytes {}".format(num_bytes))
 
-        self._shrink_if_needed(num_bytes, True)
+        assert self.length or num_bytes == 0, f"Input buffer is empty and attempting to remove {num_bytes} bytes!"
 
-        assert self.input_list or num_bytes == 0, f"Input buffer is empty and attempting to remove {num_bytes} bytes!"
+        num_bytes = min(num_bytes, self.length)
+        start = self._start
+        to_return = bytearray(self._view[start:start + num_bytes])
+        self.length -= num_bytes
 
-        if self.input_list and num_bytes > 0:
-            to_return = self.input_list[0][:num_bytes]
-            self.input_list[0] = self.input_list[0][num_bytes:]
-            self.length -= num_bytes
+        if self.length:
+            self._start = start + num_bytes
         else:
-            to_return = bytearray(0)
+            self._start = 0
+            self._end = 0
+            if len(self._buf) > constants.INPUT_BUFFER_BASELINE_SIZE:
+                # buffer grown for a large message is not kept by an idle connection
+                self._buf = bytearray(0)
+                self._view = memoryview(self._buf)
 
         return to_return
 
@@ -62,32 +103,25 @@ class InputBuffer(SpecialMemoryProperties):
         """
         Returns at LEAST the first bytes_to_peek bytes in the input buffer.
         The assumption is that these bytes are all part of the same message.
-        Thus, we combine pieces if we cannot just return the first message.
         """
         if bytes_to_peek > self.length:
             bytes_to_peek = self.length
 
         if bytes_to_peek == 0:
             return bytearray(0)
-        self._shrink_if_needed(bytes_to_peek)
 
-        return self.input_list[0]
+        return self._view[self._start:self._end]
 
     def get_slice(self, start, end):
         """
         Gets a slice of the inputbuffer from start to end.
-        We assume that this slice is a piece of a single bitcoin message
-        for performance reasons (with respect to the number of copies).
         Additionally, the start value of the slice must exist.
         """
         if start is None or end is None or self.length < start:
             raise ValueError("Start ({}) and end ({}) must exist and start must be less or equal to length ({})."
                              .format(start, end, self.length))
 
-        # Combine all of the pieces in this slice into the first item on the list.
-        # Since we will need to do so anyway when handing the message.
-        self._shrink_if_needed(end)
-        return self.input_list[0][start:end]
+        return self._view[self._start + start:self._start + min(end, self.length)]
 
     def __len__(self) -> int:
         return self.length
@@ -110,16 +144,37 @@ class InputBuffer(SpecialMemoryProperties):
         return self.get_slice(start, stop)
 
     def special_memory_size(self, ids: Optional[Set[int]] = None) -> SpecialTuple:
-        return memory_utils.get_special_size(self.input_list, ids=ids)
-
-    def _shrink_if_needed(self, end: int, ensure_byte_array: bool = False) -> None:
-        if self.input_list:
-            head_message = self.input_list[0]
-            if end > len(head_message) or ensure_byte_array:
-                if isinstance(head_message, bytearray):
-                    head = self.input_list.popleft()
-                else:
-                    head = bytearray(self.input_list.popleft())
-                while end > len(head) and self.input_list:
-                    head.extend(self.input_list.popleft())  # pyre-ignore
-                self.input_list.appendleft(head)
+        return memory_utils.get_special_size(self._view, ids=ids)
+
+    def _make_room(self, min_size: int) -> None:
+        length = self.length
+        start = self._start
+        # grow geometrically, so bytes of a large message are moved a constant number of times on average
+        capacity = 2 * length + min_size
+
+        if length <= start and length + min_size <= len(self._buf) <= 2 * capacity and not self._is_viewed():
+            # unread bytes do not overlap with the start of the buffer
+            self._buf[:length] = self._view[start:self._end]
+        else:
+            buf = bytearray(capacity)
+            buf[:length] = self._view[start:self._end]
+            self._buf = buf
+            self._view = memoryview(buf)
+
+        self._start = 0
+        self._end = length
+
+    def _is_viewed(self) -> bool:
+        """
+        Checks for views returned by `peek_message()` or `get_slice()` that are still held,
+        a bytearray with exported buffers can not be resized.
+        """
+        buf = self._buf
+        self._view.release()
+        try:
+            buf.append(buf.pop())
+            viewed = False
+        except BufferError:
+            viewed = True
+        self._view = memoryview(buf)
+        return viewed
@@ -1,10 +1,11 @@
 import time
 from collections import deque
-from typing import Deque, Optional, TYPE_CHECKING
+from typing import Deque, List, Optional, TYPE_CHECKING
 
 from bxcommon.messages.abstract_block_message import AbstractBlockMessage
 from bxcommon.messages.abstract_message import AbstractMessage
 from bxcommon.messages.bloxroute.tx_message import TxMessage
+from bxcommon.utils.buffers.output_priority import OutputPriority, get_lane_position
 from bxcommon.utils.stats.transaction_statistics_service import tx_stats
 from bxutils import logging
 from bxutils.logging.log_level import LogLevel
@@ -21,6 +22,7 @@ class MessageTrackerEntry:
     label: Optional[str]
     sent_bytes: int = 0
     length: int
+    priority: OutputPriority
     queued_time: float
     last_operation_time: float
 
@@ -29,9 +31,11 @@ class MessageTrackerEntry:
         message: Optional[AbstractMessage],
         length: int,
         label: Optional[str],
+        priority: OutputPriority = OutputPriority.NORMAL,
     ):
         self.message = message
         self.length = length
+        self.priority = priority
         self.queued_time = time.time()
         self.last_operation_time = 0.0
         self.label = label
@@ -80,9 +84,12 @@ class MessageTracker:
     """
     Service to track when message bytes get fully written from the output buffer to the
     OS level socket.
+
+    Messages are ordered by their priority, the same way as in the output buffer.
     """
 
     messages: Deque[MessageTrackerEntry]
+    priority_message_counts: List[int]
     connection: "AbstractConnection"
     is_working: bool = True
     bytes_remaining: int = 0
@@ -90,6 +97,7 @@ class MessageTracker:
     def __init__(self, connection: "AbstractConnection") -> None:
         self.connection = connection
         self.messages = deque()
+        self.priority_message_counts = [0] * len(OutputPriority)
 
     def __repr__(self):
         return (
@@ -123,6 +131,7 @@ class MessageTracker:
                 )
                 self.bytes_remaining = 0
                 self.messages.clear()
+                self.priority_message_counts = [0] * len(OutputPriority)
                 return
 
             curr_time = time.time()
@@ -130,6 +139,7 @@ class MessageTracker:
                 self.messages[0].length - self.messages[0].sent_bytes
             ):
                 sent_message = self.messages.popleft()
+                self.priority_message_counts[sent_message.priority] -= 1
                 self.connection.log(
                     sent_message.message_log_level(),
                     "Sent {} to socket. Took {:.2f}ms. "
@@ -172,9 +182,11 @@ class MessageTracker:
         num_bytes: int,
         message: Optional[AbstractMessage],
         label: Optional[str] = None,
+        priority: Optional[OutputPriority] = None,
     ):
         """
-        Appends a message entry to the tracker.
+        Appends a message entry to the tracker, after messages of the same or higher priority.
+        Priority defaults to priority of the message.
 
         This method trusts that that num_bytes matches the message, but does
         not verify it. This is useful for Ethereum, which frames and encrypts
@@ -183,7 +195,17 @@ class MessageTracker:
         if not self.is_working:
             return
 
-        self.messages.append(MessageTrackerEntry(message, num_bytes, label))
+        if priority is None:
+            priority = OutputPriority.NORMAL if message is None else message.output_priority()
+
+        messages = self.messages
+        position = get_lane_position(
+            self.priority_message_counts,
+            priority,
+            messages[0].priority if messages and messages[0].sent_bytes != 0 else None
+        )
+        messages.insert(position, MessageTrackerEntry(message, num_bytes, label, priority))
+        self.priority_message_counts[priority] += 1
         self.bytes_remaining += num_bytes
 
     def prepend_message(
@@ -193,7 +215,7 @@ class MessageTracker:
         label: Optional[str] = None,
     ):
         """
-        Appends a message entry to the tracker.
+        Prepends a message entry to the tracker, after the message in progress.
 
         This method trusts that that num_bytes matches the message, but does
         not verify it. This is useful for Ethereum, which frames and encrypts
@@ -202,14 +224,15 @@ class MessageTracker:
         if not self.is_working:
             return
 
+        # same as in output buffer, prepended message is bumped to the front of the highest priority
         if self.messages and self.messages[0].sent_bytes != 0:
-            in_progress_message = self.messages.popleft()
-            self.messages.appendleft(
-                MessageTrackerEntry(message, num_bytes, label)
-            )
-            self.messages.appendleft(in_progress_message)
+            position = 1
         else:
-            self.messages.append(MessageTrackerEntry(message, num_bytes, label))
+            position = 0
+        self.messages.insert(
+            position, MessageTrackerEntry(message, num_bytes, label, OutputPriority.CONTROL)
+        )
+        self.priority_message_counts[OutputPriority.CONTROL] += 1
 
         self.bytes_remaining += num_bytes
 
@@ -237,6 +260,7 @@ class MessageTracker:
         curr_time = time.time()
         while len(self.messages) > index:
             entry_removed = self.messages.pop()
+            self.priority_message_counts[entry_removed.priority] -= 1
             self.bytes_remaining -= (
                 entry_removed.length - entry_removed.sent_bytes
             )
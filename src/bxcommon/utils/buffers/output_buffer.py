@@ -1,9 +1,11 @@
-import time
 from collections import deque
-from typing import Set, Optional
+from itertools import islice
+from typing import Deque, List, Set, Optional
 
 from bxcommon import constants
 from bxcommon.utils import memory_utils
+from bxcommon.utils.buffers import buffer_pool
+from bxcommon.utils.buffers.output_priority import OutputPriority, get_lane_position
 from bxcommon.utils.memory_utils import SpecialMemoryProperties, SpecialTuple
 from bxutils import logging
 
@@ -17,6 +19,11 @@ class OutputBuffer(SpecialMemoryProperties):
       - has_more_bytes(): Whether or not there are more bytes in this buffer.
       - get_buffer(): some bytes to send in the outputbuffer
       - advance_buffer(): Advances the buffer by some number of bytes
+
+    Messages are sent in order of their priority lanes (see `OutputPriority`). A message with a higher priority
+    is queued before messages of lower priorities, but never before a message which is partially sent.
+    Messages are held for batching only while they would be queued last, so a held batch keeps the position
+    given to its messages by `MessageTracker`.
     """
     EMPTY = memoryview(bytearray(0))  # The empty outputbuffer
 
@@ -31,6 +38,10 @@ class OutputBuffer(SpecialMemoryProperties):
         # A deque of memoryview objects representing the raw memoryviews of the messages
         # that are being sent on the outputbuffer.
         self.output_msgs = deque()
+        # priorities of the messages in output_msgs, messages are ordered by priority except the first message
+        # which may have been partially sent before messages of higher priority were enqueued
+        self.output_msg_priorities: Deque[OutputPriority] = deque()
+        self.priority_msg_counts = [0] * len(OutputPriority)
 
         # Offset into the first message of the output_msgs
         self.index = 0
@@ -39,13 +50,14 @@ class OutputBuffer(SpecialMemoryProperties):
         self.length = 0
 
         self.min_size = min_size
-        # how long we hold onto messages for batching in seconds
+        # how long we hold onto messages for batching in seconds, owner of the buffer is expected to flush it
+        # after that time once a batch is started (`last_bytearray` is set)
         self.max_hold_time = max_hold_time
         self.last_memview = None
         self.last_bytearray: Optional[bytearray] = None
         # size of the last valid memoryview
         self.valid_len = 0
-        self.last_bytearray_create_time = None
+        self.batch_priority = OutputPriority.NORMAL
 
     def __len__(self):
         return self.length
@@ -55,18 +67,59 @@ class OutputBuffer(SpecialMemoryProperties):
         Gets a non-empty memoryview buffer
         :return: top output message on buffer
         """
-        now = time.time()
-
-        if self.enable_buffering and \
-                self.last_bytearray is not None and \
-                now - self.last_bytearray_create_time >= self.max_hold_time:
-            self.flush()
-
         if not self.output_msgs:
             return OutputBuffer.EMPTY
 
         return memoryview(self.output_msgs[0])[self.index:]
 
+    def get_buffers(self, max_bytes: int) -> List[memoryview]:
+        """
+        Gets memoryviews of consecutive messages, starting with the top output message, until at least
+        `max_bytes` are collected or there are no more messages. Used to send many messages with a single write.
+        :param max_bytes: number of bytes to collect
+        :return: output messages on buffer, empty if there are none
+        """
+        first_buffer = self.get_buffer()
+        if not first_buffer:
+            return []
+
+        buffers = [first_buffer]
+        total_bytes = len(first_buffer)
+        if total_bytes < max_bytes:
+            for msg_bytes in islice(self.output_msgs, 1, None):
+                buffers.append(memoryview(msg_bytes))
+                total_bytes += len(msg_bytes)
+                if total_bytes >= max_bytes:
+                    break
+        return buffers
+
+    def advance_buffers(self, num_bytes: int) -> None:
+        """
+        Advances the buffer by some number of bytes, which may span any number of output messages.
+        """
+        if num_bytes < 0:
+            raise ValueError("Num_bytes must be a positive integer.")
+        if num_bytes > self.length:
+            raise ValueError(
+                "Cannot advance buffer by more bytes than it holds. Length: {}, Bytes: {}".format(
+                    self.length, num_bytes)
+            )
+
+        output_msgs = self.output_msgs
+        index = self.index + num_bytes
+        while output_msgs:
+            first_msg_len = len(output_msgs[0])
+            if index < first_msg_len:
+                break
+            index -= first_msg_len
+            buffer_pool.release_buffer(self._pop_first_msg())
+
+        if index and not output_msgs:
+            raise ValueError("Cannot advance buffer past bytes held for batching. Bytes: {}".format(index))
+
+        self.index = index
+        self.length -= num_bytes
+
     def advance_buffer(self, num_bytes: int):
         if num_bytes < 0:
             raise ValueError("Num_bytes must be a positive integer.")
@@ -85,67 +138,73 @@ class OutputBuffer(SpecialMemoryProperties):
         self.length -= num_bytes
 
         if self.index == len(self.output_msgs[0]):
-            self.output_msgs.popleft()
+            buffer_pool.release_buffer(self._pop_first_msg())
             self.index = 0
 
     def at_msg_boundary(self):
         return self.index == 0
 
-    def enqueue_msgbytes(self, msg_bytes):
+    def enqueue_msgbytes(self, msg_bytes, priority: OutputPriority = OutputPriority.NORMAL):
         if not isinstance(msg_bytes, (bytearray, memoryview)):
             raise ValueError("Msg_bytes must be a bytearray. The type given was a {}".format(type(msg_bytes)))
 
         length = len(msg_bytes)
 
         if not self.enable_buffering:
-            self.output_msgs.append(msg_bytes)
+            buffer_pool.retain_buffer(msg_bytes)
+            self._insert_msgbytes(msg_bytes, priority)
         elif length + self.valid_len > self.min_size:
             if self.last_bytearray is not None:
                 self.flush()
-            self.output_msgs.append(msg_bytes)
+            buffer_pool.retain_buffer(msg_bytes)
+            self._insert_msgbytes(msg_bytes, priority)
         else:
-            now = time.time()
-            if self.last_bytearray is None:
+            if self.last_bytearray is not None and priority != self.batch_priority:
+                # a batch holds messages of a single priority
+                self.flush()
+
+            if self._get_insert_position(priority) != len(self.output_msgs):
+                # message goes before queued messages of lower priorities, holding it would send them first
+                buffer_pool.retain_buffer(msg_bytes)
+                self._insert_msgbytes(msg_bytes, priority)
+            elif self.last_bytearray is None:
                 self.last_bytearray = bytearray(self.min_size)
                 self.last_memview = memoryview(self.last_bytearray)
                 self.last_bytearray[:length] = msg_bytes
                 self.valid_len = length
-                self.last_bytearray_create_time = now
+                self.batch_priority = priority
             else:
-                if self.last_bytearray_create_time is None:
-                    raise ValueError("last_bytearray_create_time cannot be None")
                 self.last_bytearray[self.valid_len:self.valid_len + length] = msg_bytes
                 self.valid_len += length
 
-                if now - self.last_bytearray_create_time > self.max_hold_time:
-                    self.flush()
-
         self.length += len(msg_bytes)
 
     def prepend_msgbytes(self, msg_bytes):
+        """
+        Bumps message to the front of the highest priority lane, after the message being sent.
+        """
         if not isinstance(msg_bytes, (bytearray, memoryview)):
             raise ValueError("Msg_bytes must be a bytearray.")
 
-        if self.index == 0:
-            self.output_msgs.appendleft(msg_bytes)
-        else:
-            prev_msg = self.output_msgs.popleft()
-            self.output_msgs.appendleft(msg_bytes)
-            self.output_msgs.appendleft(prev_msg)
+        buffer_pool.retain_buffer(msg_bytes)
+        position = 0 if self.index == 0 else 1
+        self.output_msgs.insert(position, msg_bytes)
+        self.output_msg_priorities.insert(position, OutputPriority.CONTROL)
+        self.priority_msg_counts[OutputPriority.CONTROL] += 1
 
         self.length += len(msg_bytes)
 
     def has_more_bytes(self):
         return self.length != 0
 
-    # TODO: @soumya this is called every 200ms. This needs some future cleanup; possibly in the alarm data structure.
-    # Consult Nagle algorithm before implementing improvements.
     def flush(self):
+        """
+        Moves messages held for batching to the output messages, to be sent.
+        """
         if self.last_bytearray is None:
             return
 
-        self.output_msgs.append(self.last_memview[:self.valid_len])
-        self.last_bytearray_create_time = None
+        self._insert_msgbytes(self.last_memview[:self.valid_len], self.batch_priority)
         self.last_bytearray = None
         self.last_memview = None
         self.valid_len = 0
@@ -156,13 +215,41 @@ class OutputBuffer(SpecialMemoryProperties):
         """
         self.flush()
         if self.output_msgs and self.index:
-            first = self.output_msgs.popleft()
-            self.output_msgs.clear()
+            first_priority = self.output_msg_priorities[0]
+            first = self._pop_first_msg()
+            self._release_all()
             self.output_msgs.append(first)
+            self.output_msg_priorities.append(first_priority)
+            self.priority_msg_counts[first_priority] += 1
             self.length = len(first) - self.index
         else:
-            self.output_msgs.clear()
+            self._release_all()
             self.length = 0
 
+    def _release_all(self) -> None:
+        for msg_bytes in self.output_msgs:
+            buffer_pool.release_buffer(msg_bytes)
+        self.output_msgs.clear()
+        self.output_msg_priorities.clear()
+        self.priority_msg_counts = [0] * len(OutputPriority)
+
+    def _insert_msgbytes(self, msg_bytes, priority: OutputPriority) -> None:
+        """
+        Queues message after all messages of the same or higher priority.
+        """
+        position = self._get_insert_position(priority)
+        self.output_msgs.insert(position, msg_bytes)
+        self.output_msg_priorities.insert(position, priority)
+        self.priority_msg_counts[priority] += 1
+
+    def _get_insert_position(self, priority: OutputPriority) -> int:
+        return get_lane_position(
+            self.priority_msg_counts, priority, self.output_msg_priorities[0] if self.index else None
+        )
+
+    def _pop_first_msg(self):
+        self.priority_msg_counts[self.output_msg_priorities.popleft()] -= 1
+        return self.output_msgs.popleft()
+
     def special_memory_size(self, ids: Optional[Set[int]] = None) -> SpecialTuple:
         return memory_utils.get_special_size(self.output_msgs, ids=ids)
@@ -0,0 +1,31 @@
+from enum import IntEnum
+from typing import List, Optional
+
+
+class OutputPriority(IntEnum):
+    """
+    Priority lanes of output buffer. Messages of a higher priority are sent before all messages of lower priorities,
+    messages of the same priority are sent in order they were enqueued.
+    """
+    BULK = 0  # transaction service sync
+    NORMAL = 1  # transactions and any other messages
+    BLOCK = 2
+    CONTROL = 3  # handshake, ping and pong
+
+
+def get_lane_position(
+    priority_counts: List[int], priority: OutputPriority, in_progress_priority: Optional[OutputPriority]
+) -> int:
+    """
+    Gets position of a message in a queue ordered by priority lanes, after all messages of the same or higher
+    priority. Shared by output buffer and message tracker, so both order messages the same way.
+    :param priority_counts: number of queued messages of each priority
+    :param priority: priority of the message
+    :param in_progress_priority: priority of the first message if it is partially sent, it is never moved
+    :return: position in the queue
+    """
+    position = sum(priority_counts[priority:])
+    if in_progress_priority is not None and in_progress_priority < priority:
+        # keep partially sent message first, to not break it apart
+        position += 1
+    return position
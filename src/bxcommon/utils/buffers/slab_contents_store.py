@@ -0,0 +1,186 @@
+from typing import Dict, List, Union, MutableMapping, Iterator, TypeVar, Optional, Tuple
+
+KT = TypeVar("KT")
+
+# bits of packed handle reserved for chunk offset and length, slab size is limited accordingly
+_HANDLE_FIELD_BITS = 32
+_HANDLE_FIELD_MASK = (1 << _HANDLE_FIELD_BITS) - 1
+_SMALL_SIZE_CLASS_LIMIT = 256
+_SMALL_SIZE_CLASS_STEP = 32
+# number of size classes between two consecutive powers of 2
+_SIZE_CLASS_SUBDIVISIONS = 8
+
+
+def get_size_class(length: int) -> int:
+    """
+    Rounds contents length up to the chunk size used to store it. Waste is limited to 1/8 of the chunk size.
+    :param length: contents length
+    :return: chunk size
+    """
+    if length <= _SMALL_SIZE_CLASS_LIMIT:
+        step = _SMALL_SIZE_CLASS_STEP
+    else:
+        step = (1 << ((length - 1).bit_length() - 1)) // _SIZE_CLASS_SUBDIVISIONS
+    return max(step, -(-length // step) * step)
+
+
+class SlabContentsStore(MutableMapping[KT, bytes]):
+    """
+    Mapping of keys to binary contents packed into large preallocated slabs.
+
+    Stored contents are copied into chunks of a slab and addressed by a single packed integer handle
+    (slab id, offset, length), so the store keeps no per item buffer objects. Released chunks are kept on
+    free lists per size class and reused by contents of the same size class. Slabs that no longer hold
+    any contents are released.
+
+    Lookups return copies of the contents, so results held by callers are not affected when the chunk is
+    reused for other contents. `get_view` returns a zero copy memoryview into the slab for internal
+    serialization; a view is only valid until its key is removed or overwritten and must not be held.
+    Contents larger than a quarter of the slab are stored in dedicated buffers.
+    """
+
+    slab_size: int
+    contents_size: int
+
+    def __init__(self, slab_size: int) -> None:
+        if slab_size <= 0 or slab_size > _HANDLE_FIELD_MASK:
+            raise ValueError(f"Slab size must be between 1 and {_HANDLE_FIELD_MASK} bytes.")
+
+        self.slab_size = slab_size
+        self.contents_size = 0
+        self._max_chunk_size = slab_size // 4
+
+        self._handles: Dict[KT, int] = {}
+        self._large_contents: Dict[KT, bytearray] = {}
+        self._slabs: Dict[int, bytearray] = {}
+        self._slab_used_bytes: Dict[int, int] = {}
+        self._free_chunks: Dict[int, List[int]] = {}
+        self._next_slab_id = 0
+        self._current_slab_id = -1
+        self._current_slab_offset = slab_size
+
+    def __len__(self) -> int:
+        return len(self._handles) + len(self._large_contents)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._handles or key in self._large_contents
+
+    def __iter__(self) -> Iterator[KT]:
+        yield from self._handles
+        yield from self._large_contents
+
+    def __getitem__(self, key: KT) -> bytes:
+        return bytes(self.get_view(key))
+
+    def __setitem__(self, key: KT, contents: Union[bytearray, bytes, memoryview]) -> None:
+        length = len(contents)
+
+        if length > self._max_chunk_size:
+            large_contents = bytearray(contents)
+            if key in self:
+                del self[key]
+            self._large_contents[key] = large_contents
+        else:
+            size_class = get_size_class(length)
+            slab_id, offset = self._allocate_chunk(size_class)
+            self._slabs[slab_id][offset:offset + length] = contents
+            self._slab_used_bytes[slab_id] += size_class
+            # previous contents are released after the copy, they may be a view of the same slab
+            if key in self:
+                del self[key]
+            self._handles[key] = (slab_id << (2 * _HANDLE_FIELD_BITS)) | (offset << _HANDLE_FIELD_BITS) | length
+
+        self.contents_size += length
+
+    def __delitem__(self, key: KT) -> None:
+        handle = self._handles.pop(key, None)
+        if handle is None:
+            self.contents_size -= len(self._large_contents.pop(key))
+            return
+
+        slab_id = handle >> (2 * _HANDLE_FIELD_BITS)
+        length = handle & _HANDLE_FIELD_MASK
+        size_class = get_size_class(length)
+        self.contents_size -= length
+
+        self._slab_used_bytes[slab_id] -= size_class
+        if self._slab_used_bytes[slab_id] == 0 and slab_id != self._current_slab_id:
+            # chunks of released slab still on the free lists are skipped on allocation
+            del self._slabs[slab_id]
+            del self._slab_used_bytes[slab_id]
+        else:
+            chunk = handle >> _HANDLE_FIELD_BITS
+            self._free_chunks.setdefault(size_class, []).append(chunk)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}<items: {len(self)}, contents_size: {self.contents_size}, "
+            f"slabs: {len(self._slabs)}>"
+        )
+
+    def clear(self) -> None:
+        self._handles.clear()
+        self._large_contents.clear()
+        self._slabs.clear()
+        self._slab_used_bytes.clear()
+        self._free_chunks.clear()
+        self._current_slab_id = -1
+        self._current_slab_offset = self.slab_size
+        self.contents_size = 0
+
+    def get_bytes_length(self) -> int:
+        """
+        :return: number of bytes allocated for slabs and dedicated buffers of large contents
+        """
+        return len(self._slabs) * self.slab_size + sum(map(len, self._large_contents.values()))
+
+    def get_slab_count(self) -> int:
+        return len(self._slabs)
+
+    def get_length(self, key: KT) -> int:
+        """
+        :param key: contents key
+        :return: length of stored contents, read from the handle without accessing the contents
+        """
+        handle = self._handles.get(key)
+        if handle is None:
+            return len(self._large_contents[key])
+        return handle & _HANDLE_FIELD_MASK
+
+    def get_view(self, key: KT) -> memoryview:
+        """
+        Zero copy access to stored contents. The view must be consumed before the store is modified,
+        since the chunk of removed or overwritten contents is reused for other contents.
+        :param key: contents key
+        :return: memoryview of the contents
+        """
+        handle = self._handles.get(key)
+        if handle is None:
+            return memoryview(self._large_contents[key])
+
+        slab_id = handle >> (2 * _HANDLE_FIELD_BITS)
+        offset = (handle >> _HANDLE_FIELD_BITS) & _HANDLE_FIELD_MASK
+        length = handle & _HANDLE_FIELD_MASK
+        return memoryview(self._slabs[slab_id])[offset:offset + length]
+
+    def _allocate_chunk(self, size_class: int) -> Tuple[int, int]:
+        free_chunks: Optional[List[int]] = self._free_chunks.get(size_class)
+        while free_chunks:
+            chunk = free_chunks.pop()
+            slab_id = chunk >> _HANDLE_FIELD_BITS
+            if slab_id in self._slabs:
+                return slab_id, chunk & _HANDLE_FIELD_MASK
+
+        if self._current_slab_offset + size_class > self.slab_size:
+            if self._current_slab_id in self._slab_used_bytes and self._slab_used_bytes[self._current_slab_id] == 0:
+                del self._slabs[self._current_slab_id]
+                del self._slab_used_bytes[self._current_slab_id]
+            self._current_slab_id = self._next_slab_id
+            self._next_slab_id += 1
+            self._slabs[self._current_slab_id] = bytearray(self.slab_size)
+            self._slab_used_bytes[self._current_slab_id] = 0
+            self._current_slab_offset = 0
+
+        offset = self._current_slab_offset
+        self._current_slab_offset += size_class
+        return self._current_slab_id, offset
@@ -8,6 +8,7 @@ from bxcommon import constants
 from bxcommon.constants import ALL_NETWORK_NUM
 from bxcommon.models.blockchain_network_model import BlockchainNetworkModel
 from bxcommon.models.node_type import NodeType
+from bxcommon.models.transaction_eviction_policy_type import TransactionEvictionPolicyType
 from bxcommon.rpc import rpc_constants
 from bxcommon.services import http_service
 from bxcommon.services import sdn_http_service
@@ -76,6 +77,11 @@ def get_argument_parser() -> argparse.ArgumentParser:
                             help="Folder to dump removed short ids to",
                             type=str,
                             default=constants.DUMP_REMOVED_SHORT_IDS_PATH)
+    arg_parser.add_argument("--transaction-service-snapshot-dir",
+                            help="Folder to periodically save transaction service state to and restore it from "
+                                 "on start. Snapshots are disabled if not set",
+                            type=str,
+                            default="")
     arg_parser.add_argument("--enable-buffered-send", help="Enables buffering of sent byte to improve performance",
                             type=convert.str_to_bool, default=False)
     arg_parser.add_argument("--track-detailed-sent-messages", help="Enables tracking of messages written on socket",
@@ -109,6 +115,86 @@ def get_argument_parser() -> argparse.ArgumentParser:
         default=constants.DEFAULT_TX_MEM_POOL_BUCKET_SIZE,
         type=int
     )
+    arg_parser.add_argument(
+        "--compact-short-id-index",
+        help="Store transaction service short id mappings in compact typed arrays instead of dictionaries. "
+             "Reduces memory usage per short id at the cost of slower lookups (default: False)",
+        type=convert.str_to_bool,
+        default=False
+    )
+    arg_parser.add_argument(
+        "--transaction-contents-slab-size",
+        help="Size in KB of preallocated slabs that transaction service packs transaction contents into. "
+             "Reduces allocator overhead per transaction. 0 stores each transaction in its own buffer (default: 0)",
+        type=int,
+        default=0
+    )
+    arg_parser.add_argument(
+        "--transaction-eviction-policy",
+        help="Order in which transactions are evicted when transaction contents exceed memory limit. "
+             "flag_aware keeps paid transactions until all others are evicted (default: oldest_first)",
+        type=TransactionEvictionPolicyType,
+        choices=list(TransactionEvictionPolicyType),
+        default=TransactionEvictionPolicyType.OLDEST_FIRST
+    )
+    arg_parser.add_argument(
+        "--removed-transactions-history-filter",
+        help="Track removed transactions in time rotated Bloom filters instead of dictionaries. Greatly reduces "
+             "memory usage of the history, at the cost of rare false positives and removal times approximated "
+             "to a fraction of history expiration time (default: False)",
+        type=convert.str_to_bool,
+        default=False
+    )
+    arg_parser.add_argument(
+        "--block-cleanup-time-budget-ms",
+        help="Remove transactions of finalized blocks in slices run from the alarm queue, each limited to the "
+             "provided number of milliseconds, instead of removing all of them while processing the block. "
+             "Slices are disabled if set to 0 (default: 0)",
+        type=float,
+        default=0
+    )
+    arg_parser.add_argument(
+        "--incremental-memory-stats",
+        help="Build transaction service memory statistics from item counters maintained on insert and remove, "
+             "instead of walking the data structures. Keeps statistics reporting constant time regardless of "
+             "the transaction service size (default: False)",
+        type=convert.str_to_bool,
+        default=False
+    )
+    arg_parser.add_argument(
+        "--message-buffer-pool",
+        help="Allocate outgoing message buffers from a pool of size classed buffers, reused once the messages "
+             "are sent to all connections and no longer referenced (default: False)",
+        type=convert.str_to_bool,
+        default=False
+    )
+    arg_parser.add_argument(
+        "--message-compression",
+        help="Compress bulk transaction and sync messages sent to internal peers that also enable compression, "
+             "negotiated through hello message control flags (default: False)",
+        type=convert.str_to_bool,
+        default=False
+    )
+    arg_parser.add_argument(
+        "--message-compression-min-size",
+        help="Minimum message size in bytes to compress, if message compression is enabled (default: 1024)",
+        type=int,
+        default=constants.MESSAGE_COMPRESSION_MIN_SIZE_BYTES
+    )
+    arg_parser.add_argument(
+        "--tx-batch-max-delay-ms",
+        help="Max time in milliseconds to hold transactions sent to internal peers, to send them in a single "
+             "batch message. Batching is disabled if 0 (default: 0)",
+        type=float,
+        default=0
+    )
+    arg_parser.add_argument(
+        "--binary-tx-cache-keys",
+        help="Use raw transaction hash bytes instead of hex strings as transaction service cache keys "
+             "(default: False)",
+        type=convert.str_to_bool,
+        default=False
+    )
     arg_parser.add_argument(
         "--sync-tx-service",
         help="sync tx service in node",
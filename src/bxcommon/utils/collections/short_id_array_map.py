@@ -0,0 +1,271 @@
+import sys
+from abc import abstractmethod
+from array import array
+from typing import TypeVar, Iterator, MutableMapping, Iterable, Any, Optional
+
+from bxcommon import constants
+from bxcommon.models.transaction_flag import TransactionFlag
+from bxcommon.utils import array_utils
+
+VT = TypeVar("VT")
+
+# multiplier used for Fibonacci hashing of short ids, spreads sequential ids across the table
+_HASH_MULTIPLIER = 2654435769
+_MIN_CAPACITY = 16
+_MAX_LOAD_FACTOR = 0.7
+_MIN_LOAD_FACTOR = 0.125
+_MAX_SHORT_ID = 0xFFFFFFFF
+
+
+def _is_short_id(short_id: Any) -> bool:
+    return isinstance(short_id, int) and 0 <= short_id <= _MAX_SHORT_ID
+
+
+class AbstractShortIdArrayMap(MutableMapping[int, VT]):
+    """
+    Open addressed hash table keyed by unsigned 32 bit short ids.
+
+    Keys are stored in a single contiguous array of 32 bit unsigned ints and resolved with linear probing, so no int objects
+    and no dictionary entries are kept alive per short id. Removed entries are back-shifted instead of
+    being marked with tombstones, which keeps probe sequences short under heavy removal.
+    `constants.NULL_TX_SID` is used as the empty slot marker and is stored outside of the table.
+    Like a dict, lookups of keys which can not be stored raise `KeyError`, storing them raises `ValueError`.
+
+    Subclasses define how values are laid out next to the keys.
+    """
+
+    def __init__(self, capacity: int = _MIN_CAPACITY) -> None:
+        self._count = 0
+        self._has_null_key = False
+        self._null_key_value: Any = None
+        self._allocate(self._get_capacity_for(capacity))
+
+    def __len__(self) -> int:
+        return self._count + self._has_null_key
+
+    def __contains__(self, short_id: Any) -> bool:
+        if short_id == constants.NULL_TX_SID:
+            return self._has_null_key
+        return _is_short_id(short_id) and self._find_slot(short_id) >= 0
+
+    def __getitem__(self, short_id: int) -> VT:
+        if short_id == constants.NULL_TX_SID:
+            if self._has_null_key:
+                return self._decode_value(self._null_key_value)
+            raise KeyError(short_id)
+
+        if not _is_short_id(short_id):
+            raise KeyError(short_id)
+        slot = self._find_slot(short_id)
+        if slot < 0:
+            raise KeyError(short_id)
+        return self._decode_value(self._values[slot])
+
+    def __setitem__(self, short_id: int, value: VT) -> None:
+        if short_id == constants.NULL_TX_SID:
+            self._has_null_key = True
+            self._null_key_value = self._encode_value(value)
+            return
+
+        if not _is_short_id(short_id):
+            raise ValueError(f"Short id must be an unsigned 32 bit integer, not {short_id!r}.")
+        slot = self._find_slot(short_id)
+        if slot >= 0:
+            self._values[slot] = self._encode_value(value)
+            return
+
+        if self._count + 1 > self._capacity * _MAX_LOAD_FACTOR:
+            self._resize(self._capacity << 1)
+            slot = self._find_slot(short_id)
+
+        slot = -1 - slot
+        self._keys[slot] = short_id
+        self._values[slot] = self._encode_value(value)
+        self._count += 1
+
+    def __delitem__(self, short_id: int) -> None:
+        if short_id == constants.NULL_TX_SID:
+            if not self._has_null_key:
+                raise KeyError(short_id)
+            self._has_null_key = False
+            self._null_key_value = None
+            return
+
+        if not _is_short_id(short_id):
+            raise KeyError(short_id)
+        slot = self._find_slot(short_id)
+        if slot < 0:
+            raise KeyError(short_id)
+        self._delete_slot(slot)
+
+        if self._capacity > _MIN_CAPACITY and self._count < self._capacity * _MIN_LOAD_FACTOR:
+            self._resize(self._get_capacity_for(self._count))
+
+    def __iter__(self) -> Iterator[int]:
+        if self._has_null_key:
+            yield constants.NULL_TX_SID
+        for short_id in self._keys:
+            if short_id != constants.NULL_TX_SID:
+                yield short_id
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}<count: {len(self)}, capacity: {self._capacity}>"
+
+    def clear(self) -> None:
+        self._count = 0
+        self._has_null_key = False
+        self._null_key_value = None
+        self._allocate(_MIN_CAPACITY)
+
+    def get_bytes_length(self) -> int:
+        """
+        :return: number of bytes allocated for the keys and values of the table
+        """
+        return self._keys.itemsize * len(self._keys) + sys.getsizeof(self._values)
+
+    @abstractmethod
+    def _allocate_values(self, capacity: int) -> Any:
+        pass
+
+    @abstractmethod
+    def _encode_value(self, value: VT) -> Any:
+        pass
+
+    @abstractmethod
+    def _decode_value(self, raw_value: Any) -> VT:
+        pass
+
+    @abstractmethod
+    def _get_empty_value(self) -> Any:
+        pass
+
+    def _allocate(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._mask = capacity - 1
+        self._shift = 32 - (capacity.bit_length() - 1)
+        self._keys = array(array_utils.get_uint32_type_code(), bytes(constants.UL_INT_SIZE_IN_BYTES * capacity))
+        self._values = self._allocate_values(capacity)
+
+    def _get_capacity_for(self, count: int) -> int:
+        capacity = _MIN_CAPACITY
+        while capacity * _MAX_LOAD_FACTOR < count:
+            capacity <<= 1
+        return capacity
+
+    def _home_slot(self, short_id: int) -> int:
+        return ((short_id * _HASH_MULTIPLIER) & 0xFFFFFFFF) >> self._shift
+
+    def _find_slot(self, short_id: int) -> int:
+        """
+        :return: slot index of the short id if it exists, otherwise `-1 - slot` of the first free slot
+        """
+        keys = self._keys
+        mask = self._mask
+        slot = ((short_id * _HASH_MULTIPLIER) & 0xFFFFFFFF) >> self._shift
+        while True:
+            current = keys[slot]
+            if current == short_id:
+                return slot
+            if current == constants.NULL_TX_SID:
+                return -1 - slot
+            slot = (slot + 1) & mask
+
+    def _delete_slot(self, slot: int) -> None:
+        keys = self._keys
+        values = self._values
+        mask = self._mask
+
+        next_slot = (slot + 1) & mask
+        while keys[next_slot] != constants.NULL_TX_SID:
+            home_slot = self._home_slot(keys[next_slot])
+            # entry can fill the hole only if the hole lies on its probe path
+            if (next_slot - home_slot) & mask >= (next_slot - slot) & mask:
+                keys[slot] = keys[next_slot]
+                values[slot] = values[next_slot]
+                slot = next_slot
+            next_slot = (next_slot + 1) & mask
+
+        keys[slot] = constants.NULL_TX_SID
+        values[slot] = self._get_empty_value()
+        self._count -= 1
+
+    def _resize(self, capacity: int) -> None:
+        old_keys = self._keys
+        old_values = self._values
+        self._allocate(capacity)
+
+        keys = self._keys
+        values = self._values
+        mask = self._mask
+        for old_slot, short_id in enumerate(old_keys):
+            if short_id == constants.NULL_TX_SID:
+                continue
+            slot = self._home_slot(short_id)
+            while keys[slot] != constants.NULL_TX_SID:
+                slot = (slot + 1) & mask
+            keys[slot] = short_id
+            values[slot] = old_values[old_slot]
+
+
+class ShortIdArrayMap(AbstractShortIdArrayMap[VT]):
+    """
+    Short id to object mapping. Values are kept in a list running parallel to the key array.
+    """
+
+    def _allocate_values(self, capacity: int) -> Any:
+        return [None] * capacity
+
+    def _encode_value(self, value: VT) -> Any:
+        return value
+
+    def _decode_value(self, raw_value: Any) -> VT:
+        return raw_value
+
+    def _get_empty_value(self) -> Any:
+        return None
+
+
+class ShortIdFlagArrayMap(AbstractShortIdArrayMap[TransactionFlag]):
+    """
+    Short id to transaction flag mapping. Flags are stored as raw 16 bit values in `array("H")`.
+    """
+
+    def _allocate_values(self, capacity: int) -> Any:
+        return array("H", bytes(2 * capacity))
+
+    def _encode_value(self, value: TransactionFlag) -> Any:
+        return value.value
+
+    def _decode_value(self, raw_value: Any) -> TransactionFlag:
+        return TransactionFlag(raw_value)
+
+    def _get_empty_value(self) -> Any:
+        return 0
+
+    def get_bytes_length(self) -> int:
+        values = self._values
+        return self._keys.itemsize * len(self._keys) + values.itemsize * len(values)
+
+
+class ShortIdArray(array):
+    """
+    Compact set-like container for the short ids of a single transaction.
+    Most transactions have a single short id, which makes a 4 byte array entry much cheaper than a set.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, short_ids: Optional[Iterable[int]] = None) -> "ShortIdArray":
+        if short_ids is None:
+            short_ids = ()
+        return super().__new__(cls, array_utils.get_uint32_type_code(), short_ids)  # pyre-ignore[6]
+
+    def add(self, short_id: int) -> None:
+        if short_id not in self:
+            if not _is_short_id(short_id):
+                raise ValueError(f"Short id must be an unsigned 32 bit integer, not {short_id!r}.")
+            self.append(short_id)
+
+    def discard(self, short_id: int) -> None:
+        if short_id in self:
+            self.remove(short_id)
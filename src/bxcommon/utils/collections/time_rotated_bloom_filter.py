@@ -0,0 +1,199 @@
+import math
+import time
+from collections import deque
+from typing import Hashable, Deque, Optional, Tuple
+
+# odd 64 bit multiplier, mixes sequential integer keys (e.g. short ids) before deriving bit positions
+_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+_HASH_MASK = (1 << 64) - 1
+
+
+# generations share a byte per bit position, each generation owns one bit of the byte
+MAX_GENERATION_COUNT = 8
+
+
+class _BloomFilterGeneration:
+    __slots__ = ("bit", "item_count", "first_item_time", "last_item_time")
+
+    def __init__(self, bit: int, item_time: float) -> None:
+        self.bit = bit
+        self.item_count = 0
+        self.first_item_time = item_time
+        self.last_item_time = item_time
+
+
+class TimeRotatedBloomFilter:
+    """
+    Approximate set of recently added keys, with the time each key was added known to the precision of a generation.
+
+    Keys are added to the newest of a bounded number of Bloom filter generations. A new generation is started
+    once the newest one reaches its capacity or covers `generation_time_s`, and whole generations are dropped
+    once all their keys expire. Each generation is sized for its capacity, so false positive rate of a lookup
+    never exceeds `false_positive_rate` regardless of the number of added keys.
+
+    Bit arrays of the generations are interleaved, each bit position is a byte holding a bit of every generation.
+    A lookup computes each bit position once and checks all generations with a single byte access, stopping at
+    the first position no generation has set.
+
+    Supports subset of the mapping interface used for removed transactions history: `key in filter` and
+    `filter[key] = time_added`. Time a key was added is not stored, `get_time_added_upper_bound(key)` returns
+    time the newest generation which may contain the key was last updated, an upper bound of the time the key
+    was added.
+    Keys must have stable `hash` values within the process.
+    """
+
+    def __init__(
+        self,
+        expiration_time_s: float,
+        capacity: int,
+        generation_count: int,
+        false_positive_rate: float
+    ) -> None:
+        if not 2 <= generation_count <= MAX_GENERATION_COUNT:
+            raise ValueError(
+                f"Between 2 and {MAX_GENERATION_COUNT} generations are required to rotate filter."
+            )
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("False positive rate must be between 0 and 1.")
+
+        self.expiration_time_s = expiration_time_s
+        self.generation_count = generation_count
+        # keys expire with a whole generation, so generations cover shorter time than expiration time
+        self.generation_time_s = expiration_time_s / (generation_count - 1)
+        self.generation_capacity = max(1, math.ceil(capacity / (generation_count - 1)))
+
+        # lookups check all generations, each of them gets an equal share of the false positive rate
+        generation_false_positive_rate = false_positive_rate / generation_count
+        self._bit_count = max(
+            8, math.ceil(-self.generation_capacity * math.log(generation_false_positive_rate) / (math.log(2) ** 2))
+        )
+        self._hash_count = max(1, round(self._bit_count / self.generation_capacity * math.log(2)))
+        self._generations: Deque[_BloomFilterGeneration] = deque()
+        # allocated with the first generation
+        self._bit_positions = bytearray()
+        self._free_generation_bits = [1 << i for i in range(generation_count)]
+
+    def __len__(self) -> int:
+        """
+        :return: number of keys added to the live generations, duplicates included
+        """
+        return sum(generation.item_count for generation in self._generations)
+
+    def __bool__(self) -> bool:
+        return bool(self._generations)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._find_generation_bits(key) != 0
+
+    def __setitem__(self, key: Hashable, time_added: float) -> None:
+        self.add(key, time_added)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}<items: {len(self)}, generations: {len(self._generations)}, "
+            f"bytes: {self.get_bytes_length()}>"
+        )
+
+    def add(self, key: Hashable, time_added: Optional[float] = None) -> None:
+        if time_added is None:
+            time_added = time.time()
+
+        generations = self._generations
+        if not generations or \
+                generations[-1].item_count >= self.generation_capacity or \
+                time_added - generations[-1].first_item_time > self.generation_time_s:
+            if len(generations) == self.generation_count:
+                self._remove_generations(1)
+            if not self._bit_positions:
+                self._bit_positions = bytearray(self._bit_count)
+            generations.append(_BloomFilterGeneration(self._free_generation_bits.pop(), time_added))
+
+        generation = generations[-1]
+        generation_bit = generation.bit
+        bit_positions = self._bit_positions
+        bit_count = self._bit_count
+        position, step = self._get_hashes(key)
+        for _ in range(self._hash_count):
+            bit_positions[position % bit_count] |= generation_bit
+            position += step
+        generation.item_count += 1
+        generation.last_item_time = max(generation.last_item_time, time_added)
+
+    def get_time_added_upper_bound(self, key: Hashable) -> float:
+        """
+        :param key: key to look up
+        :return: time the newest generation which may contain the key was last updated, not earlier than the time
+        the key was added
+        :raises KeyError: if the key is not in the filter
+        """
+        generation_bits = self._find_generation_bits(key)
+        for generation in reversed(self._generations):
+            if generation.bit & generation_bits:
+                return generation.last_item_time
+        raise KeyError(key)
+
+    def cleanup(self, current_time: Optional[float] = None) -> int:
+        """
+        Drops generations whose newest key has expired
+        :param current_time: time to use as current time for expiration
+        :return: number of dropped generations
+        """
+        if current_time is None:
+            current_time = time.time()
+
+        removed_count = 0
+        for generation in self._generations:
+            if current_time - generation.last_item_time <= self.expiration_time_s:
+                break
+            removed_count += 1
+        if removed_count:
+            self._remove_generations(removed_count)
+        return removed_count
+
+    def clear(self) -> None:
+        self._remove_generations(len(self._generations))
+
+    def get_bytes_length(self) -> int:
+        """
+        :return: number of bytes allocated for bit arrays of the generations
+        """
+        return len(self._bit_positions)
+
+    def _remove_generations(self, count: int) -> None:
+        """
+        Removes oldest generations and clears their bits
+        """
+        generations = self._generations
+        removed_bits = 0
+        for _ in range(count):
+            generation = generations.popleft()
+            removed_bits |= generation.bit
+            self._free_generation_bits.append(generation.bit)
+
+        if not generations:
+            self._bit_positions = bytearray()
+        elif removed_bits:
+            self._bit_positions = self._bit_positions.translate(bytes(i & ~removed_bits for i in range(256)))
+
+    def _find_generation_bits(self, key: Hashable) -> int:
+        """
+        :return: bits of generations which may contain the key
+        """
+        bit_positions = self._bit_positions
+        if not bit_positions:
+            return 0
+
+        bit_count = self._bit_count
+        generation_bits = 0xFF
+        position, step = self._get_hashes(key)
+        for _ in range(self._hash_count):
+            generation_bits &= bit_positions[position % bit_count]
+            if not generation_bits:
+                break
+            position += step
+        return generation_bits
+
+    def _get_hashes(self, key: Hashable) -> Tuple[int, int]:
+        # double hashing, two 32 bit halves of mixed hash derive all bit positions
+        mixed_hash = (hash(key) * _HASH_MULTIPLIER) & _HASH_MASK
+        return mixed_hash & 0xFFFFFFFF, (mixed_hash >> 32) | 1
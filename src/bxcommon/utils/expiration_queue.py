@@ -29,12 +29,15 @@ class ExpirationQueue(Generic[T]):
     def __bool__(self) -> bool:
         return len(self) > 0
 
-    def add(self, item: T) -> None:
+    def add(self, item: T, timestamp: Optional[float] = None) -> None:
         """
         Adds item to the queue
         :param item: item
+        :param timestamp: time the item was added, defaults to current time
         """
-        self.queue[item] = time.time()
+        if timestamp is None:
+            timestamp = time.time()
+        self.queue[item] = timestamp
 
     def remove(self, item: T) -> None:
         """
@@ -119,5 +122,15 @@ class ExpirationQueue(Generic[T]):
             if remove_callback is not None:
                 remove_callback(item, **kwargs)
 
+    def sort(self) -> None:
+        """
+        Restores order of items by timestamp, after items were added with timestamps older than timestamps
+        of items already in the queue. Items are expired in order of the queue.
+        """
+        queue = self.queue
+        for item, _timestamp in sorted(queue.items(), key=lambda item_timestamp: item_timestamp[1]):
+            # pyre-fixme[16]: `Dict` has no attribute `move_to_end`.
+            queue.move_to_end(item)
+
     def clear(self) -> None:
         self.queue.clear()
@@ -69,6 +69,19 @@ def get_object_size(obj, sizer=asizeof):
     return _to_size_obj(obj_size, DEFAULT_DETAILED_MEMORY_BREAKDOWN_LIMIT)
 
 
+def get_incremental_collection_size(collection: Any, items_size: int) -> ObjectSize:
+    """
+    Estimates size of a collection in constant time, without walking its items.
+    Size of the container itself (hash table, array) is provided by `sys.getsizeof`, size of items has to be
+    maintained by the owner of the collection as items are added and removed.
+    :param collection: collection to calculate size
+    :param items_size: total size of objects referenced by the collection
+    :return: estimated size of the collection
+    """
+    flat_size = getsizeof(collection)
+    return ObjectSize(size=flat_size + items_size, flat_size=flat_size, is_actual_size=False)
+
+
 def get_detailed_object_size(obj, detailed_if_greater_than=DEFAULT_DETAILED_MEMORY_BREAKDOWN_LIMIT, sizer=asizeof):
     # type: (object, int, Any) -> ObjectSize
     """
@@ -194,6 +207,7 @@ class SizeType(Enum):
     OBJECT = "Object"
     TRUE = "True"
     ESTIMATE = "Estimate"
+    INCREMENTAL = "Incremental"
 
     def __str__(self) -> str:
         return str(self.value)
@@ -1,9 +1,16 @@
 import struct
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 from bxutils import logging
 
 logger = logging.get_logger(__name__)
 
+_BYTE_ORDER_PREFIXES = "@=<>!"
+
+
+def _identity(value):
+    return value
+
 
 class PayloadElement:
     """payload element
@@ -18,8 +25,8 @@ class PayloadElement:
         self.structure = structure
         self.default = default
         self.size = struct.calcsize(self.structure)
-        self.decode = decode or (lambda x: x)
-        self.encode = encode or (lambda x: x)
+        self.decode = decode or _identity
+        self.encode = encode or _identity
         self.block_name = None
         self.block_version = None
         self.offset = None
@@ -43,6 +50,7 @@ class PayloadBlock:
         self.size = 0
         self.structure = ""
         self.elements = self._iter_input(elements, args, name, version)
+        self.layout = PayloadLayout(self)
 
     def _iter_input(self, elements, iterator, name, version):
         for item in iterator:
@@ -85,6 +93,9 @@ class PayloadBlock:
 
     def read(self, buf):
         """unpacks buffer contents into dictionary"""
+        if self.off <= len(buf):
+            return self.layout.read(buf)
+
         contents = dict()
         for element in self.elements:
             if element.offset + element.size > len(buf):
@@ -101,3 +112,102 @@ class PayloadBlock:
     def __iter__(self):
         for item in self.elements:
             yield item
+
+
+class PayloadField:
+    """
+    Accessor of a single payload element at a precomputed offset, with a cached struct.
+
+    `get(buf)` and `set(buf, value)` apply element decode and encode functions.
+    """
+    __slots__ = ("name", "offset", "size", "get", "set")
+
+    def __init__(self, element: PayloadElement) -> None:
+        self.name = element.name
+        self.offset = offset = element.offset
+        self.size = element.size
+
+        element_struct = struct.Struct(element.structure)
+        unpack_from = element_struct.unpack_from
+        pack_into = element_struct.pack_into
+        decode = element.decode
+        encode = element.encode
+
+        self.get: Callable[[Union[bytearray, memoryview]], Any]
+        self.set: Callable[[Union[bytearray, memoryview], Any], None]
+        if decode is _identity:
+            self.get = lambda buf: unpack_from(buf, offset)[0]
+        else:
+            self.get = lambda buf: decode(unpack_from(buf, offset)[0])
+        if encode is _identity:
+            self.set = lambda buf, value: pack_into(buf, offset, value)
+        else:
+            self.set = lambda buf, value: pack_into(buf, offset, encode(value))
+
+
+class PayloadLayout:
+    """
+    Compiled form of a PayloadBlock. Element offsets and struct formats are resolved once, so field
+    access does no offset arithmetic or format parsing, and all fields can be packed or unpacked
+    with a single struct call.
+
+    Elements of a block are contiguous, so byte order prefixes are dropped and fields are combined
+    into one little endian struct. Elements must not rely on native sizes or alignment.
+    """
+
+    def __init__(self, block: PayloadBlock) -> None:
+        self.name = block.name
+        self.start_offset = block.start_offset
+        self.size = block.size
+        self.names: Tuple[str, ...] = tuple(element.name for element in block.elements)
+        self.fields: Dict[str, PayloadField] = {element.name: PayloadField(element) for element in block.elements}
+
+        self._formats: List[str] = [element.structure.lstrip(_BYTE_ORDER_PREFIXES) for element in block.elements]
+        self.struct = struct.Struct("<" + "".join(self._formats))
+        if self.struct.size != self.size:
+            raise ValueError(
+                f"Elements of {self.name} payload block cannot be combined, struct size {self.struct.size} "
+                f"does not match block size {self.size}."
+            )
+
+        self._decoders: List[Callable[[Any], Any]] = [element.decode for element in block.elements]
+        self._encoders: List[Callable[[Any], Any]] = [element.encode for element in block.elements]
+        self._leading_structs: Dict[int, struct.Struct] = {}
+
+    def __getitem__(self, name: str) -> PayloadField:
+        return self.fields[name]
+
+    def unpack(self, buf: Union[bytearray, bytes, memoryview]) -> Tuple[Any, ...]:
+        """
+        unpacks all fields with a single struct call
+        :return: decoded field values in element order
+        """
+        return tuple(
+            decode(value) for decode, value in zip(self._decoders, self.struct.unpack_from(buf, self.start_offset))
+        )
+
+    def unpack_leading(self, buf: Union[bytearray, bytes, memoryview], count: int) -> Tuple[Any, ...]:
+        """
+        unpacks the first `count` fields with a single struct call, leaving the remaining fields unread
+        :param count: number of leading fields to unpack
+        :return: decoded values of the leading fields in element order
+        """
+        leading_struct = self._leading_structs.get(count)
+        if leading_struct is None:
+            leading_struct = struct.Struct("<" + "".join(self._formats[:count]))
+            self._leading_structs[count] = leading_struct
+        return tuple(
+            decode(value) for decode, value in zip(self._decoders, leading_struct.unpack_from(buf, self.start_offset))
+        )
+
+    def pack_into(self, buf: Union[bytearray, memoryview], *values) -> None:
+        """
+        packs all fields with a single struct call
+        :param values: field values in element order
+        """
+        self.struct.pack_into(
+            buf, self.start_offset, *[encode(value) for encode, value in zip(self._encoders, values)]
+        )
+
+    def read(self, buf: Union[bytearray, bytes, memoryview]) -> Dict[str, Any]:
+        return dict(zip(self.names, self.unpack(buf)))
@@ -1,7 +1,10 @@
+import asyncio
 import time
-from typing import Optional
+from typing import Optional, Iterable, List
 import task_pool_executor as tpe
 
+from bxcommon import constants
+
 _executor: Optional[tpe.TaskPoolExecutor] = None
 
 
@@ -14,20 +17,86 @@ def init(thread_pool_parallelism_degree: int) -> None:
     _executor = executor
 
 
-# TODO : convert to async
 def run_task(tsk: tpe.MainTaskBase) -> None:
-    executor = _executor
+    run_tasks([tsk])
 
-    assert executor is not None
-    executor.enqueue_task(tsk)
-    while not tsk.is_completed():
-        time.sleep(0)
-        continue
-    tsk.assert_execution()
-    tsk.cleanup()
+
+def run_tasks(tasks: Iterable[tpe.MainTaskBase]) -> None:
+    """
+    Enqueues all tasks before waiting for any of them, so the tasks are executed by the pool concurrently.
+    Blocks until all tasks are completed.
+    :param tasks: tasks to execute
+    """
+    tasks = _enqueue_tasks(tasks)
+    for tsk in tasks:
+        while not tsk.is_completed():
+            time.sleep(0)
+            continue
+    _complete_tasks(tasks)
+
+
+def run_task_async(tsk: tpe.MainTaskBase) -> "asyncio.Future[None]":
+    return run_tasks_async([tsk])
+
+
+def run_tasks_async(tasks: Iterable[tpe.MainTaskBase]) -> "asyncio.Future[None]":
+    """
+    Enqueues all tasks and returns a future completed once all of them are completed, so the event loop keeps
+    processing network events while the pool executes the tasks.
+    The executor does not signal completion, pending tasks are checked by an event loop callback every
+    `TASK_POOL_POLL_INTERVAL_S`. Tasks cannot be interrupted, they are cleaned up on completion even if the
+    future is cancelled.
+    :param tasks: tasks to execute
+    :return: future raising the first execution error of the tasks, if any
+    """
+    tasks = _enqueue_tasks(tasks)
+    loop = asyncio.get_event_loop()
+    future = loop.create_future()
+    pending_tasks = tasks
+
+    def check_completion() -> None:
+        nonlocal pending_tasks
+        pending_tasks = [tsk for tsk in pending_tasks if not tsk.is_completed()]
+        if pending_tasks:
+            loop.call_later(constants.TASK_POOL_POLL_INTERVAL_S, check_completion)
+            return
+
+        try:
+            _complete_tasks(tasks)
+        except Exception as e:  # pylint: disable=broad-except
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(None)
+
+    loop.call_soon(check_completion)
+    return future
 
 
 def get_pool_size() -> int:
     executor = _executor
     assert executor is not None
     return executor.size()
+
+
+def _enqueue_tasks(tasks: Iterable[tpe.MainTaskBase]) -> List[tpe.MainTaskBase]:
+    executor = _executor
+
+    assert executor is not None
+    tasks = list(tasks)
+    for tsk in tasks:
+        executor.enqueue_task(tsk)
+    return tasks
+
+
+def _complete_tasks(tasks: List[tpe.MainTaskBase]) -> None:
+    """
+    Raises the first execution error of the tasks, if any. All tasks are cleaned up either way.
+    """
+    try:
+        for tsk in tasks:
+            tsk.assert_execution()
+    finally:
+        for tsk in tasks:
+            tsk.cleanup()
@@ -310,3 +310,8 @@ WS_COULD_NOT_PROCESS_NOTIFICATION = LogMessage(
     PROCESSING_FAILED_CATEGORY,
     "Unexpected error in feed callback: {}."
 )
+TRANSACTION_SERVICE_SNAPSHOT_FAILURE = LogMessage(
+    "C-000060",
+    MEMORY_CATEGORY,
+    "Could not {} transaction service snapshot {}: {}. Transaction service state will be synced from peers."
+)
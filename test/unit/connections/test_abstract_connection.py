@@ -1,3 +1,5 @@
+import time
+
 from mock import MagicMock
 
 from bxcommon.messages.abstract_message import AbstractMessage
@@ -13,6 +15,7 @@ from bxcommon.messages.bloxroute.hello_message import HelloMessage
 from bxcommon.messages.bloxroute.ping_message import PingMessage
 from bxcommon.messages.bloxroute.pong_message import PongMessage
 from bxcommon.test_utils.helpers import create_connection
+from bxcommon.utils.buffers.output_buffer import OutputBuffer
 
 
 class AbstractConnectionTest(AbstractTestCase):
@@ -135,3 +138,67 @@ class AbstractConnectionTest(AbstractTestCase):
         result = self.connection.send_ping()
         self.connection.enqueue_msg.assert_called_once_with(PingMessage())
         self.assertEqual(self.connection.ping_interval_s, result)
+
+    def test_advance_sent_buffers_through_hooks(self):
+        self.connection.advance_bytes_on_buffer = MagicMock(wraps=self.connection.advance_bytes_on_buffer)
+        for nonce in range(3):
+            self.connection.enqueue_msg(PingMessage(nonce))
+
+        buffers = self.connection.get_buffers_to_send(1000)
+        self.assertEqual(3, len(buffers))
+
+        bytes_sent = sum(len(buffer) for buffer in buffers)
+        self.connection.advance_sent_buffers(bytes_sent)
+
+        self.connection.advance_bytes_on_buffer.assert_called_once_with(self.connection.outputbuf, bytes_sent)
+        self.assertEqual(0, self.connection.outputbuf.length)
+
+    def test_get_buffers_to_send_overridden_bytes_to_send(self):
+        custom_bytes = memoryview(bytearray(b"custom"))
+
+        class CustomOutputConnection(self.TestAbstractConnection):
+            SEND_OUTPUT_BUFFER_BATCHES = False
+
+            def get_bytes_to_send(self):
+                return custom_bytes
+
+        connection = create_connection(CustomOutputConnection)
+        for nonce in range(3):
+            connection.enqueue_msg(PingMessage(nonce))
+
+        self.assertEqual([custom_bytes], connection.get_buffers_to_send(1000))
+
+    def test_output_buffer_flushed_after_hold_time(self):
+        self.connection.outputbuf = OutputBuffer(enable_buffering=True)
+        self.connection.socket_connection.send = MagicMock()
+        alarm_count = len(self.connection.node.alarm_queue.alarms)
+
+        self.connection.enqueue_msg(PingMessage(1))
+        self.connection.enqueue_msg(PingMessage(2))
+        self.assertIsNotNone(self.connection.output_flush_alarm_id)
+        self.assertEqual(alarm_count + 1, len(self.connection.node.alarm_queue.alarms))
+        self.assertEqual(OutputBuffer.EMPTY, self.connection.outputbuf.get_buffer())
+
+        time.time = MagicMock(return_value=time.time() + self.connection.outputbuf.max_hold_time)
+        self.connection.node.alarm_queue.fire_alarms()
+
+        self.assertIsNone(self.connection.output_flush_alarm_id)
+        self.assertEqual(
+            PingMessage(1).rawbytes().tobytes() + PingMessage(2).rawbytes().tobytes(),
+            self.connection.outputbuf.get_buffer().tobytes()
+        )
+        self.connection.socket_connection.send.assert_called()
+
+        self.connection.enqueue_msg(PingMessage(3))
+        self.assertIsNotNone(self.connection.output_flush_alarm_id)
+
+    def test_output_buffer_flush_unscheduled_on_dispose(self):
+        self.connection.outputbuf = OutputBuffer(enable_buffering=True)
+        self.connection.enqueue_msg(PingMessage(1))
+        alarm_id = self.connection.output_flush_alarm_id
+        self.assertIsNotNone(alarm_id)
+
+        self.connection.dispose()
+
+        self.assertIsNone(self.connection.output_flush_alarm_id)
+        self.assertFalse(alarm_id.is_active)
@@ -20,6 +20,7 @@ from bxcommon.test_utils.abstract_test_case import AbstractTestCase
 from bxcommon.test_utils.helpers import async_test
 from bxcommon.test_utils.mocks.mock_connection import MockConnection
 from bxcommon.test_utils.mocks.mock_node_ssl_service import MockNodeSSLService
+from bxcommon.utils.buffers.output_buffer import OutputBuffer
 from bxutils.services.node_ssl_service import NodeSSLService
 
 
@@ -131,7 +132,18 @@ class AbstractNodeTest(AbstractTestCase):
         data = helpers.generate_bytearray(250)
         self.node.connection_pool.add(self.fileno, self.ip, self.port, self.connection)
         self.node.on_bytes_received(self.fileno, data)
-        self.assertEqual(data, self.connection.inputbuf.input_list[0])
+        self.assertEqual(data, self.connection.inputbuf[:])
+
+    def test_on_bytes_received_into_buffer(self):
+        data = helpers.generate_bytearray(250)
+        self.assertIsNone(self.node.get_receive_buffer(self.fileno, 1024))
+
+        self.node.connection_pool.add(self.fileno, self.ip, self.port, self.connection)
+        receive_buf = self.node.get_receive_buffer(self.fileno, 1024)
+        self.assertGreaterEqual(len(receive_buf), 1024)
+        receive_buf[:len(data)] = data
+        self.node.on_bytes_received_into_buffer(self.fileno, len(data))
+        self.assertEqual(data, self.connection.inputbuf[:])
 
     def test_get_bytes_to_send(self):
         data = helpers.generate_bytearray(250)
@@ -147,6 +159,18 @@ class AbstractNodeTest(AbstractTestCase):
         self.node.on_bytes_sent(self.fileno, advance_by)
         self.assertEqual(advance_by, self.connection.outputbuf.index)
 
+    def test_flush_all_send_buffers(self):
+        data = helpers.generate_bytearray(200)
+        self.connection.outputbuf = OutputBuffer(enable_buffering=True)
+        self.connection.outputbuf.enqueue_msgbytes(data)
+        self.connection.socket_connection.can_send = True
+        self.connection.socket_connection.send = MagicMock()
+        self.node.connection_pool.add(self.fileno, self.ip, self.port, self.connection)
+
+        self.assertEqual(self.node.FLUSH_SEND_BUFFERS_INTERVAL, self.node.flush_all_send_buffers())
+        self.assertEqual(data, self.connection.outputbuf.get_buffer())
+        self.connection.socket_connection.send.assert_called_once()
+
     @async_test
     async def test_close(self):
         self.node.connection_pool.add(self.fileno, self.ip, self.port, self.connection)
@@ -155,6 +179,16 @@ class AbstractNodeTest(AbstractTestCase):
         self.assertNotIn(self.connection, self.node.connection_pool.by_fileno)
         self.connection.dispose.assert_called_once()
 
+    @async_test
+    async def test_close_saves_snapshots(self):
+        tx_services = [MagicMock(), MagicMock()]
+        self.node.snapshot_tx_services.extend(tx_services)
+
+        await self.node.close()
+
+        for tx_service in tx_services:
+            tx_service.save_snapshot.assert_called_once()
+
     def test_enqueue_connection(self):
 
         self.assertNotIn(
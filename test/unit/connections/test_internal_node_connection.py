@@ -0,0 +1,194 @@
+import time
+
+from mock import MagicMock, patch
+
+from bxcommon import constants
+from bxcommon.connections.connection_type import ConnectionType
+from bxcommon.connections.internal_node_connection import InternalNodeConnection
+from bxcommon.messages.bloxroute.bloxroute_message_factory import bloxroute_message_factory
+from bxcommon.messages.bloxroute.bloxroute_message_type import BloxrouteMessageType
+from bxcommon.messages.bloxroute.hello_message import HelloMessage
+from bxcommon.messages.bloxroute.ping_message import PingMessage
+from bxcommon.messages.bloxroute.tx_batch_message import TxBatchMessage
+from bxcommon.messages.bloxroute.tx_message import TxMessage
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils import crypto
+from bxcommon.utils.object_hash import Sha256Hash
+
+
+class InternalNodeConnectionTest(AbstractTestCase):
+    class TestInternalNodeConnection(InternalNodeConnection):
+        CONNECTION_TYPE = ConnectionType.RELAY_TRANSACTION
+
+    NETWORK_NUM = 5
+
+    def setUp(self):
+        opts = helpers.get_common_opts(8002)
+        opts.tx_batch_max_delay_ms = 10
+        self.connection = helpers.create_connection(self.TestInternalNodeConnection, node_opts=opts)
+        self.connection.on_connection_established()
+        self.connection.peer_accepts_tx_batch = True
+        self.connection.enqueue_msg_bytes = MagicMock()
+
+    def test_tx_batch_handler_registered(self):
+        self.assertEqual(
+            self.connection.msg_tx_batch, self.connection.message_handlers[BloxrouteMessageType.TX_BATCH]
+        )
+
+        self.connection.message_handlers[BloxrouteMessageType.TRANSACTION] = MagicMock()
+        self.connection.enqueue_msg(self.create_hello_message())
+        self.assertTrue(self.sent_messages()[0].supports_tx_batch())
+
+    def test_tx_batch_not_supported_without_tx_handler(self):
+        self.assertNotIn(BloxrouteMessageType.TRANSACTION, self.connection.message_handlers)
+
+        self.connection.enqueue_msg(self.create_hello_message())
+        self.assertFalse(self.sent_messages()[0].supports_tx_batch())
+
+    def test_tx_batch_not_sent_if_peer_does_not_accept(self):
+        self.connection.peer_accepts_tx_batch = False
+        tx_message = self.create_tx_message(1)
+
+        self.connection.enqueue_msg(tx_message)
+        self.assertEqual([tx_message.rawbytes()], self.sent_bytes())
+        self.assertEqual([], self.connection.pending_tx_batch)
+
+    def test_tx_batch_flushed_on_alarm(self):
+        tx_messages = [self.create_tx_message(i) for i in range(3)]
+        for tx_message in tx_messages:
+            self.connection.enqueue_msg(tx_message)
+
+        self.assertEqual([], self.sent_messages())
+        self.assertIsNotNone(self.connection.tx_batch_alarm_id)
+
+        time.time = MagicMock(return_value=time.time() + self.connection.tx_batch_max_delay_s)
+        self.connection.node.alarm_queue.fire_alarms()
+
+        self.assertIsNone(self.connection.tx_batch_alarm_id)
+        self.assertEqual([], self.connection.pending_tx_batch)
+        self.assertEqual(0, self.connection.pending_tx_batch_size)
+        self.assert_tx_batch(tx_messages, self.sent_messages()[0])
+
+    def test_single_tx_flushed_as_tx_message(self):
+        tx_message = self.create_tx_message(1)
+        self.connection.enqueue_msg(tx_message)
+
+        time.time = MagicMock(return_value=time.time() + self.connection.tx_batch_max_delay_s)
+        self.connection.node.alarm_queue.fire_alarms()
+
+        self.assertEqual([tx_message.rawbytes()], self.sent_bytes())
+
+    @patch("bxcommon.constants.TX_BATCH_MAX_COUNT", 3)
+    def test_tx_batch_flushed_on_max_count(self):
+        tx_messages = [self.create_tx_message(i) for i in range(4)]
+        for tx_message in tx_messages[:2]:
+            self.connection.enqueue_msg(tx_message)
+        self.assertEqual([], self.sent_messages())
+
+        self.connection.enqueue_msg(tx_messages[2])
+        self.assertEqual(1, len(self.sent_messages()))
+        self.assert_tx_batch(tx_messages[:3], self.sent_messages()[0])
+        self.assertIsNone(self.connection.tx_batch_alarm_id)
+
+        self.connection.enqueue_msg(tx_messages[3])
+        self.assertEqual([tx_messages[3]], self.connection.pending_tx_batch)
+        self.assertIsNotNone(self.connection.tx_batch_alarm_id)
+
+    def test_tx_batch_flushed_on_max_size(self):
+        tx_messages = [self.create_tx_message(i, tx_size=1000) for i in range(3)]
+        max_size = 2 * len(tx_messages[0].rawbytes()) + 1
+
+        with patch("bxcommon.constants.TX_BATCH_MAX_SIZE_BYTES", max_size):
+            for tx_message in tx_messages[:2]:
+                self.connection.enqueue_msg(tx_message)
+            self.assertEqual([], self.sent_messages())
+            self.assertEqual(max_size - 1, self.connection.pending_tx_batch_size)
+
+            self.connection.enqueue_msg(tx_messages[2])
+
+        self.assert_tx_batch(tx_messages, self.sent_messages()[0])
+        self.assertEqual(0, self.connection.pending_tx_batch_size)
+
+    def test_tx_batch_flushed_before_other_messages(self):
+        tx_messages = [self.create_tx_message(i) for i in range(2)]
+        ping_message = PingMessage(1)
+
+        for tx_message in tx_messages:
+            self.connection.enqueue_msg(tx_message)
+        self.connection.enqueue_msg(ping_message)
+        self.connection.enqueue_msg(tx_messages[0])
+
+        sent_messages = self.sent_messages()
+        self.assertEqual(2, len(sent_messages))
+        self.assert_tx_batch(tx_messages, sent_messages[0])
+        self.assertEqual(ping_message.rawbytes(), sent_messages[1].rawbytes())
+        self.assertEqual([tx_messages[0]], self.connection.pending_tx_batch)
+
+    def test_tx_batch_flushed_on_network_change(self):
+        tx_messages = [self.create_tx_message(i) for i in range(2)]
+        other_network_tx_message = self.create_tx_message(3, network_num=self.NETWORK_NUM + 1)
+
+        for tx_message in tx_messages:
+            self.connection.enqueue_msg(tx_message)
+        self.connection.enqueue_msg(other_network_tx_message)
+
+        self.assert_tx_batch(tx_messages, self.sent_messages()[0])
+        self.assertEqual([other_network_tx_message], self.connection.pending_tx_batch)
+        self.assertEqual(len(other_network_tx_message.rawbytes()), self.connection.pending_tx_batch_size)
+        self.assertIsNotNone(self.connection.tx_batch_alarm_id)
+
+    def test_tx_batch_dropped_on_mark_for_close(self):
+        self.connection.enqueue_msg(self.create_tx_message(1))
+        self.assertIsNotNone(self.connection.tx_batch_alarm_id)
+
+        self.connection.mark_for_close()
+
+        self.assertEqual([], self.connection.pending_tx_batch)
+        self.assertEqual(0, self.connection.pending_tx_batch_size)
+        self.assertIsNone(self.connection.tx_batch_alarm_id)
+
+        time.time = MagicMock(return_value=time.time() + self.connection.tx_batch_max_delay_s)
+        self.connection.node.alarm_queue.fire_alarms()
+        self.connection.enqueue_msg_bytes.assert_not_called()
+
+    def test_msg_tx_batch(self):
+        tx_messages = [self.create_tx_message(i) for i in range(3)]
+        tx_handler = MagicMock()
+        self.connection.message_handlers[BloxrouteMessageType.TRANSACTION] = tx_handler
+
+        self.connection.msg_tx_batch(TxBatchMessage(self.NETWORK_NUM, tx_messages))
+
+        self.assertEqual(
+            [tx_message.rawbytes() for tx_message in tx_messages],
+            [call[0][0].rawbytes() for call in tx_handler.call_args_list]
+        )
+
+    def create_hello_message(self) -> HelloMessage:
+        return HelloMessage(
+            protocol_version=self.connection.protocol_version,
+            network_num=self.NETWORK_NUM,
+            node_id=helpers.generate_node_id()
+        )
+
+    def create_tx_message(self, short_id: int, tx_size: int = 100, network_num: int = NETWORK_NUM) -> TxMessage:
+        return TxMessage(
+            Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN)),
+            network_num,
+            helpers.generate_node_id(),
+            short_id,
+            helpers.generate_bytearray(tx_size)
+        )
+
+    def sent_bytes(self):
+        return [call[0][0] for call in self.connection.enqueue_msg_bytes.call_args_list]
+
+    def sent_messages(self):
+        return [bloxroute_message_factory.create_message_from_buffer(msg_bytes) for msg_bytes in self.sent_bytes()]
+
+    def assert_tx_batch(self, expected_tx_messages, msg):
+        self.assertIsInstance(msg, TxBatchMessage)
+        self.assertEqual(
+            [tx_message.rawbytes() for tx_message in expected_tx_messages],
+            [tx_message.rawbytes() for tx_message in msg.tx_messages()]
+        )
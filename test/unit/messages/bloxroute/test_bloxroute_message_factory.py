@@ -347,7 +347,13 @@ class BloxrouteMessageFactory(MessageFactoryTestCase):
         self.assertEqual(block_hash, block_txs_message.block_hash())
         self.assertEqual(len(txs_info), len(block_txs_message))
 
+        streamed_txs = list(block_txs_message.iter_txs())
+        self.assertEqual(txs_info, streamed_txs)
+        self.assertIsInstance(streamed_txs[0].contents, memoryview)
+
         parsed_txs = block_txs_message.get_txs()
+        self.assertEqual(txs_info, list(block_txs_message))
+        self.assertIsInstance(next(iter(block_txs_message)).contents, bytearray)
 
         for index in range(len(txs_info)):
             self.assertEqual(parsed_txs[index].short_id, txs_info[index].short_id)
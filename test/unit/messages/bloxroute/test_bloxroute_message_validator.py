@@ -37,6 +37,29 @@ class TestBloxrouteMessageValidator(AbstractTestCase):
         self.message_validator.validate(False, BloxrouteMessageType.TRANSACTION, constants.BX_HDR_COMMON_OFF,
                                         self.message_validation_settings.max_tx_size_bytes, input_buffer)
 
+    def test_get_max_payload_len(self):
+        self.assertEqual(50000, self.message_validator.get_max_payload_len(BloxrouteMessageType.TRANSACTION))
+        self.assertEqual(100000, self.message_validator.get_max_payload_len(BloxrouteMessageType.TRANSACTIONS))
+        self.assertEqual(
+            constants.DEFAULT_MAX_PAYLOAD_LEN_BYTES,
+            self.message_validator.get_max_payload_len(BloxrouteMessageType.COMPRESSED_BLOCK_TXS)
+        )
+
+        message_validator = BloxrouteMessageValidator(None, protocol_version.PROTOCOL_VERSION)
+        self.assertEqual(
+            constants.MESSAGE_COMPRESSION_MAX_PAYLOAD_LEN_BYTES,
+            message_validator.get_max_payload_len(BloxrouteMessageType.TRANSACTIONS)
+        )
+        self.assertEqual(
+            constants.DEFAULT_MAX_PAYLOAD_LEN_BYTES,
+            message_validator.get_max_payload_len(BloxrouteMessageType.COMPRESSED_BLOCK_TXS)
+        )
+
+    def test_validate_payload_length(self):
+        self.message_validator.validate_payload_length(BloxrouteMessageType.TRANSACTIONS, 100000)
+        with self.assertRaises(MessageValidationError):
+            self.message_validator.validate_payload_length(BloxrouteMessageType.TRANSACTIONS, 100001)
+
     def test_is_valid_payload_len(self):
         message_bytes = bytearray(1000)
         message_bytes[:constants.STARTING_SEQUENCE_BYTES_LEN] = constants.STARTING_SEQUENCE_BYTES
@@ -0,0 +1,100 @@
+import zlib
+
+from bxcommon import constants
+from bxcommon.messages.bloxroute import message_compression
+from bxcommon.messages.bloxroute.bloxroute_message_factory import bloxroute_message_factory
+from bxcommon.messages.bloxroute.hello_message import HelloMessage
+from bxcommon.messages.bloxroute.txs_message import TxsMessage
+from bxcommon.messages.validation.message_validation_error import MessageValidationError
+from bxcommon.models.transaction_info import TransactionInfo
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils import crypto
+from bxcommon.utils.object_hash import Sha256Hash
+
+
+class MessageCompressionTest(AbstractTestCase):
+
+    def test_compress_decompress(self):
+        msg = self._create_txs_message(bytearray(500))
+
+        compressed_bytes = message_compression.get_message_bytes_to_send(msg)
+        self.assertLess(len(compressed_bytes), len(msg.rawbytes()))
+        self.assertTrue(message_compression.is_compressed(compressed_bytes))
+        self.assertIs(compressed_bytes, message_compression.get_message_bytes_to_send(msg))
+
+        is_full_message, msg_type, payload_len = bloxroute_message_factory.get_message_header_preview_from_input_buffer(
+            helpers.create_input_buffer_with_bytes(compressed_bytes)
+        )
+        self.assertTrue(is_full_message)
+        self.assertEqual(TxsMessage.MESSAGE_TYPE, msg_type)
+        self.assertEqual(len(compressed_bytes) - TxsMessage.HEADER_LENGTH, payload_len)
+
+        decompressed_bytes = message_compression.decompress_message_bytes(compressed_bytes)
+        self.assertEqual(msg.rawbytes().tobytes(), bytes(decompressed_bytes))
+        self.assertFalse(message_compression.is_compressed(decompressed_bytes))
+
+        decompressed_msg = bloxroute_message_factory.create_message_from_buffer(decompressed_bytes)
+        self.assertEqual(msg.get_txs()[0].contents, decompressed_msg.get_txs()[0].contents)
+
+    def test_compress_incompressible_message(self):
+        msg = self._create_txs_message(helpers.generate_bytearray(500))
+
+        msg_bytes = message_compression.get_message_bytes_to_send(msg)
+        self.assertFalse(message_compression.is_compressed(msg_bytes))
+        self.assertEqual(msg.rawbytes().tobytes(), bytes(msg_bytes))
+
+    def test_compressed_bytes_reset_on_message_change(self):
+        msg = self._create_txs_message(bytearray(500))
+        message_compression.get_message_bytes_to_send(msg)
+
+        msg.set_control_flag(0)
+        self.assertIsNone(msg.compressed_rawbytes)
+
+    def test_decompress_corrupted_message(self):
+        compressed_bytes = message_compression.compress_message_bytes(self._create_txs_message(bytearray(500)).rawbytes())
+        compressed_bytes[TxsMessage.HEADER_LENGTH:TxsMessage.HEADER_LENGTH + 4] = bytearray(4)
+
+        with self.assertRaises(MessageValidationError):
+            message_compression.decompress_message_bytes(compressed_bytes)
+
+    def test_decompress_exceeds_max_payload_len(self):
+        compressed_bytes = message_compression.compress_message_bytes(self._create_txs_message(bytearray(500)).rawbytes())
+
+        with self.assertRaises(MessageValidationError):
+            message_compression.decompress_message_bytes(compressed_bytes, 100)
+
+    def test_decompress_max_payload_len(self):
+        msg_bytes = self._create_txs_message(bytearray(500)).rawbytes()
+        payload_len = len(msg_bytes) - TxsMessage.HEADER_LENGTH
+        compressed_bytes = message_compression.compress_message_bytes(msg_bytes)
+
+        decompressed_bytes = message_compression.decompress_message_bytes(compressed_bytes, payload_len)
+        self.assertEqual(msg_bytes.tobytes(), bytes(decompressed_bytes))
+        with self.assertRaises(MessageValidationError):
+            message_compression.decompress_message_bytes(compressed_bytes, payload_len - 1)
+
+    def test_decompress_truncated_message(self):
+        msg_bytes = self._create_txs_message(bytearray(500)).rawbytes()
+        compressed_payload = zlib.compress(msg_bytes[TxsMessage.HEADER_LENGTH:-constants.CONTROL_FLAGS_LEN])
+        compressed_bytes = message_compression.compress_message_bytes(msg_bytes)
+        compressed_bytes[TxsMessage.HEADER_LENGTH:-constants.CONTROL_FLAGS_LEN] = compressed_payload[:10]
+
+        with self.assertRaises(MessageValidationError):
+            message_compression.decompress_message_bytes(compressed_bytes)
+
+    def test_hello_message_supports_compression(self):
+        hello_message = HelloMessage(protocol_version=1, network_num=2)
+        self.assertFalse(hello_message.supports_compression())
+
+        hello_message.set_supports_compression()
+        self.assertTrue(hello_message.supports_compression())
+
+        parsed_hello_message = bloxroute_message_factory.create_message_from_buffer(hello_message.rawbytes())
+        self.assertTrue(parsed_hello_message.supports_compression())
+        self.assertEqual(2, parsed_hello_message.network_num())
+
+    def _create_txs_message(self, contents: bytearray) -> TxsMessage:
+        return TxsMessage(
+            txs=[TransactionInfo(Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN)), contents, 1)]
+        )
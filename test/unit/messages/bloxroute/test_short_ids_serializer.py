@@ -0,0 +1,78 @@
+import struct
+
+from bxcommon.messages.bloxroute import short_ids_serializer, blocks_short_ids_serializer
+from bxcommon.messages.bloxroute.blocks_short_ids_serializer import BlockShortIds
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils.object_hash import Sha256Hash
+
+
+class ShortIdsSerializerTest(AbstractTestCase):
+
+    def test_serialize_and_deserialize_short_ids(self):
+        short_ids = [1, 203, 997, 890333, 5, 2 ** 32 - 1]
+
+        buffer = short_ids_serializer.serialize_short_ids(short_ids)
+
+        self.assertEqual(short_ids_serializer.get_serialized_length(len(short_ids)), len(buffer))
+        self.assertEqual(struct.pack(f"<L{len(short_ids)}L", len(short_ids), *short_ids), buffer)
+        self.assertEqual(short_ids, short_ids_serializer.deserialize_short_ids(buffer))
+
+    def test_serialize_and_deserialize_short_ids_with_offset(self):
+        short_ids = list(range(1000, 1100))
+        buffer = bytearray(3 + short_ids_serializer.get_serialized_length(len(short_ids)) + 5)
+
+        end_offset = short_ids_serializer.serialize_short_ids_to_buffer(short_ids, buffer, 3)
+        self.assertEqual(len(buffer) - 5, end_offset)
+
+        deserialized_short_ids, deserialized_end_offset = short_ids_serializer.deserialize_short_ids_from_buffer(
+            memoryview(buffer), 3
+        )
+        self.assertEqual(short_ids, deserialized_short_ids)
+        self.assertEqual(end_offset, deserialized_end_offset)
+
+    def test_deserialize_short_ids_as_view(self):
+        short_ids = [7, 8, 9]
+        buffer = short_ids_serializer.serialize_short_ids(short_ids)
+
+        short_ids_view = short_ids_serializer.deserialize_short_ids(buffer, as_view=True)
+        self.assertEqual(short_ids, list(short_ids_view))
+        self.assertEqual(3, len(short_ids_view))
+        self.assertEqual(9, short_ids_view[2])
+
+        # view can be serialized again without conversion to a list
+        self.assertEqual(buffer, short_ids_serializer.serialize_short_ids(short_ids_view))
+
+    def test_serialize_and_deserialize_empty_short_ids(self):
+        buffer = short_ids_serializer.serialize_short_ids([])
+        self.assertEqual([], short_ids_serializer.deserialize_short_ids(buffer))
+        self.assertEqual(0, len(short_ids_serializer.deserialize_short_ids(buffer, as_view=True)))
+
+    def test_deserialize_short_ids_truncated_buffer(self):
+        buffer = short_ids_serializer.serialize_short_ids([1, 2, 3])
+        with self.assertRaises(struct.error):
+            short_ids_serializer.deserialize_short_ids(buffer[:-1])
+
+    def test_serialize_invalid_short_ids(self):
+        with self.assertRaises(struct.error):
+            short_ids_serializer.serialize_short_ids([1, 2 ** 32])
+        with self.assertRaises(struct.error):
+            short_ids_serializer.serialize_short_ids([-1])
+        with self.assertRaises(struct.error):
+            short_ids_serializer.pack_short_ids_into([1, 2], bytearray(7), 0)
+
+    def test_serialize_and_deserialize_blocks_short_ids(self):
+        blocks_short_ids = [
+            BlockShortIds(Sha256Hash(helpers.generate_bytearray(32)), [1, 2, 3]),
+            BlockShortIds(Sha256Hash(helpers.generate_bytearray(32)), []),
+            BlockShortIds(Sha256Hash(helpers.generate_bytearray(32)), list(range(500))),
+        ]
+
+        buffer = blocks_short_ids_serializer.serialize_blocks_short_ids_into_bytes(blocks_short_ids)
+        self.assertEqual(
+            blocks_short_ids_serializer.get_serialized_blocks_short_ids_bytes_len(blocks_short_ids), len(buffer)
+        )
+        self.assertEqual(
+            blocks_short_ids,
+            blocks_short_ids_serializer.deserialize_blocks_short_ids_from_buffer(buffer, 0, len(blocks_short_ids))
+        )
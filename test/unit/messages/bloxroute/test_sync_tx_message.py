@@ -64,6 +64,9 @@ class SyncTxServiceTest(MessageFactoryTestCase):
         self.assertEqual(self.NETWORK_NUM, tx_service_sync_txs_msg.network_num())
         self.assertEqual(len(txs_content_short_ids), tx_service_sync_txs_msg.tx_count())
         tx_service_txs_content_short_ids = tx_service_sync_txs_msg.txs_content_short_ids()
+        self.assertEqual(
+            tx_service_txs_content_short_ids, list(tx_service_sync_txs_msg.iter_txs_content_short_ids())
+        )
         tx_contents = [
             self.transaction_service.get_transaction(short_id).contents
             for tx_content_short_id in tx_service_txs_content_short_ids for short_id in tx_content_short_id.short_ids
@@ -0,0 +1,60 @@
+from bxcommon import constants
+from bxcommon.messages.bloxroute.bloxroute_message_factory import bloxroute_message_factory
+from bxcommon.messages.bloxroute.tx_batch_message import TxBatchMessage
+from bxcommon.messages.bloxroute.tx_message import TxMessage
+from bxcommon.models.transaction_flag import TransactionFlag
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils import crypto
+from bxcommon.utils.object_hash import Sha256Hash
+
+
+class TxBatchMessageTest(AbstractTestCase):
+    NETWORK_NUM = 5
+
+    def test_tx_batch_message(self):
+        tx_messages = [
+            self._create_tx_message(1, helpers.generate_bytearray(250), TransactionFlag.PAID_TX, "account 1"),
+            self._create_tx_message(constants.NULL_TX_SID, bytearray(), TransactionFlag.NO_FLAGS, None),
+            self._create_tx_message(3, helpers.generate_bytearray(100), TransactionFlag.LOCAL_REGION, "account 3"),
+        ]
+
+        msg = TxBatchMessage(self.NETWORK_NUM, tx_messages)
+        self.assertEqual(self.NETWORK_NUM, msg.network_num())
+        self.assertEqual(3, msg.tx_count())
+        self.assertLess(len(msg.rawbytes()), sum(len(tx_message.rawbytes()) for tx_message in tx_messages))
+
+        parsed_msg = bloxroute_message_factory.create_message_from_buffer(msg.rawbytes())
+        self.assertIsInstance(parsed_msg, TxBatchMessage)
+        self.assertEqual(self.NETWORK_NUM, parsed_msg.network_num())
+
+        parsed_tx_messages = list(parsed_msg.tx_messages())
+        self.assertEqual(len(tx_messages), len(parsed_tx_messages))
+        for tx_message, parsed_tx_message in zip(tx_messages, parsed_tx_messages):
+            self.assertEqual(tx_message.rawbytes().tobytes(), parsed_tx_message.rawbytes().tobytes())
+            self.assertEqual(tx_message.tx_hash(), parsed_tx_message.tx_hash())
+            self.assertEqual(tx_message.short_id(), parsed_tx_message.short_id())
+            self.assertEqual(tx_message.transaction_flag(), parsed_tx_message.transaction_flag())
+            self.assertEqual(tx_message.timestamp(), parsed_tx_message.timestamp())
+            self.assertEqual(tx_message.account_id(), parsed_tx_message.account_id())
+            self.assertEqual(tx_message.source_id(), parsed_tx_message.source_id())
+            self.assertEqual(tx_message.tx_val(), parsed_tx_message.tx_val())
+
+    def test_empty_tx_batch_message(self):
+        msg = TxBatchMessage(self.NETWORK_NUM, [])
+
+        parsed_msg = bloxroute_message_factory.create_message_from_buffer(msg.rawbytes())
+        self.assertEqual(0, parsed_msg.tx_count())
+        self.assertEqual([], list(parsed_msg.tx_messages()))
+
+    def _create_tx_message(self, short_id, tx_val, transaction_flag, account_id) -> TxMessage:
+        return TxMessage(
+            Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN)),
+            self.NETWORK_NUM,
+            helpers.generate_node_id(),
+            short_id,
+            tx_val,
+            transaction_flag,
+            1612300000.5,
+            account_id,
+        )
@@ -1,3 +1,4 @@
+from bxcommon import constants
 from bxcommon.messages.abstract_internal_message import AbstractInternalMessage
 from bxcommon.messages.bloxroute.tx_message import TxMessage
 from bxcommon.models.transaction_flag import TransactionFlag
@@ -31,6 +32,26 @@ class TxMessageTest(AbstractTestCase):
             TransactionFlag.ELITE_SENDER in reserialized_message.transaction_flag()
         )
 
+    def test_fixed_fields_with_invalid_account_id(self):
+        tx_message = TxMessage(
+            helpers.generate_object_hash(),
+            1,
+            "",
+            short_id=5,
+            tx_val=helpers.generate_bytearray(250),
+            transaction_flag=TransactionFlag.PAID_TX,
+            timestamp=10.5,
+        )
+        account_id_offset = TxMessage.TX_VAL_OFFSET - constants.ACCOUNT_ID_SIZE_IN_BYTES
+        tx_message.buf[account_id_offset:account_id_offset + 2] = b"\xff\xfe"
+        reserialized_message = self._serialize_deserialize_message(tx_message)
+
+        self.assertEqual(5, reserialized_message.short_id())
+        self.assertEqual(10.5, reserialized_message.timestamp())
+        self.assertEqual(TransactionFlag.PAID_TX, reserialized_message.transaction_flag())
+        with self.assertRaises(UnicodeDecodeError):
+            reserialized_message.account_id()
+
     def _serialize_deserialize_message(
         self, tx_message: TxMessage
     ) -> TxMessage:
@@ -1,10 +1,16 @@
+import timeit
+from unittest import skip
+
 from bxcommon.test_utils.abstract_test_case import AbstractTestCase
 from bxcommon import constants
 from bxcommon.constants import VERSIONED_HELLO_MSG_MIN_PAYLOAD_LEN
 from bxcommon.messages.abstract_message_factory import AbstractMessageFactory
+from bxcommon.messages.bloxroute.bloxroute_version_manager import bloxroute_version_manager
 from bxcommon.messages.bloxroute.broadcast_message import BroadcastMessage
 from bxcommon.messages.bloxroute.hello_message import HelloMessage
+from bxcommon.messages.bloxroute.tx_message import TxMessage
 from bxcommon.messages.versioning.abstract_version_manager import AbstractVersionManager
+from bxcommon.test_utils import helpers
 from bxcommon.utils import crypto
 from bxcommon.utils.buffers.input_buffer import InputBuffer
 from bxcommon.utils.object_hash import Sha256Hash
@@ -36,6 +42,7 @@ class VersionManager(AbstractVersionManager):
         self.version_message_command = b"hello"
 
 
+# pylint: disable=protected-access
 class AbstractVersionManagerTest(AbstractTestCase):
 
     def setUp(self):
@@ -77,6 +84,53 @@ class AbstractVersionManagerTest(AbstractTestCase):
     def test_get_connection_protocol_version__over_v2(self):
         self._test_version_over_v4(5)
 
+    def test_convert_message_to_older_version_cached(self):
+        message = BroadcastMessage(
+            message_hash=Sha256Hash(crypto.double_sha256(b"hello")),
+            network_num=1,
+            source_id="",
+            blob=bytearray(10))
+
+        converted_message = bloxroute_version_manager.convert_message_to_older_version(8, message)
+        self.assertIs(converted_message, bloxroute_version_manager.convert_message_to_older_version(8, message))
+        self.assertIsNot(converted_message, bloxroute_version_manager.convert_message_to_older_version(9, message))
+
+        source_id = "31f93bcc-ad56-431f-9c14-28ffb0e8e41a"
+        message.set_source_id(source_id)
+        reconverted_message = bloxroute_version_manager.convert_message_to_older_version(8, message)
+        self.assertIsNot(converted_message, reconverted_message)
+        self.assertEqual(source_id, reconverted_message.source_id())
+
+    def test_message_converter_resolved_once(self):
+        converter = bloxroute_version_manager._get_message_converter(6, TxMessage.MESSAGE_TYPE)
+        self.assertIs(converter, bloxroute_version_manager._message_converters[(6, TxMessage.MESSAGE_TYPE)])
+        self.assertIs(converter, bloxroute_version_manager._get_message_converter(6, TxMessage.MESSAGE_TYPE))
+
+    @skip("Run this test only for local debugging")
+    def test_convert_message_to_older_version_performance(self):
+        number_of_iterations = 10000
+        message = TxMessage(
+            Sha256Hash(helpers.generate_hash()), 1, "", 1, helpers.generate_bytearray(250)
+        )
+        converter_factories = bloxroute_version_manager.protocol_to_converter_factory_mapping
+
+        for version in sorted(converter_factories):
+            def convert_with_factory():
+                converter_factories[version].get_message_converter(message.msg_type()).convert_to_older_version(
+                    message
+                )
+
+            def convert_with_version_manager():
+                message.clear_converted_messages()
+                bloxroute_version_manager.convert_message_to_older_version(version, message)
+
+            factory_time = timeit.timeit(convert_with_factory, number=number_of_iterations)
+            version_manager_time = timeit.timeit(convert_with_version_manager, number=number_of_iterations)
+            print(
+                f"v{version}: factory lookup {factory_time * 1000000 / number_of_iterations:.2f}us, "
+                f"version manager {version_manager_time * 1000000 / number_of_iterations:.2f}us"
+            )
+
     def _test_version_over_v4(self, version):
         hello_msg = HelloMessage(protocol_version=version, network_num=1)
         input_buffer = InputBuffer()
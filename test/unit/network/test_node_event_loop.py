@@ -0,0 +1,47 @@
+import asyncio
+import time
+
+from mock import patch
+
+from bxcommon.connections.connection_type import ConnectionType
+from bxcommon.connections.internal_node_connection import InternalNodeConnection
+from bxcommon.messages.bloxroute.ping_message import PingMessage
+from bxcommon.network.node_event_loop import NodeEventLoop
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.test_utils.helpers import async_test
+from bxcommon.test_utils.mocks.mock_node import MockNode
+from bxcommon.utils.buffers.output_buffer import OutputBuffer
+
+
+class NodeEventLoopTest(AbstractTestCase):
+    class TestInternalNodeConnection(InternalNodeConnection):
+        CONNECTION_TYPE = ConnectionType.RELAY_TRANSACTION
+        OUTPUT_BUFFER_MAX_HOLD_TIME = 0.01
+
+    def setUp(self):
+        opts = helpers.get_common_opts(8002)
+        opts.enable_buffered_send = True
+        self.node = MockNode(opts)
+        self.event_loop = NodeEventLoop(self.node)
+        self.node.alarm_queue.next_alarm_listener = self.event_loop._on_next_alarm_changed
+
+    def tearDown(self) -> None:
+        self.node.alarm_queue.next_alarm_listener = None
+        self.event_loop._cancel_alarm_timer()
+
+    @async_test
+    async def test_held_output_flushed_on_own_timer(self):
+        with patch("time.time", time.monotonic):
+            connection = helpers.create_connection(self.TestInternalNodeConnection, self.node)
+            connection.on_connection_established()
+
+            connection.enqueue_msg(PingMessage(1))
+            self.assertEqual(OutputBuffer.EMPTY, connection.outputbuf.get_buffer())
+            # registering the output flush alarm schedules the event loop timer
+            self.assertIsNotNone(self.event_loop._alarm_timer)
+
+            await asyncio.sleep(connection.OUTPUT_BUFFER_MAX_HOLD_TIME * 5)
+
+        self.assertIsNone(connection.output_flush_alarm_id)
+        self.assertEqual(PingMessage(1).rawbytes(), connection.outputbuf.get_buffer())
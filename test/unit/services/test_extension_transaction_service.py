@@ -1,12 +1,17 @@
 from bxcommon.services.extension_transaction_service import ExtensionTransactionService
 from bxcommon.services.transaction_service import TransactionService
 from bxcommon.test_utils import helpers
-from bxcommon.test_utils.abstract_transaction_service_test_case import AbstractTransactionServiceTestCase
+from bxcommon.test_utils.abstract_transaction_service_memory_limit_test_case import \
+    AbstractTransactionServiceMemoryLimitTestCase
+from bxcommon.test_utils.abstract_transaction_service_snapshot_test_case import \
+    AbstractTransactionServiceSnapshotTestCase
 from bxcommon.utils import crypto, convert
 from bxcommon.utils.object_hash import Sha256Hash
 
 
-class ExtensionTransactionServiceTest(AbstractTransactionServiceTestCase):
+class ExtensionTransactionServiceTest(
+    AbstractTransactionServiceMemoryLimitTestCase, AbstractTransactionServiceSnapshotTestCase
+):
 
     def setUp(self):
         helpers.set_extensions_parallelism()
@@ -36,6 +41,18 @@ class ExtensionTransactionServiceTest(AbstractTransactionServiceTestCase):
     def test_transactions_contents_memory_limit(self):
         self._test_transactions_contents_memory_limit()
 
+    def test_contents_memory_limit_largest_first(self):
+        self._test_contents_memory_limit_largest_first()
+
+    def test_contents_memory_limit_flag_aware(self):
+        self._test_contents_memory_limit_flag_aware()
+
+    def test_contents_memory_limit_fee_aware(self):
+        self._test_contents_memory_limit_fee_aware()
+
+    def test_contents_memory_limit_without_short_ids(self):
+        self._test_contents_memory_limit_without_short_ids()
+
     def test_expire_old_assignments(self):
         self._test_expire_old_assignments()
 
@@ -115,8 +132,32 @@ class ExtensionTransactionServiceTest(AbstractTransactionServiceTestCase):
     def test_get_transactions(self):
         self._test_get_transactions()
 
+    def test_get_serialized_transactions(self):
+        self._test_get_serialized_transactions()
+
     def test_process_tx_sync_message(self):
         self._test_process_tx_sync_message()
 
+    def test_add_transactions_by_key(self):
+        self._test_add_transactions_by_key()
+
+    def test_add_transactions_by_key_memory_limit(self):
+        self._test_add_transactions_by_key_memory_limit()
+
+    def test_save_and_load_snapshot(self):
+        self._test_save_and_load_snapshot()
+
+    def test_save_snapshot_periodically(self):
+        self._test_save_snapshot_periodically()
+
+    def test_load_snapshot_after_new_short_ids(self):
+        self._test_load_snapshot_after_new_short_ids()
+
+    def test_load_snapshot_invalid_file(self):
+        self._test_load_snapshot_invalid_file()
+
+    def test_save_snapshot_syncs_to_disk(self):
+        self._test_save_snapshot_syncs_to_disk()
+
     def _get_transaction_service(self) -> TransactionService:
         return ExtensionTransactionService(self.mock_node, 0)
@@ -1,8 +1,19 @@
+from unittest.mock import patch
+
+from bxcommon import constants
 from bxcommon.services.transaction_service import TransactionService
-from bxcommon.test_utils.abstract_transaction_service_test_case import AbstractTransactionServiceTestCase
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_transaction_service_memory_limit_test_case import \
+    AbstractTransactionServiceMemoryLimitTestCase
+from bxcommon.test_utils.abstract_transaction_service_snapshot_test_case import \
+    AbstractTransactionServiceSnapshotTestCase
+from bxcommon.utils import crypto
+from bxcommon.utils.object_hash import Sha256Hash
 
 
-class TransactionServiceTest(AbstractTransactionServiceTestCase):
+class TransactionServiceTest(
+    AbstractTransactionServiceMemoryLimitTestCase, AbstractTransactionServiceSnapshotTestCase
+):
 
     def test_get_missing_transactions(self):
         self._test_get_missing_transactions()
@@ -25,9 +36,24 @@ class TransactionServiceTest(AbstractTransactionServiceTestCase):
     def test_track_short_ids_seen_in_block(self):
         self._test_track_short_ids_seen_in_block()
 
+    def test_track_short_ids_seen_in_block_time_budget(self):
+        self._test_track_short_ids_seen_in_block_time_budget()
+
     def test_transactions_contents_memory_limit(self):
         self._test_transactions_contents_memory_limit()
 
+    def test_contents_memory_limit_largest_first(self):
+        self._test_contents_memory_limit_largest_first()
+
+    def test_contents_memory_limit_flag_aware(self):
+        self._test_contents_memory_limit_flag_aware()
+
+    def test_contents_memory_limit_fee_aware(self):
+        self._test_contents_memory_limit_fee_aware()
+
+    def test_contents_memory_limit_without_short_ids(self):
+        self._test_contents_memory_limit_without_short_ids()
+
     def test_track_short_ids_seen_in_block_multiple_per_tx(self):
         self._test_track_short_ids_seen_in_block_multiple_per_tx()
 
@@ -40,6 +66,9 @@ class TransactionServiceTest(AbstractTransactionServiceTestCase):
     def test_memory_stats(self):
         self._test_memory_stats()
 
+    def test_memory_stats_incremental(self):
+        self._test_memory_stats_incremental()
+
     def test_iter_timestamped_transaction_hashes_from_oldest(self):
         self._test_iter_transaction_hashes_from_oldest()
 
@@ -52,6 +81,9 @@ class TransactionServiceTest(AbstractTransactionServiceTestCase):
     def test_removed_transactions_history_by_sid(self):
         self._test_removed_transactions_history_by_sid()
 
+    def test_removed_transactions_history_filter(self):
+        self._test_removed_transactions_history_filter()
+
     def test_add_tx_without_sid(self):
         self._test_add_tx_without_sid()
 
@@ -67,11 +99,105 @@ class TransactionServiceTest(AbstractTransactionServiceTestCase):
     def test_get_transactions(self):
         self._test_get_transactions()
 
+    def test_get_serialized_transactions(self):
+        self._test_get_serialized_transactions()
+
     def test_clear(self):
         self._test_clear()
 
     def test_process_tx_sync_message(self):
         self._test_process_tx_sync_message()
 
+    def test_process_tx_sync_message_in_batches(self):
+        with patch.object(constants, "TX_SYNC_PROCESSING_BATCH_SIZE", 4):
+            self._test_process_tx_sync_message()
+
+    def test_add_transactions_by_key(self):
+        self._test_add_transactions_by_key()
+
+    def test_add_transactions_by_key_memory_limit(self):
+        self._test_add_transactions_by_key_memory_limit()
+
+    def test_save_and_load_snapshot(self):
+        self._test_save_and_load_snapshot()
+
+    def test_save_snapshot_periodically(self):
+        self._test_save_snapshot_periodically()
+
+    def test_load_snapshot_after_new_short_ids(self):
+        self._test_load_snapshot_after_new_short_ids()
+
+    def test_load_snapshot_invalid_file(self):
+        self._test_load_snapshot_invalid_file()
+
+    def test_save_snapshot_syncs_to_disk(self):
+        self._test_save_snapshot_syncs_to_disk()
+
+    def test_get_short_ids_by_key(self):
+        transaction_key = self.transaction_service.get_transaction_key(
+            Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN))
+        )
+        self.transaction_service.assign_short_id_by_key(transaction_key, 5)
+        self.transaction_service.assign_short_id_by_key(transaction_key, 6)
+
+        short_ids = self.transaction_service.get_short_ids_by_key(transaction_key)
+        self.assertIsInstance(short_ids, set)
+        self.assertEqual({5, 6}, short_ids)
+        self.assertEqual({5, 6, 7}, short_ids | {7})
+
     def _get_transaction_service(self) -> TransactionService:
         return TransactionService(self.mock_node, 0)
+
+
+class CompactShortIdIndexTransactionServiceTest(TransactionServiceTest):
+
+    def _get_transaction_service(self) -> TransactionService:
+        self.mock_node.opts.compact_short_id_index = True
+        return TransactionService(self.mock_node, 0)
+
+
+# pylint: disable=protected-access
+class BinaryCacheKeyTransactionServiceTest(TransactionServiceTest):
+
+    def test_cache_key_is_binary(self):
+        tx_hash = Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN))
+        transaction_key = self.transaction_service.get_transaction_key(tx_hash)
+        self.transaction_service.set_transaction_contents_by_key(transaction_key, helpers.generate_bytearray(100))
+        self.transaction_service.assign_short_id_by_key(transaction_key, 1)
+
+        self.assertEqual(bytes(tx_hash.binary), transaction_key.transaction_cache_key)
+        self.assertIn(bytes(tx_hash.binary), self.transaction_service._tx_cache_key_to_contents)
+        self.assertEqual(tx_hash, self.transaction_service.get_transaction(1).hash)
+        self.assertEqual([tx_hash], list(self.transaction_service.iter_transaction_hashes()))
+
+        self.transaction_service.remove_transaction_by_key(transaction_key)
+        self.assertTrue(self.transaction_service.removed_transaction_by_key(transaction_key))
+        _, removed_count = self.transaction_service.get_removed_tx_hash_time_and_count([tx_hash])
+        self.assertEqual(1, removed_count)
+
+    def _get_transaction_service(self) -> TransactionService:
+        self.mock_node.opts.binary_tx_cache_keys = True
+        return TransactionService(self.mock_node, 0)
+
+
+class SlabContentsTransactionServiceTest(TransactionServiceTest):
+
+    def _get_transaction_service(self) -> TransactionService:
+        self.mock_node.opts.transaction_contents_slab_size = 4
+        return TransactionService(self.mock_node, 0)
+
+    def test_held_contents_unchanged_after_removal(self):
+        transaction_key_1 = self.transaction_service.get_transaction_key(
+            Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN))
+        )
+        transaction_key_2 = self.transaction_service.get_transaction_key(
+            Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN))
+        )
+        self.transaction_service.set_transaction_contents_by_key(transaction_key_1, bytearray(b"AAAAA"))
+        held_contents = self.transaction_service.get_transaction_by_key(transaction_key_1)
+
+        self.transaction_service.remove_transaction_by_key(transaction_key_1)
+        self.transaction_service.set_transaction_contents_by_key(transaction_key_2, bytearray(b"BBBBB"))
+
+        self.assertEqual(b"AAAAA", held_contents)
+        self.assertEqual(b"BBBBB", self.transaction_service.get_transaction_by_key(transaction_key_2))
@@ -0,0 +1,104 @@
+from bxcommon.messages.bloxroute.tx_message import TxMessage
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils.buffers import buffer_pool
+from bxcommon.utils.buffers.buffer_pool import BufferPool, PooledBytearray
+from bxcommon.utils.buffers.output_buffer import OutputBuffer
+from bxcommon.utils.object_hash import Sha256Hash
+
+
+class BufferPoolTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        self.pool = BufferPool(min_size=64, max_size=1024, size_class_max_bytes=256, enabled=True)
+
+    def test_allocate_disabled(self):
+        self.pool.enabled = False
+        buffer = self.pool.allocate(100)
+        self.assertNotIsInstance(buffer, PooledBytearray)
+        self.assertEqual(100, len(buffer))
+
+    def test_allocate_size_classes(self):
+        self.assertEqual(64, self.pool.allocate(10).size_class)
+        self.assertEqual(128, self.pool.allocate(65).size_class)
+        self.assertEqual(128, self.pool.allocate(128).size_class)
+        self.assertNotIsInstance(self.pool.allocate(1025), PooledBytearray)
+
+    def test_reuse_after_release(self):
+        buffer = self.pool.allocate(100)
+        buffer[:] = helpers.generate_bytearray(100)
+        buffer_id = id(buffer)
+
+        buffer_pool.retain_buffer(memoryview(buffer)[10:])
+        buffer_pool.retain_buffer(buffer)
+        buffer_pool.release_buffer(buffer)
+        self.assertEqual(0, len(self.pool))
+        buffer_pool.release_buffer(memoryview(buffer)[10:])
+        self.assertEqual(1, len(self.pool))
+
+        del buffer
+        reused_buffer = self.pool.allocate(90)
+        self.assertEqual(buffer_id, id(reused_buffer))
+        self.assertEqual(bytearray(90), reused_buffer)
+        self.assertEqual(1, self.pool.reused_count)
+
+    def test_no_reuse_while_viewed(self):
+        buffer = self.pool.allocate(100)
+        buffer[:] = helpers.generate_bytearray(100)
+        contents = bytes(buffer)
+        view = memoryview(buffer)
+
+        buffer_pool.retain_buffer(view)
+        buffer_pool.release_buffer(view)
+        self.assertEqual(1, len(self.pool))
+
+        self.assertIsNot(buffer, self.pool.allocate(100))
+        self.assertEqual(contents, view.tobytes())
+        self.assertEqual(0, self.pool.reused_count)
+        self.assertEqual(0, len(self.pool))
+
+    def test_pinned_buffers_do_not_fill_size_class(self):
+        pinned_views = []
+        for _ in range(4):
+            buffer = self.pool.allocate(100)
+            pinned_views.append(memoryview(buffer)[10:20])
+            buffer_pool.retain_buffer(buffer)
+            buffer_pool.release_buffer(buffer)
+        del buffer
+        self.assertEqual(1, len(self.pool))
+
+        for _ in range(100):
+            buffer = self.pool.allocate(100)
+            buffer_pool.retain_buffer(buffer)
+            buffer_pool.release_buffer(buffer)
+            del buffer
+        self.assertEqual(99, self.pool.reused_count)
+        self.assertEqual(5, self.pool.allocated_count)
+        self.assertEqual(4, len(pinned_views))
+
+    def test_size_class_max_bytes(self):
+        buffers = [self.pool.allocate(100) for _ in range(3)]
+        for buffer in buffers:
+            buffer_pool.retain_buffer(buffer)
+            buffer_pool.release_buffer(buffer)
+        self.assertEqual(2, len(self.pool))
+
+    def test_output_buffer_releases_sent_messages(self):
+        buffer_pool.message_buffer_pool.enabled = True
+        try:
+            message = TxMessage(Sha256Hash(helpers.generate_hash()), 1, "", 1, helpers.generate_bytearray(250))
+        finally:
+            buffer_pool.message_buffer_pool.enabled = False
+        buffer = message.rawbytes().obj
+        self.assertIsInstance(buffer, PooledBytearray)
+
+        output_buffers = [OutputBuffer(), OutputBuffer()]
+        for output_buffer in output_buffers:
+            output_buffer.enqueue_msgbytes(message.rawbytes())
+        self.assertEqual(2, buffer.ref_count)
+
+        output_buffers[0].advance_buffer(len(message.rawbytes()))
+        output_buffers[1].safe_empty()
+        self.assertEqual(0, buffer.ref_count)
+        self.assertTrue(buffer.is_free)
+        buffer_pool.message_buffer_pool.clear()
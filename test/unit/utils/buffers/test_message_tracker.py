@@ -1,3 +1,5 @@
+from bxcommon.messages.bloxroute.broadcast_message import BroadcastMessage
+from bxcommon.messages.bloxroute.ping_message import PingMessage
 from bxcommon.messages.bloxroute.tx_message import TxMessage
 from bxcommon.test_utils import helpers
 from bxcommon.test_utils.abstract_test_case import AbstractTestCase
@@ -99,3 +101,84 @@ class MessageTrackerTest(AbstractTestCase):
         self.assertEqual(
             self.output_buffer.length, self.tracker.bytes_remaining
         )
+
+    def test_append_message_priority(self):
+        self.output_buffer = OutputBuffer(enable_buffering=False)
+        tx_message = TxMessage(
+            helpers.generate_object_hash(),
+            5,
+            tx_val=helpers.generate_bytearray(250),
+        )
+        block_message = BroadcastMessage(
+            helpers.generate_object_hash(),
+            5,
+            is_encrypted=False,
+            blob=helpers.generate_bytearray(500),
+        )
+        for message in [tx_message, tx_message, block_message]:
+            self.output_buffer.enqueue_msgbytes(message.rawbytes(), message.output_priority())
+            self.tracker.append_message(len(message.rawbytes()), message)
+
+        self.output_buffer.advance_buffer(100)
+        self.tracker.advance_bytes(100)
+        self.output_buffer.enqueue_msgbytes(block_message.rawbytes(), block_message.output_priority())
+        self.tracker.append_message(len(block_message.rawbytes()), block_message)
+
+        self.assertEqual(
+            [block_message, block_message, tx_message, tx_message],
+            [entry.message for entry in self.tracker.messages]
+        )
+        self.assertEqual(
+            [len(entry.rawbytes()) for entry in [block_message, block_message, tx_message, tx_message]],
+            [len(msg_bytes) for msg_bytes in self.output_buffer.output_msgs]
+        )
+        self.assertEqual(100, self.tracker.messages[0].sent_bytes)
+        self.assertEqual(self.output_buffer.length, self.tracker.bytes_remaining)
+
+    def test_append_message_priority_buffering(self):
+        tx_message = TxMessage(
+            helpers.generate_object_hash(),
+            5,
+            tx_val=helpers.generate_bytearray(250),
+        )
+        block_message = BroadcastMessage(
+            helpers.generate_object_hash(),
+            5,
+            is_encrypted=False,
+            blob=helpers.generate_bytearray(500),
+        )
+        ping_message = PingMessage(1)
+
+        # small messages of higher priority are not held behind messages of lower priorities
+        for message in [tx_message, tx_message, block_message, tx_message]:
+            self.output_buffer.enqueue_msgbytes(message.rawbytes(), message.output_priority())
+            self.tracker.append_message(len(message.rawbytes()), message)
+            self._assert_tracked_in_order()
+
+        self.output_buffer.advance_buffers(100)
+        self.tracker.advance_bytes(100)
+        for message in [ping_message, block_message]:
+            self.output_buffer.enqueue_msgbytes(message.rawbytes(), message.output_priority())
+            self.tracker.append_message(len(message.rawbytes()), message)
+            self._assert_tracked_in_order()
+        self.output_buffer.flush()
+        self._assert_tracked_in_order()
+
+        self.assertEqual(
+            [block_message, ping_message, block_message, tx_message, tx_message, tx_message],
+            [entry.message for entry in self.tracker.messages]
+        )
+        self.assertEqual(100, self.tracker.messages[0].sent_bytes)
+
+    def _assert_tracked_in_order(self):
+        """
+        Asserts that bytes queued in output buffer are sent in order of tracked messages,
+        messages held for batching are tracked last.
+        """
+        tracked_bytes = b"".join(bytes(entry.message.rawbytes()) for entry in self.tracker.messages)
+        tracked_bytes = tracked_bytes[self.tracker.messages[0].sent_bytes:]
+        queued_bytes = b"".join(
+            bytes(msg_bytes) for msg_bytes in self.output_buffer.get_buffers(self.output_buffer.length)
+        )
+        self.assertEqual(self.output_buffer.length, len(tracked_bytes))
+        self.assertEqual(tracked_bytes[:len(queued_bytes)], queued_bytes)
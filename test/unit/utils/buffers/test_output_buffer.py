@@ -1,12 +1,10 @@
-import time
 import unittest
 from collections import deque
 
-from mock import MagicMock
-
-from bxcommon.constants import OUTPUT_BUFFER_BATCH_MAX_HOLD_TIME, OUTPUT_BUFFER_MIN_SIZE
+from bxcommon.constants import OUTPUT_BUFFER_MIN_SIZE
 from bxcommon.test_utils import helpers
 from bxcommon.utils.buffers.output_buffer import OutputBuffer
+from bxcommon.utils.buffers.output_priority import OutputPriority
 
 
 class TestOutputBuffer(unittest.TestCase):
@@ -49,6 +47,52 @@ class TestOutputBuffer(unittest.TestCase):
         self.assertEqual(0, self.output_buffer.index)
         self.assertEqual(1, len(self.output_buffer.output_msgs))
 
+    def test_get_buffers(self):
+        self.assertEqual([], self.output_buffer.get_buffers(100))
+
+        data1 = bytearray([i for i in range(20)])
+        data2 = bytearray([i for i in range(20, 40)])
+        data3 = bytearray([i for i in range(40, 60)])
+        for data in [data1, data2, data3]:
+            self.output_buffer.enqueue_msgbytes(data)
+            self.output_buffer.flush()
+
+        self.assertEqual([data1, data2, data3], self.output_buffer.get_buffers(100))
+        self.assertEqual([data1, data2], self.output_buffer.get_buffers(21))
+        self.assertEqual([data1], self.output_buffer.get_buffers(20))
+        self.assertEqual([data1], self.output_buffer.get_buffers(0))
+
+        self.output_buffer.index = 10
+        self.assertEqual([data1[10:], data2], self.output_buffer.get_buffers(30))
+
+    def test_advance_buffers(self):
+        with self.assertRaises(ValueError):
+            self.output_buffer.advance_buffers(5)
+
+        data1 = bytearray([i for i in range(20)])
+        data2 = bytearray([i for i in range(20, 40)])
+        data3 = bytearray([i for i in range(40, 60)])
+        for data in [data1, data2, data3]:
+            self.output_buffer.enqueue_msgbytes(data)
+            self.output_buffer.flush()
+
+        self.output_buffer.advance_buffers(10)
+        self.assertEqual(10, self.output_buffer.index)
+        self.assertEqual(50, self.output_buffer.length)
+        self.assertEqual(3, len(self.output_buffer.output_msgs))
+
+        self.output_buffer.advance_buffers(30)
+        self.assertEqual(0, self.output_buffer.index)
+        self.assertEqual(20, self.output_buffer.length)
+        self.assertEqual([data3], list(self.output_buffer.output_msgs))
+
+        with self.assertRaises(ValueError):
+            self.output_buffer.advance_buffers(21)
+
+        self.output_buffer.advance_buffers(20)
+        self.assertEqual(0, self.output_buffer.length)
+        self.assertFalse(self.output_buffer.has_more_bytes())
+
     def test_at_msg_boundary(self):
         self.assertTrue(self.output_buffer.at_msg_boundary())
         self.output_buffer.index = 1
@@ -102,18 +146,81 @@ class TestOutputBuffer(unittest.TestCase):
         self.assertEqual(confirm2, self.output_buffer.output_msgs)
         self.assertEqual(50, self.output_buffer.length)
 
+    def test_enqueue_msgbytes_priority(self):
+        self.output_buffer = OutputBuffer(enable_buffering=False)
+        bulk_msg = bytearray([0] * 20)
+        msg = bytearray([1] * 20)
+        block_msg = bytearray([2] * 20)
+        control_msg = bytearray([3] * 20)
+
+        self.output_buffer.enqueue_msgbytes(bulk_msg, OutputPriority.BULK)
+        self.output_buffer.enqueue_msgbytes(msg)
+        self.output_buffer.enqueue_msgbytes(block_msg, OutputPriority.BLOCK)
+        self.output_buffer.enqueue_msgbytes(bulk_msg, OutputPriority.BULK)
+        self.output_buffer.enqueue_msgbytes(control_msg, OutputPriority.CONTROL)
+        self.output_buffer.enqueue_msgbytes(msg)
+
+        self.assertEqual(
+            deque([control_msg, block_msg, msg, msg, bulk_msg, bulk_msg]), self.output_buffer.output_msgs
+        )
+        self.assertEqual(120, self.output_buffer.length)
+
+        self.output_buffer.advance_buffers(30)
+        self.output_buffer.enqueue_msgbytes(control_msg, OutputPriority.CONTROL)
+        self.output_buffer.prepend_msgbytes(bulk_msg)
+        # partially sent message is not broken apart
+        self.assertEqual(
+            deque([block_msg, bulk_msg, control_msg, msg, msg, bulk_msg, bulk_msg]), self.output_buffer.output_msgs
+        )
+
+        self.output_buffer.advance_buffers(10)
+        self.output_buffer.enqueue_msgbytes(block_msg, OutputPriority.BLOCK)
+        self.assertEqual(
+            deque([bulk_msg, control_msg, block_msg, msg, msg, bulk_msg, bulk_msg]), self.output_buffer.output_msgs
+        )
+
+        self.output_buffer.safe_empty()
+        self.assertEqual(0, len(self.output_buffer))
+        self.output_buffer.enqueue_msgbytes(msg)
+        self.output_buffer.enqueue_msgbytes(block_msg, OutputPriority.BLOCK)
+        self.assertEqual(deque([block_msg, msg]), self.output_buffer.output_msgs)
+
+    def test_enqueue_msgbytes_priority_buffering(self):
+        msg = bytearray([1] * 20)
+        block_msg = bytearray([2] * 20)
+
+        self.output_buffer.enqueue_msgbytes(msg)
+        self.output_buffer.enqueue_msgbytes(msg)
+        self.output_buffer.enqueue_msgbytes(block_msg, OutputPriority.BLOCK)
+        # not held for batching, it goes before the queued messages
+        self.assertIsNone(self.output_buffer.last_bytearray)
+        self.assertEqual(deque([block_msg, msg + msg]), self.output_buffer.output_msgs)
+
+        self.output_buffer.enqueue_msgbytes(msg)
+        self.assertIsNotNone(self.output_buffer.last_bytearray)
+        self.output_buffer.flush()
+
+        self.assertEqual(deque([block_msg, msg + msg, msg]), self.output_buffer.output_msgs)
+        self.assertEqual(80, self.output_buffer.length)
+
     def test_has_more_bytes(self):
         self.assertFalse(self.output_buffer.has_more_bytes())
         self.output_buffer.length = 1
         self.assertTrue(self.output_buffer.has_more_bytes())
 
-    def test_flush_get_buffer_on_time(self):
+    def test_flush(self):
         data1 = bytearray(i for i in range(20))
         self.output_buffer.enqueue_msgbytes(data1)
+        self.assertIsNotNone(self.output_buffer.last_bytearray)
         self.assertEqual(OutputBuffer.EMPTY, self.output_buffer.get_buffer())
 
-        time.time = MagicMock(return_value=time.time() + OUTPUT_BUFFER_BATCH_MAX_HOLD_TIME + 0.001)
-        self.assertEqual(data1, self.output_buffer.get_buffer())
+        data2 = bytearray(i for i in range(20, 40))
+        self.output_buffer.enqueue_msgbytes(data2)
+        self.assertEqual(OutputBuffer.EMPTY, self.output_buffer.get_buffer())
+
+        self.output_buffer.flush()
+        self.assertIsNone(self.output_buffer.last_bytearray)
+        self.assertEqual(data1 + data2, self.output_buffer.get_buffer())
 
     def test_flush_get_buffer_on_size(self):
         data1 = bytearray(i for i in range(20))
@@ -0,0 +1,128 @@
+import random
+
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils.buffers.slab_contents_store import SlabContentsStore, get_size_class
+
+
+class SlabContentsStoreTest(AbstractTestCase):
+
+    def setUp(self):
+        super(SlabContentsStoreTest, self).setUp()
+        self.store: SlabContentsStore[str] = SlabContentsStore(1024)
+
+    def test_get_size_class(self):
+        self.assertEqual(32, get_size_class(0))
+        self.assertEqual(32, get_size_class(1))
+        self.assertEqual(64, get_size_class(33))
+        self.assertEqual(256, get_size_class(256))
+        self.assertEqual(288, get_size_class(257))
+        self.assertEqual(1024, get_size_class(1024))
+        for length in range(1, 5000):
+            size_class = get_size_class(length)
+            self.assertGreaterEqual(size_class, length)
+            self.assertLessEqual(size_class - length, max(32, size_class // 8))
+
+    def test_set_get_delete(self):
+        contents_1 = helpers.generate_bytearray(100)
+        contents_2 = helpers.generate_bytes(10)
+        self.store["a"] = contents_1
+        self.store["b"] = contents_2
+
+        self.assertEqual(2, len(self.store))
+        self.assertEqual(contents_1, self.store["a"])
+        self.assertEqual(contents_2, self.store["b"])
+        self.assertIsInstance(self.store["a"], bytes)
+        self.assertIsInstance(self.store.get_view("a"), memoryview)
+        self.assertEqual(contents_1, self.store.get_view("a"))
+        self.assertEqual(100, self.store.get_length("a"))
+        self.assertEqual(110, self.store.contents_size)
+        self.assertEqual(1, self.store.get_slab_count())
+
+        contents_3 = helpers.generate_bytearray(50)
+        self.store["a"] = contents_3
+        self.assertEqual(contents_3, self.store["a"])
+        self.assertEqual(60, self.store.contents_size)
+
+        del self.store["a"]
+        self.assertNotIn("a", self.store)
+        self.assertEqual(["b"], list(self.store))
+        self.assertEqual(10, self.store.contents_size)
+        with self.assertRaises(KeyError):
+            _ = self.store["a"]
+        with self.assertRaises(KeyError):
+            del self.store["a"]
+
+    def test_overwrite_with_own_contents(self):
+        contents = helpers.generate_bytearray(100)
+        self.store["a"] = contents
+        self.store["a"] = self.store["a"]
+        self.assertEqual(contents, self.store["a"])
+
+    def test_held_contents_unchanged_after_chunk_reuse(self):
+        self.store["a"] = b"AAAAA"
+        held_contents = self.store["a"]
+
+        del self.store["a"]
+        self.store["b"] = b"BBBBB"
+
+        self.assertEqual(b"AAAAA", held_contents)
+        self.assertEqual(b"BBBBB", self.store["b"])
+
+    def test_large_contents(self):
+        contents = helpers.generate_bytearray(300)
+        self.store["large"] = contents
+
+        self.assertEqual(contents, self.store["large"])
+        self.assertEqual(300, self.store.get_length("large"))
+        self.assertEqual(0, self.store.get_slab_count())
+        self.assertEqual(300, self.store.get_bytes_length())
+
+        del self.store["large"]
+        self.assertEqual(0, len(self.store))
+        self.assertEqual(0, self.store.contents_size)
+
+    def test_chunks_reused_and_slabs_released(self):
+        for i in range(64):
+            self.store[str(i)] = helpers.generate_bytearray(60)
+        self.assertEqual(4, self.store.get_slab_count())
+
+        for i in range(16):
+            del self.store[str(i)]
+        self.assertEqual(3, self.store.get_slab_count())
+
+        for i in range(16, 24):
+            del self.store[str(i)]
+        for i in range(100, 108):
+            self.store[str(i)] = helpers.generate_bytearray(64)
+        self.assertEqual(3, self.store.get_slab_count())
+
+    def test_matches_dict_under_random_operations(self):
+        expected = {}
+        random.seed(23)
+        for _ in range(5000):
+            key = str(random.randint(1, 200))
+            if random.random() < 0.6:
+                contents = helpers.generate_bytearray(random.randint(1, 400))
+                expected[key] = contents
+                self.store[key] = contents
+            elif key in expected:
+                del expected[key]
+                del self.store[key]
+
+        self.assertEqual(len(expected), len(self.store))
+        self.assertEqual(sum(map(len, expected.values())), self.store.contents_size)
+        for key, contents in expected.items():
+            self.assertEqual(contents, self.store[key])
+
+    def test_clear(self):
+        for i in range(20):
+            self.store[str(i)] = helpers.generate_bytearray(100)
+        self.store.clear()
+
+        self.assertEqual(0, len(self.store))
+        self.assertEqual(0, self.store.contents_size)
+        self.assertEqual(0, self.store.get_bytes_length())
+
+        self.store["a"] = bytearray(b"abc")
+        self.assertEqual(bytearray(b"abc"), self.store["a"])
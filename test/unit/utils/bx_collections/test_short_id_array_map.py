@@ -0,0 +1,124 @@
+import random
+
+from bxcommon.models.transaction_flag import TransactionFlag
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils.collections.short_id_array_map import ShortIdArrayMap, ShortIdFlagArrayMap, ShortIdArray
+
+
+class ShortIdArrayMapTest(AbstractTestCase):
+
+    def setUp(self):
+        super(ShortIdArrayMapTest, self).setUp()
+        self.short_id_map: ShortIdArrayMap[str] = ShortIdArrayMap()
+
+    def test_set_get_delete(self):
+        self.short_id_map[1] = "a"
+        self.short_id_map[2 ** 32 - 1] = "b"
+
+        self.assertEqual(2, len(self.short_id_map))
+        self.assertEqual("a", self.short_id_map[1])
+        self.assertEqual("b", self.short_id_map[2 ** 32 - 1])
+        self.assertIn(1, self.short_id_map)
+        self.assertNotIn(3, self.short_id_map)
+        self.assertIsNone(self.short_id_map.get(3))
+
+        self.short_id_map[1] = "c"
+        self.assertEqual("c", self.short_id_map[1])
+        self.assertEqual(2, len(self.short_id_map))
+
+        del self.short_id_map[1]
+        self.assertNotIn(1, self.short_id_map)
+        self.assertEqual(1, len(self.short_id_map))
+        with self.assertRaises(KeyError):
+            del self.short_id_map[1]
+        with self.assertRaises(KeyError):
+            _ = self.short_id_map[1]
+
+    def test_null_short_id(self):
+        self.short_id_map[0] = "null"
+        self.assertIn(0, self.short_id_map)
+        self.assertEqual("null", self.short_id_map[0])
+        self.assertEqual([0], list(self.short_id_map))
+
+        del self.short_id_map[0]
+        self.assertNotIn(0, self.short_id_map)
+        self.assertEqual(0, len(self.short_id_map))
+
+    def test_invalid_short_id(self):
+        for short_id in (-1, 2 ** 32, "1"):
+            self.assertNotIn(short_id, self.short_id_map)
+            with self.assertRaises(KeyError):
+                _ = self.short_id_map[short_id]
+            with self.assertRaises(KeyError):
+                del self.short_id_map[short_id]
+            with self.assertRaises(ValueError):
+                self.short_id_map[short_id] = "a"
+        self.assertEqual(0, len(self.short_id_map))
+
+    def test_matches_dict_under_random_operations(self):
+        expected = {}
+        random.seed(17)
+        for _ in range(20000):
+            short_id = random.randint(1, 3000)
+            if random.random() < 0.6:
+                expected[short_id] = str(short_id)
+                self.short_id_map[short_id] = str(short_id)
+            elif short_id in expected:
+                del expected[short_id]
+                del self.short_id_map[short_id]
+            self.assertEqual(short_id in expected, short_id in self.short_id_map)
+
+        self.assertEqual(len(expected), len(self.short_id_map))
+        self.assertEqual(sorted(expected), sorted(self.short_id_map))
+        for short_id, value in expected.items():
+            self.assertEqual(value, self.short_id_map[short_id])
+
+    def test_grow_and_shrink(self):
+        for short_id in range(1, 10001):
+            self.short_id_map[short_id] = short_id
+        grown_size = self.short_id_map.get_bytes_length()
+
+        for short_id in range(1, 10001):
+            self.short_id_map.pop(short_id)
+        self.assertEqual(0, len(self.short_id_map))
+        self.assertLess(self.short_id_map.get_bytes_length(), grown_size)
+
+        self.short_id_map[5] = 5
+        self.assertEqual(5, self.short_id_map[5])
+
+    def test_clear(self):
+        for short_id in range(1, 100):
+            self.short_id_map[short_id] = short_id
+        self.short_id_map.clear()
+        self.assertEqual(0, len(self.short_id_map))
+        self.assertNotIn(1, self.short_id_map)
+
+    def test_flag_map(self):
+        flag_map = ShortIdFlagArrayMap()
+        flag_map[10] = TransactionFlag.PAID_TX | TransactionFlag.LOCAL_REGION
+        flag_map[11] = TransactionFlag.PAID_TX
+
+        self.assertEqual(TransactionFlag.PAID_TX | TransactionFlag.LOCAL_REGION, flag_map[10])
+        self.assertIn(TransactionFlag.PAID_TX, flag_map[11])
+        self.assertEqual(TransactionFlag.NO_FLAGS, flag_map.get(12, TransactionFlag.NO_FLAGS))
+
+        del flag_map[10]
+        self.assertNotIn(10, flag_map)
+
+    def test_short_id_array(self):
+        short_ids = ShortIdArray()
+        short_ids.add(3)
+        short_ids.add(4)
+        short_ids.add(3)
+        self.assertEqual([3, 4], list(short_ids))
+        self.assertEqual(2, len(short_ids))
+
+        short_ids.remove(3)
+        short_ids.discard(3)
+        self.assertEqual([4], list(short_ids))
+        self.assertEqual(4, next(iter(short_ids)))
+
+        with self.assertRaises(ValueError):
+            short_ids.add(2 ** 32)
+        with self.assertRaises(ValueError):
+            short_ids.remove(3)
@@ -0,0 +1,91 @@
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils import convert
+from bxcommon.utils.collections.time_rotated_bloom_filter import TimeRotatedBloomFilter
+
+
+class TimeRotatedBloomFilterTest(AbstractTestCase):
+
+    def setUp(self):
+        super(TimeRotatedBloomFilterTest, self).setUp()
+        self.bloom_filter = TimeRotatedBloomFilter(
+            expiration_time_s=70, capacity=7000, generation_count=8, false_positive_rate=0.01
+        )
+
+    def test_no_false_negatives(self):
+        keys = [convert.bytes_to_hex(helpers.generate_bytes(32)) for _ in range(5000)]
+        for key in keys:
+            self.bloom_filter[key] = 100
+        for short_id in range(1, 2001):
+            self.bloom_filter.add(short_id, 100)
+
+        for key in keys:
+            self.assertIn(key, self.bloom_filter)
+        for short_id in range(1, 2001):
+            self.assertIn(short_id, self.bloom_filter)
+        self.assertEqual(7000, len(self.bloom_filter))
+
+    def test_false_positive_rate(self):
+        for short_id in range(1, 7001):
+            self.bloom_filter.add(short_id, 100)
+
+        false_positives = sum(1 for short_id in range(100000, 120000) if short_id in self.bloom_filter)
+        self.assertLess(false_positives / 20000, 0.01)
+
+    def test_time_added_upper_bound(self):
+        self.bloom_filter.add("a", 100)
+        self.bloom_filter.add("b", 105)
+        self.bloom_filter.add("c", 111)
+
+        self.assertEqual(105, self.bloom_filter.get_time_added_upper_bound("a"))
+        self.assertEqual(105, self.bloom_filter.get_time_added_upper_bound("b"))
+        self.assertEqual(111, self.bloom_filter.get_time_added_upper_bound("c"))
+        with self.assertRaises(KeyError):
+            self.bloom_filter.get_time_added_upper_bound("d")
+
+    def test_rotation_by_capacity(self):
+        generation_capacity = self.bloom_filter.generation_capacity
+        for short_id in range(1, generation_capacity * 9 + 1):
+            self.bloom_filter.add(short_id, 100)
+
+        self.assertEqual(8 * generation_capacity, len(self.bloom_filter))
+        self.assertIn(generation_capacity * 9, self.bloom_filter)
+        false_positives = sum(1 for short_id in range(1, generation_capacity + 1) if short_id in self.bloom_filter)
+        self.assertLess(false_positives, generation_capacity * 0.02)
+
+    def test_newest_generation_time(self):
+        self.bloom_filter.add("a", 100)
+        self.bloom_filter.add("a", 130)
+        self.bloom_filter.add("b", 131)
+
+        self.assertEqual(131, self.bloom_filter.get_time_added_upper_bound("a"))
+        self.assertEqual(1, self.bloom_filter.cleanup(110 + self.bloom_filter.expiration_time_s))
+        self.assertEqual(131, self.bloom_filter.get_time_added_upper_bound("a"))
+
+    def test_generation_count_limits(self):
+        with self.assertRaises(ValueError):
+            TimeRotatedBloomFilter(expiration_time_s=70, capacity=7000, generation_count=1, false_positive_rate=0.01)
+        with self.assertRaises(ValueError):
+            TimeRotatedBloomFilter(expiration_time_s=70, capacity=7000, generation_count=9, false_positive_rate=0.01)
+
+    def test_cleanup(self):
+        self.bloom_filter.add("a", 100)
+        self.bloom_filter.add("b", 120)
+        self.bloom_filter.add("c", 150)
+
+        self.assertEqual(0, self.bloom_filter.cleanup(170))
+        self.assertEqual(1, self.bloom_filter.cleanup(171))
+        self.assertNotIn("a", self.bloom_filter)
+        self.assertIn("b", self.bloom_filter)
+        self.assertIn("c", self.bloom_filter)
+
+        self.assertEqual(2, self.bloom_filter.cleanup(300))
+        self.assertFalse(self.bloom_filter)
+        self.assertEqual(0, self.bloom_filter.get_bytes_length())
+
+    def test_clear(self):
+        self.bloom_filter.add("a", 100)
+        self.assertGreater(self.bloom_filter.get_bytes_length(), 0)
+        self.bloom_filter.clear()
+        self.assertNotIn("a", self.bloom_filter)
+        self.assertEqual(0, len(self.bloom_filter))
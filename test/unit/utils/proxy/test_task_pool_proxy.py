@@ -0,0 +1,82 @@
+import asyncio
+
+from mock import MagicMock, patch
+
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.test_utils.helpers import async_test
+from bxcommon.utils.proxy import task_pool_proxy
+
+
+class TaskPoolProxyTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        self.executor = MagicMock()
+        executor_patch = patch.object(task_pool_proxy, "_executor", self.executor)
+        executor_patch.start()
+        self.addCleanup(executor_patch.stop)
+
+    def test_run_tasks(self):
+        tasks = [self._create_task(completed_after_checks=2), self._create_task(completed_after_checks=0)]
+
+        task_pool_proxy.run_tasks(iter(tasks))
+
+        # all tasks are enqueued before waiting for any of them
+        self.assertEqual([((tsk,),) for tsk in tasks], self.executor.enqueue_task.call_args_list)
+        for tsk in tasks:
+            tsk.assert_execution.assert_called_once()
+            tsk.cleanup.assert_called_once()
+
+    def test_run_tasks_cleans_up_failed_tasks(self):
+        tasks = [self._create_task(), self._create_task()]
+        tasks[0].assert_execution.side_effect = ValueError("task failed")
+
+        with self.assertRaises(ValueError):
+            task_pool_proxy.run_tasks(tasks)
+
+        for tsk in tasks:
+            tsk.cleanup.assert_called_once()
+
+    @async_test
+    async def test_run_task_async(self):
+        tsk = self._create_task()
+        event_loop_ran = asyncio.Event()
+        # task completes only after the event loop had a chance to run other coroutines
+        tsk.is_completed.side_effect = event_loop_ran.is_set
+
+        async def set_event_loop_ran():
+            event_loop_ran.set()
+
+        asyncio.ensure_future(set_event_loop_ran())
+        await task_pool_proxy.run_task_async(tsk)
+
+        self.executor.enqueue_task.assert_called_once_with(tsk)
+        tsk.assert_execution.assert_called_once()
+        tsk.cleanup.assert_called_once()
+
+    @async_test
+    async def test_run_tasks_async(self):
+        tasks = [self._create_task(completed_after_checks=3), self._create_task(completed_after_checks=1)]
+
+        await task_pool_proxy.run_tasks_async(tasks)
+
+        self.assertEqual([((tsk,),) for tsk in tasks], self.executor.enqueue_task.call_args_list)
+        for tsk in tasks:
+            tsk.assert_execution.assert_called_once()
+            tsk.cleanup.assert_called_once()
+
+    @async_test
+    async def test_run_tasks_async_cleans_up_failed_tasks(self):
+        tasks = [self._create_task(), self._create_task()]
+        tasks[0].assert_execution.side_effect = ValueError("task failed")
+
+        with self.assertRaises(ValueError):
+            await task_pool_proxy.run_tasks_async(tasks)
+
+        for tsk in tasks:
+            tsk.cleanup.assert_called_once()
+
+    def _create_task(self, completed_after_checks: int = 0) -> MagicMock:
+        # `unsafe` allows mocking `assert_execution` of the task
+        tsk = MagicMock(unsafe=True)
+        tsk.is_completed.side_effect = [False] * completed_after_checks + [True]
+        return tsk
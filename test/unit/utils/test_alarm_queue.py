@@ -27,6 +27,20 @@ class AlarmQueueTest(AbstractTestCase):
         self.assertEqual(self.function_to_pass,
                          self.alarm_queue.approx_alarms_scheduled[self.function_to_pass][0].alarm.fn)
 
+    def test_register_alarm_notifies_next_alarm_listener(self):
+        listener = MagicMock()
+        self.alarm_queue.next_alarm_listener = listener
+
+        self.alarm_queue.register_alarm(5, self.function_to_pass, 1, 5)
+        listener.assert_called_once()
+
+        listener.reset_mock()
+        self.alarm_queue.register_alarm(10, self.function_to_pass, 1, 5)
+        listener.assert_not_called()
+
+        self.alarm_queue.register_alarm(1, self.function_to_pass, 1, 5)
+        listener.assert_called_once()
+
     def test_unregister_alarm(self):
         alarm_id1 = self.alarm_queue.register_alarm(1, self.function_to_pass, 1, 5)
         self.assertEqual(1, len(self.alarm_queue.alarms))
@@ -117,5 +117,19 @@ class ExpirationQueueTests(unittest.TestCase):
         self.queue.remove_expired()
         self.assertEqual(0, len(self.queue))
 
+    def test_sort(self):
+        self.queue.add(1, 100)
+        self.queue.add(2, 50)
+        self.queue.add(3, 150)
+        self.queue.add(4, 75)
+
+        self.queue.sort()
+
+        self.assertEqual([(2, 50), (4, 75), (1, 100), (3, 150)], list(self.queue.queue.items()))
+        self.assertEqual(2, self.queue.get_oldest())
+
+        self.queue.remove_expired(100 + self.time_to_live, remove_callback=self._remove_item)
+        self.assertEqual([2, 4], self.removed_items)
+
     def _remove_item(self, item):
         self.removed_items.append(item)
@@ -120,10 +120,16 @@ class MemoryUtilsTest(AbstractTestCase):
         total_special_size, ids = memory_utils.get_special_size(conn1)
 
         self.assertTrue(ids)
-        self.assertTrue(id(conn1.inputbuf.input_list) in ids)
+        # input buffer bytes are held in a single contiguous bytearray
+        self.assertTrue(id(conn1.inputbuf._view) in ids)
+        self.assertTrue(id(conn1.inputbuf._buf) in ids)
         self.assertTrue(id(conn1.outputbuf.output_msgs) in ids)
 
-        expected_special_size = memory_utils.get_special_size(conn1.inputbuf.input_list).size
+        input_buffer_size = memory_utils.get_special_size(conn1.inputbuf).size
+        self.assertGreaterEqual(input_buffer_size, len(conn1.inputbuf._buf))
+        self.assertGreaterEqual(len(conn1.inputbuf._buf), 40)
+
+        expected_special_size = input_buffer_size
         expected_special_size += memory_utils.get_special_size(conn1.outputbuf.output_msgs).size
         self.assertEqual(total_special_size, expected_special_size)
 
@@ -51,3 +51,39 @@ class PayloadBlockTests(AbstractTestCase):
             self.assertEqual(result.pop(item.name), self.kwargs.pop(item.name))
         self.assertFalse(self.kwargs)  # check that all inputs were matched to the outputs
         self.assertFalse(result)  # check that all outputs were matched to the inputs
+
+    def test_hello_block_layout(self):
+        layout = self.MESSAGE_BLOCK_HELLO.layout
+        self.kwargs["payload_len"] = self.MESSAGE_BLOCK_HELLO.size - self.MESSAGE_BLOCK_HDR.size
+        values = [self.kwargs[name] for name in layout.names]
+
+        buf = bytearray(self.MESSAGE_BLOCK_HELLO.size)
+        layout.pack_into(buf, *values)
+
+        self.assertEqual(buf, self.MESSAGE_BLOCK_HELLO.build(bytearray(len(buf)), **self.kwargs))
+        self.assertEqual(tuple(values), layout.unpack(buf))
+        self.assertEqual(self.kwargs, layout.read(buf))
+        self.assertEqual(tuple(values[:2]), layout.unpack_leading(buf, 2))
+        self.assertEqual(tuple(values), layout.unpack_leading(buf, len(values)))
+
+        network_num_field = layout["network_num"]
+        self.assertEqual(20, network_num_field.offset)
+        self.assertEqual(12345, network_num_field.get(buf))
+        network_num_field.set(buf, 54321)
+        self.assertEqual(54321, struct.unpack_from("<L", buf, 20)[0])
+
+        node_id_field = layout["node_id"]
+        node_id_field.set(buf, "a9f93bcc-ad56-431f-9c14-28ffb0e8e41a")
+        self.assertEqual("a9f93bcc-ad56-431f-9c14-28ffb0e8e41a", node_id_field.get(buf))
+
+    def test_read_short_buffer(self):
+        buf = bytearray(self.MESSAGE_BLOCK_VERSION.size)
+        self.MESSAGE_BLOCK_VERSION.build(buf, **self.kwargs)
+
+        contents = self.MESSAGE_BLOCK_VERSION.read(buf[:-4])
+        self.assertEqual(3, contents["protocol_version"])
+        self.assertIsNone(contents["network_num"])
+
+    def test_layout_rejects_native_sizes(self):
+        with self.assertRaises(ValueError):
+            PayloadBlock(0, "Native", 0, PayloadElement(name="value", structure="L"))